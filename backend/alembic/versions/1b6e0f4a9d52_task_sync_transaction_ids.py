@@ -0,0 +1,49 @@
+"""task sync transaction ids
+
+Revision ID: 1b6e0f4a9d52
+Revises: 7a3d5c8e2f14
+Create Date: 2026-10-20 10:14:08.512937
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1b6e0f4a9d52'
+down_revision: Union[str, None] = '7a3d5c8e2f14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # existing rows were written by long finished transactions
+    op.add_column('tasks', sa.Column('txid', sa.BigInteger(), server_default='0', nullable=False))
+    op.alter_column('tasks', 'txid', server_default=sa.text('(pg_current_xact_id()::text::bigint)'))
+    op.create_index(op.f('ix_tasks_txid'), 'tasks', ['txid'], unique=False)
+    op.add_column('task_tombstones', sa.Column('txid', sa.BigInteger(), server_default='0', nullable=False))
+    op.alter_column('task_tombstones', 'txid', server_default=sa.text('(pg_current_xact_id()::text::bigint)'))
+    op.create_index(op.f('ix_task_tombstones_txid'), 'task_tombstones', ['txid'], unique=False)
+    op.add_column('task_tombstones', sa.Column('deleted_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False))
+    op.create_index(op.f('ix_task_tombstones_deleted_at'), 'task_tombstones', ['deleted_at'], unique=False)
+    op.create_table('task_sync_horizon',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('pruned_txid', sa.BigInteger(), nullable=False),
+    sa.CheckConstraint('id = 1', name='ck_task_sync_horizon_single_row'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    # cursors handed out before now were task versions, not transaction ids;
+    # send those clients back to a full sync
+    op.execute("INSERT INTO task_sync_horizon (id, pruned_txid) VALUES (1, pg_current_xact_id()::text::bigint)")
+
+
+def downgrade() -> None:
+    op.drop_table('task_sync_horizon')
+    op.drop_index(op.f('ix_task_tombstones_deleted_at'), table_name='task_tombstones')
+    op.drop_column('task_tombstones', 'deleted_at')
+    op.drop_index(op.f('ix_task_tombstones_txid'), table_name='task_tombstones')
+    op.drop_column('task_tombstones', 'txid')
+    op.drop_index(op.f('ix_tasks_txid'), table_name='tasks')
+    op.drop_column('tasks', 'txid')
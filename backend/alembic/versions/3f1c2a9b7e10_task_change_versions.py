@@ -0,0 +1,39 @@
+"""task change versions
+
+Revision ID: 3f1c2a9b7e10
+Revises: 7d6424e0a6df
+Create Date: 2026-10-19 09:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1c2a9b7e10'
+down_revision: Union[str, None] = '7d6424e0a6df'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(sa.schema.CreateSequence(sa.Sequence('task_version_seq')))
+    # existing rows are backfilled from the sequence by the server default
+    op.add_column('tasks', sa.Column('version', sa.BigInteger(), server_default=sa.text("nextval('task_version_seq')"), nullable=False))
+    op.create_index(op.f('ix_tasks_version'), 'tasks', ['version'], unique=False)
+    op.create_table('task_tombstones',
+    sa.Column('task_id', sa.UUID(), nullable=False),
+    sa.Column('version', sa.BigInteger(), server_default=sa.text("nextval('task_version_seq')"), nullable=False),
+    sa.PrimaryKeyConstraint('task_id')
+    )
+    op.create_index(op.f('ix_task_tombstones_version'), 'task_tombstones', ['version'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_task_tombstones_version'), table_name='task_tombstones')
+    op.drop_table('task_tombstones')
+    op.drop_index(op.f('ix_tasks_version'), table_name='tasks')
+    op.drop_column('tasks', 'version')
+    op.execute(sa.schema.DropSequence(sa.Sequence('task_version_seq')))
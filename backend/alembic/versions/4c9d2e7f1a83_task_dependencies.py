@@ -0,0 +1,35 @@
+"""task dependencies
+
+Revision ID: 4c9d2e7f1a83
+Revises: e5a7c3d91f42
+Create Date: 2026-10-19 12:04:37.218406
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4c9d2e7f1a83'
+down_revision: Union[str, None] = 'e5a7c3d91f42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('task_dependencies',
+    sa.Column('task_id', sa.UUID(), nullable=False),
+    sa.Column('blocker_id', sa.UUID(), nullable=False),
+    sa.CheckConstraint('task_id <> blocker_id', name='ck_task_dependencies_not_self'),
+    sa.ForeignKeyConstraint(['blocker_id'], ['tasks.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['task_id'], ['tasks.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('task_id', 'blocker_id')
+    )
+    op.create_index(op.f('ix_task_dependencies_blocker_id'), 'task_dependencies', ['blocker_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_task_dependencies_blocker_id'), table_name='task_dependencies')
+    op.drop_table('task_dependencies')
@@ -0,0 +1,26 @@
+"""task assignee index
+
+Revision ID: 5b2f9e61d0c8
+Revises: d71e4b0a9c35
+Create Date: 2026-10-19 13:52:10.371964
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b2f9e61d0c8'
+down_revision: Union[str, None] = 'd71e4b0a9c35'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_tasks_assignee_id_status', 'tasks', ['assignee_id', 'status'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tasks_assignee_id_status', table_name='tasks')
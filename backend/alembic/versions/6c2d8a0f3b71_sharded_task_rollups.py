@@ -0,0 +1,57 @@
+"""sharded task rollups
+
+Revision ID: 6c2d8a0f3b71
+Revises: 1b6e0f4a9d52
+Create Date: 2026-10-20 11:02:37.148203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6c2d8a0f3b71'
+down_revision: Union[str, None] = '1b6e0f4a9d52'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # existing rows become shard 0
+    op.add_column('task_status_daily_flow', sa.Column('shard', sa.SmallInteger(), server_default='0', nullable=False))
+    op.alter_column('task_status_daily_flow', 'shard', server_default=None)
+    op.drop_constraint('task_status_daily_flow_pkey', 'task_status_daily_flow', type_='primary')
+    op.create_primary_key('task_status_daily_flow_pkey', 'task_status_daily_flow', ['day', 'status', 'shard'])
+    op.add_column('task_cycle_time_daily', sa.Column('shard', sa.SmallInteger(), server_default='0', nullable=False))
+    op.alter_column('task_cycle_time_daily', 'shard', server_default=None)
+    op.drop_constraint('task_cycle_time_daily_pkey', 'task_cycle_time_daily', type_='primary')
+    op.create_primary_key('task_cycle_time_daily_pkey', 'task_cycle_time_daily', ['day', 'shard'])
+
+
+def downgrade() -> None:
+    # fold the shards back into one row per key
+    op.execute(
+        "CREATE TEMP TABLE flow AS SELECT day, status, sum(entered) AS entered, sum(exited) AS exited "
+        "FROM task_status_daily_flow GROUP BY day, status"
+    )
+    op.execute("DELETE FROM task_status_daily_flow")
+    op.execute("INSERT INTO task_status_daily_flow (day, status, shard, entered, exited) SELECT day, status, 0, entered, exited FROM flow")
+    op.execute("DROP TABLE flow")
+    op.drop_constraint('task_status_daily_flow_pkey', 'task_status_daily_flow', type_='primary')
+    op.create_primary_key('task_status_daily_flow_pkey', 'task_status_daily_flow', ['day', 'status'])
+    op.drop_column('task_status_daily_flow', 'shard')
+    op.execute(
+        "CREATE TEMP TABLE cycle AS SELECT day, sum(completed) AS completed, sum(total_seconds) AS total_seconds, "
+        "max(max_seconds) AS max_seconds FROM task_cycle_time_daily GROUP BY day"
+    )
+    op.execute("DELETE FROM task_cycle_time_daily")
+    op.execute(
+        "INSERT INTO task_cycle_time_daily (day, shard, completed, total_seconds, max_seconds) "
+        "SELECT day, 0, completed, total_seconds, max_seconds FROM cycle"
+    )
+    op.execute("DROP TABLE cycle")
+    op.drop_constraint('task_cycle_time_daily_pkey', 'task_cycle_time_daily', type_='primary')
+    op.create_primary_key('task_cycle_time_daily_pkey', 'task_cycle_time_daily', ['day'])
+    op.drop_column('task_cycle_time_daily', 'shard')
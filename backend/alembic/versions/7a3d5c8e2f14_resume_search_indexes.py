@@ -0,0 +1,28 @@
+"""resume search indexes
+
+Revision ID: 7a3d5c8e2f14
+Revises: e2b7d4f19a6c
+Create Date: 2026-10-19 16:47:13.630518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7a3d5c8e2f14'
+down_revision: Union[str, None] = 'e2b7d4f19a6c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_resume_uploads_mongodb_resume_id', 'resume_uploads', ['mongodb_resume_id'], unique=False)
+    op.create_index('ix_users_resume_id', 'users', ['resume_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_users_resume_id', table_name='users')
+    op.drop_index('ix_resume_uploads_mongodb_resume_id', table_name='resume_uploads')
@@ -0,0 +1,53 @@
+"""resume ingestion status
+
+Revision ID: 8f6a1c3e5d27
+Revises: 5b2f9e61d0c8
+Create Date: 2026-10-19 14:36:45.902117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8f6a1c3e5d27'
+down_revision: Union[str, None] = '5b2f9e61d0c8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+resume_status = sa.Enum('PROCESSING', 'READY', 'FAILED', name='resumestatus')
+resume_stage = sa.Enum('UPLOADED', 'INDEXED', 'THUMBNAILED', name='resumestage')
+
+
+def upgrade() -> None:
+    resume_status.create(op.get_bind())
+    resume_stage.create(op.get_bind())
+
+    # Existing resumes were processed synchronously: their text is indexed
+    # and their previews are rendered on request
+    op.add_column('resume_uploads', sa.Column('status', resume_status, server_default='READY', nullable=False))
+    op.add_column('resume_uploads', sa.Column('stage', resume_stage, server_default='INDEXED', nullable=False))
+    op.add_column('resume_uploads', sa.Column('error', sa.String(), nullable=True))
+    op.add_column('resume_uploads', sa.Column('attempts', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('resume_uploads', sa.Column('leased_until', sa.DateTime(timezone=True), nullable=True))
+    op.add_column('resume_uploads', sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False))
+    op.alter_column('resume_uploads', 'status', server_default=None)
+    op.alter_column('resume_uploads', 'stage', server_default=None)
+    op.alter_column('resume_uploads', 'attempts', server_default=None)
+    op.alter_column('resume_uploads', 'mongodb_resume_id', existing_type=sa.UUID(), nullable=True)
+    op.create_index(op.f('ix_resume_uploads_status'), 'resume_uploads', ['status'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_resume_uploads_status'), table_name='resume_uploads')
+    op.alter_column('resume_uploads', 'mongodb_resume_id', existing_type=sa.UUID(), nullable=False)
+    op.drop_column('resume_uploads', 'updated_at')
+    op.drop_column('resume_uploads', 'leased_until')
+    op.drop_column('resume_uploads', 'attempts')
+    op.drop_column('resume_uploads', 'error')
+    op.drop_column('resume_uploads', 'stage')
+    op.drop_column('resume_uploads', 'status')
+    resume_stage.drop(op.get_bind())
+    resume_status.drop(op.get_bind())
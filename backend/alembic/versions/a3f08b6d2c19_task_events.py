@@ -0,0 +1,64 @@
+"""task events
+
+Revision ID: a3f08b6d2c19
+Revises: 4c9d2e7f1a83
+Create Date: 2026-10-19 12:41:53.604127
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3f08b6d2c19'
+down_revision: Union[str, None] = '4c9d2e7f1a83'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# created with the tasks table
+task_status = postgresql.ENUM('TODO', 'IN_PROGRESS', 'REVIEW', 'DONE', name='taskstatus', create_type=False)
+
+
+def upgrade() -> None:
+    op.create_table('task_events',
+    sa.Column('id', sa.BigInteger(), sa.Identity(always=False), nullable=False),
+    sa.Column('task_id', sa.UUID(), nullable=False),
+    sa.Column('event_type', sa.Enum('CREATED', 'IMPORTED', 'UPDATED', 'STATUS_CHANGED', 'MOVED', 'ASSIGNEE_CHANGED', 'PRIORITY_CHANGED', 'TITLE_CHANGED', 'DESCRIPTION_CHANGED', 'DELETED', name='taskeventtype'), nullable=False),
+    sa.Column('from_status', task_status, nullable=True),
+    sa.Column('to_status', task_status, nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_task_events_task_id_to_status', 'task_events', ['task_id', 'to_status'], unique=False)
+    op.create_table('task_status_daily_flow',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('status', task_status, nullable=False),
+    sa.Column('entered', sa.Integer(), nullable=False),
+    sa.Column('exited', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('day', 'status')
+    )
+    op.create_table('task_cycle_time_daily',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('completed', sa.Integer(), nullable=False),
+    sa.Column('total_seconds', sa.Float(), nullable=False),
+    sa.Column('max_seconds', sa.Float(), nullable=False),
+    sa.PrimaryKeyConstraint('day')
+    )
+
+    # Seed the burndown with the current columns so the running totals start
+    # from what is already on the board
+    op.execute(
+        "INSERT INTO task_status_daily_flow (day, status, entered, exited) "
+        "SELECT (now() AT TIME ZONE 'UTC')::date, status, count(*), 0 FROM tasks GROUP BY status"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('task_cycle_time_daily')
+    op.drop_table('task_status_daily_flow')
+    op.drop_index('ix_task_events_task_id_to_status', table_name='task_events')
+    op.drop_table('task_events')
+    sa.Enum(name='taskeventtype').drop(op.get_bind(), checkfirst=False)
@@ -0,0 +1,28 @@
+"""resume content hash
+
+Revision ID: c4e91a7d2b60
+Revises: 8f6a1c3e5d27
+Create Date: 2026-10-19 15:21:37.518204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e91a7d2b60'
+down_revision: Union[str, None] = '8f6a1c3e5d27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('resume_uploads', sa.Column('sha256', sa.String(length=64), nullable=True))
+    op.add_column('resume_uploads', sa.Column('size_bytes', sa.BigInteger(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('resume_uploads', 'size_bytes')
+    op.drop_column('resume_uploads', 'sha256')
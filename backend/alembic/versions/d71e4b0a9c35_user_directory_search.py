@@ -0,0 +1,33 @@
+"""user directory search
+
+Revision ID: d71e4b0a9c35
+Revises: a3f08b6d2c19
+Create Date: 2026-10-19 13:15:22.847310
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd71e4b0a9c35'
+down_revision: Union[str, None] = 'a3f08b6d2c19'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.create_index('ix_users_name_id', 'users', ['name', 'id'], unique=False)
+    op.create_index('ix_users_name_trgm', 'users', ['name'], unique=False, postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'})
+    op.create_index('ix_users_email_trgm', 'users', ['email'], unique=False, postgresql_using='gin', postgresql_ops={'email': 'gin_trgm_ops'})
+    op.create_index('ix_users_notes_trgm', 'users', ['notes'], unique=False, postgresql_using='gin', postgresql_ops={'notes': 'gin_trgm_ops'})
+
+
+def downgrade() -> None:
+    op.drop_index('ix_users_notes_trgm', table_name='users', postgresql_using='gin')
+    op.drop_index('ix_users_email_trgm', table_name='users', postgresql_using='gin')
+    op.drop_index('ix_users_name_trgm', table_name='users', postgresql_using='gin')
+    op.drop_index('ix_users_name_id', table_name='users')
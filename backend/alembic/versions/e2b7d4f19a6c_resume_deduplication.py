@@ -0,0 +1,33 @@
+"""resume deduplication
+
+Revision ID: e2b7d4f19a6c
+Revises: c4e91a7d2b60
+Create Date: 2026-10-19 15:58:02.274913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2b7d4f19a6c'
+down_revision: Union[str, None] = 'c4e91a7d2b60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('resume_uploads', sa.Column('ref_count', sa.Integer(), server_default='0', nullable=False))
+    op.execute(
+        "UPDATE resume_uploads SET ref_count = "
+        "(SELECT count(*) FROM users WHERE users.resume_id = resume_uploads.id)"
+    )
+    op.alter_column('resume_uploads', 'ref_count', server_default=None)
+    op.create_unique_constraint('resume_uploads_sha256_key', 'resume_uploads', ['sha256'])
+
+
+def downgrade() -> None:
+    op.drop_constraint('resume_uploads_sha256_key', 'resume_uploads', type_='unique')
+    op.drop_column('resume_uploads', 'ref_count')
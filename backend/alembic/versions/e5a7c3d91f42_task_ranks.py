@@ -0,0 +1,43 @@
+"""task ranks
+
+Revision ID: e5a7c3d91f42
+Revises: b84e0d5c1a27
+Create Date: 2026-10-19 11:26:08.551973
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from app.utils.rank import sequential_ranks
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a7c3d91f42'
+down_revision: Union[str, None] = 'b84e0d5c1a27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('tasks', sa.Column('rank', sa.String(collation='C'), nullable=True))
+
+    # Give existing cards sequential ranks per column, oldest first
+    connection = op.get_bind()
+    rows = connection.execute(sa.text("SELECT id, status FROM tasks ORDER BY status, version")).fetchall()
+    columns = {}
+    for task_id, task_status in rows:
+        columns.setdefault(task_status, []).append(task_id)
+    for task_ids in columns.values():
+        connection.execute(
+            sa.text("UPDATE tasks SET rank = :rank WHERE id = :id"),
+            [{"id": task_id, "rank": rank} for task_id, rank in zip(task_ids, sequential_ranks(len(task_ids)))],
+        )
+
+    op.alter_column('tasks', 'rank', nullable=False)
+    op.create_index('ix_tasks_status_rank', 'tasks', ['status', 'rank'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tasks_status_rank', table_name='tasks')
+    op.drop_column('tasks', 'rank')
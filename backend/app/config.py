@@ -3,6 +3,7 @@
 
 from pydantic_settings import BaseSettings
 from functools import lru_cache
+from typing import List
 
 class Settings(BaseSettings):
     # Environment Configuration
@@ -41,6 +42,41 @@ class Settings(BaseSettings):
     OPENAI_API_KEY: str
     OPENAI_MODEL: str
 
+    # Cache Configuration
+    ENTITY_CACHE_MAX_ENTRIES: int = 10000
+    ENTITY_CACHE_TTL_SECONDS: float = 30.0
+    DOWNLOAD_LINK_CACHE_MAX_ENTRIES: int = 10000
+    DOWNLOAD_LINK_REUSE_FRACTION: float = 0.25
+
+    # Text Compression Configuration
+    TEXT_COMPRESSION_MIN_BYTES: int = 512
+    TEXT_COMPRESSION_LEVEL: int = 6
+
+    # Delta Sync Configuration
+    TASK_TOMBSTONE_RETENTION_DAYS: int = 30
+    TASK_TOMBSTONE_PRUNE_INTERVAL_SECONDS: float = 3600.0
+
+    # Resume Processing Configuration
+    RESUME_PROCESSING_CONCURRENCY: int = 8
+    RESUME_MAX_UPLOAD_BYTES: int = 20 * 1024 * 1024
+    RESUME_UPLOAD_PART_SIZE: int = 5 * 1024 * 1024
+    PDF_POOL_WORKERS: int = 2
+    PDF_POOL_MAX_PENDING: int = 32
+    PDF_EXTRACTION_TIMEOUT_SECONDS: float = 30.0
+    PDF_MAX_PAGES: int = 50
+    RESUME_PIPELINE_MAX_ATTEMPTS: int = 5
+    RESUME_PIPELINE_LEASE_SECONDS: float = 300.0
+    RESUME_PIPELINE_SWEEP_SECONDS: float = 60.0
+    RESUME_PREVIEW_WIDTH: int = 600
+    RESUME_PREVIEW_WIDTHS: List[int] = [160, 600]
+    RESUME_PREVIEW_MAX_WIDTH: int = 2000
+    RESUME_PREVIEW_MAX_DPI: int = 300
+    RESUME_PREVIEW_MAX_PIXELS: int = 12_000_000
+    PDF_RENDER_POOL_WORKERS: int = 2
+    PDF_RENDER_POOL_MAX_PENDING: int = 8
+    PDF_RENDER_TIMEOUT_SECONDS: float = 20.0
+    PDF_RENDER_MEMORY_LIMIT_MB: int = 1024
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
@@ -1,12 +1,28 @@
 # Path: app/main.py
 # Description: This file contains the main FastAPI application.
 
+import asyncio
 import toml
+from contextlib import asynccontextmanager
 from datetime import datetime
 from fastapi import FastAPI
 from app.logger import get_logger
 from app.config import get_settings
 from app.routers import main_router
+from app.utils.process_pool import get_pdf_pool, get_render_pool
+from app.utils.resumes import get_resume_pipeline, backfill_resume_documents
+from app.utils.mongo import ensure_resume_indexes
+from app.utils.postgres import (
+    TASK_CHANGES_CHANNEL,
+    ENTITY_CACHE_CHANNEL,
+    DEPENDENCY_CHANGES_CHANNEL,
+    get_postgres_listener,
+    get_task_change_hub,
+    get_dependency_index,
+    run_tombstone_pruning,
+    handle_entity_cache_notification,
+    handle_task_change_notification,
+)
 
 # Get the settings
 settings = get_settings()
@@ -18,6 +34,40 @@ logger = get_logger()
 with open("pyproject.toml", "r") as file:
     config = toml.load(file)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # One LISTEN connection per worker fans task changes out to websocket clients
+    # and keeps the worker's entity cache coherent with the other workers
+    listener = get_postgres_listener()
+    listener.add_handler(TASK_CHANGES_CHANNEL, get_task_change_hub().publish)
+    listener.add_handler(TASK_CHANGES_CHANNEL, handle_task_change_notification)
+    listener.add_handler(ENTITY_CACHE_CHANNEL, handle_entity_cache_notification)
+    # The dependency graph index follows edge changes and task deletes
+    dependency_index = get_dependency_index()
+    listener.add_handler(DEPENDENCY_CHANGES_CHANNEL, dependency_index.handle_dependency_notification)
+    listener.add_handler(TASK_CHANGES_CHANNEL, dependency_index.handle_task_change_notification)
+    await listener.start()
+    # Background resume ingestion, which also recovers unfinished uploads
+    pipeline = get_resume_pipeline()
+    await pipeline.start()
+    # Delta sync forgets deletes after the retention window
+    tombstone_pruning = asyncio.create_task(run_tombstone_pruning())
+    # Resume search indexes, and the current layout for resumes indexed before it
+    backfill = None
+    try:
+        await ensure_resume_indexes()
+        backfill = asyncio.create_task(backfill_resume_documents())
+    except Exception as e:
+        logger.error(f"Error preparing resume search indexes: {str(e)}")
+    yield
+    if backfill is not None:
+        backfill.cancel()
+    tombstone_pruning.cancel()
+    await pipeline.stop()
+    await listener.stop()
+    get_pdf_pool().shutdown()
+    get_render_pool().shutdown()
+
 app = FastAPI(
     title=config["tool"]["poetry"]["name"],
     description=config["tool"]["poetry"]["description"],
@@ -25,6 +75,7 @@ app = FastAPI(
     openapi_url="/api/openapi.json" if settings.ENV == "development" else None,
     docs_url="/api/docs" if settings.ENV == "development" else None,
     redoc_url="/api/redoc" if settings.ENV == "development" else None,
+    lifespan=lifespan,
 )
 
 app.include_router(main_router, prefix="/api")
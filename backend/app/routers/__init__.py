@@ -1,10 +1,11 @@
 from fastapi import APIRouter
-from . import users, resume, kanban, assistant, system
+from . import users, resume, kanban, board, assistant, system
 
 main_router = APIRouter(prefix="/v1")
 
 main_router.include_router(users.router)
 main_router.include_router(resume.router)
 main_router.include_router(kanban.router)
+main_router.include_router(board.router)
 main_router.include_router(assistant.router)
 main_router.include_router(system.router)
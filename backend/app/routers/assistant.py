@@ -1,16 +1,28 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, load_only
 from openai import OpenAI
 import json
 from typing import List, Optional
 from motor.motor_asyncio import AsyncIOMotorClient
-from app.utils.postgres import get_db, Users, Tasks, ResumeUploads
+from app.utils.postgres import (
+    get_db,
+    Users,
+    Tasks,
+    ResumeUploads,
+    publish_task_change,
+    tombstone_tasks,
+    search_tasks,
+    next_rank_in_column,
+    record_task_event,
+)
 from app.utils.models import (
+    TaskEventType,
     Message,
     ChatRequest,
     ChatResponse,
     GetChatHistoryResponse,
 )
+from app.utils.compression import compressed_field, pack_text, unpack_text
 from app.config import get_settings
 from app.logger import get_logger
 
@@ -40,7 +52,7 @@ async def add_message_to_chat(role: str, content: str):
     """
     message = {
         "role": role,
-        "content": content,
+        **pack_text("content", content),
     }
     
     # Try to update existing chat document
@@ -70,7 +82,7 @@ async def get_chat_history() -> List[Message]:
     for msg in chat["messages"]:
         messages.append(Message(
             role=msg["role"],
-            content=msg["content"],
+            content=unpack_text(msg, "content") or "",
         ))
     
     logger.info(f"Retrieved {len(messages)} messages for chat with ID: default")
@@ -85,11 +97,15 @@ async def get_resume_text(mongodb_resume_id: str) -> str:
         Resume text
     """
     try:
-        resume_doc = await resumes_collection.find_one({"_id": str(mongodb_resume_id)})
-        if not resume_doc or "text" not in resume_doc:
+        # Only the body; the search fields are not needed here
+        resume_doc = await resumes_collection.find_one(
+            {"_id": str(mongodb_resume_id)}, {"text": 1, compressed_field("text"): 1}
+        )
+        resume_text = unpack_text(resume_doc, "text") if resume_doc else None
+        if resume_text is None:
             logger.warning(f"Resume text not found for ID: {mongodb_resume_id}")
             return "Resume text not available"
-        return resume_doc["text"]
+        return resume_text
     except Exception as e:
         logger.error(f"Error retrieving resume text: {str(e)}")
         return "Error retrieving resume text"
@@ -115,10 +131,13 @@ async def create_task_internal(
             description=description,
             assignee_id=assignee_id,
             status=status,
-            priority=priority
+            priority=priority,
+            rank=next_rank_in_column(db, status)
         )
         
         db.add(db_task)
+        publish_task_change(db, "create", db_task)
+        record_task_event(db, db_task.id, TaskEventType.CREATED, to_status=db_task.status)
         db.commit()
         db.refresh(db_task)
         
@@ -144,6 +163,8 @@ async def edit_task_internal(
         if not db_task:
             raise ValueError("Task not found")
             
+        previous_status = db_task.status
+
         # Update fields if provided
         if title is not None:
             db_task.title = title
@@ -157,9 +178,12 @@ async def edit_task_internal(
             db_task.assignee_id = assignee_id
         if priority is not None:
             db_task.priority = priority
-        if status is not None:
+        if status is not None and db_task.status != status:
+            db_task.rank = next_rank_in_column(db, status)
             db_task.status = status
         
+        publish_task_change(db, "update", db_task)
+        record_task_event(db, db_task.id, TaskEventType.UPDATED, previous_status, db_task.status)
         db.commit()
         db.refresh(db_task)
         
@@ -180,8 +204,11 @@ async def delete_task_internal(
         if not db_task:
             raise ValueError("Task not found")
             
-        # Delete the task
+        # Delete the task and leave a tombstone for delta sync clients
         db.delete(db_task)
+        tombstone_tasks(db, db_task.id)
+        publish_task_change(db, "delete", db_task)
+        record_task_event(db, db_task.id, TaskEventType.DELETED, from_status=db_task.status)
         db.commit()
         
         return True
@@ -190,6 +217,27 @@ async def delete_task_internal(
         db.rollback()
         raise e
 
+async def search_tasks_internal(
+    query: str,
+    status: Optional[str] = None,
+    db: Session = Depends(get_db),
+    limit: int = 10
+) -> str:
+    """Internal function to find tasks matching a free-text description"""
+    search = search_tasks(db, query)
+    if status is not None:
+        search = search.filter(Tasks.status == status)
+
+    rows = search.limit(limit).all()
+    if not rows:
+        return f"No tasks found matching: {query}"
+
+    return "\n".join([
+        f"- ID: {task.id}, Title: {task.title}, Status: {task.status}, " +
+        f"Priority: {task.priority}, Assignee: {task.assignee_id}"
+        for task, _ in rows
+    ])
+
 SYSTEM_PROMPT = """
 You are a helpful task management assistant. Your primary responsibility is to help project managers create, edit, and manage tasks.
 
@@ -199,6 +247,7 @@ You can:
 1. Create new tasks using the create_task function
 2. Edit existing tasks using the edit_task function
 3. Delete tasks using the delete_task function
+4. Find tasks the user refers to by description (e.g. "the login bug") using the search_tasks function
 
 If the user doesn't specify all required information, ask follow-up questions to collect it.
 
@@ -211,9 +260,14 @@ You can also help users find the right assignee for a task by suggesting users b
 async def chat_with_assistant(request: ChatRequest, db: Session = Depends(get_db)):
     """Chat with the AI assistant that can manage tasks"""
     try:
-        # Fetch users and tasks from the database
-        users = db.query(Users).all()
-        tasks = db.query(Tasks).all()
+        # Fetch users and tasks from the database, skipping the large
+        # notes/description columns the prompt does not use
+        users = db.query(Users).options(
+            load_only(Users.id, Users.name, Users.email, Users.role, Users.resume_id)
+        ).all()
+        tasks = db.query(Tasks).options(
+            load_only(Tasks.id, Tasks.title, Tasks.status, Tasks.priority, Tasks.assignee_id)
+        ).all()
         
         # Format users with their resume content included directly with each user
         formatted_users = []
@@ -340,6 +394,28 @@ EXISTING TASKS:
                         "required": ["task_id"]
                     }
                 }
+            },
+            {
+                "type": "function",
+                "function": {
+                    "name": "search_tasks",
+                    "description": "Find tasks whose title or description match some keywords",
+                    "parameters": {
+                        "type": "object",
+                        "properties": {
+                            "query": {
+                                "type": "string",
+                                "description": "Keywords describing the task, e.g. 'login bug'"
+                            },
+                            "status": {
+                                "type": "string",
+                                "enum": ["todo", "in_progress", "review", "done"],
+                                "description": "Only return tasks with this status (optional)",
+                            }
+                        },
+                        "required": ["query"]
+                    }
+                }
             }
         ]
         
@@ -412,6 +488,14 @@ EXISTING TASKS:
                         db=db
                     )
                     tool_response = f"Task {function_args.get('task_id')} deleted successfully"
+
+                elif function_name == "search_tasks":
+                    # Search tasks by keywords
+                    tool_response = await search_tasks_internal(
+                        query=function_args.get("query"),
+                        status=function_args.get("status"),
+                        db=db
+                    )
             
                 # Append the tool response to messages
                 messages.append({
@@ -0,0 +1,103 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+import hashlib
+import uuid
+from typing import Optional
+import orjson
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from app.utils.postgres import Tasks, Users, get_db
+from app.logger import get_logger
+from app.utils.models import (
+    TaskStatus,
+    TaskPriority,
+    GetBoardResponse,
+)
+
+router = APIRouter(
+    prefix="/board",
+    tags=["Kanban"],
+)
+
+logger = get_logger()
+
+@router.get("", response_model=GetBoardResponse)
+async def get_board(
+    request: Request,
+    limit_per_column: int = Query(50, ge=1, le=500, description="Maximum number of cards returned per column"),
+    assignee_id: Optional[uuid.UUID] = None,
+    priority: Optional[TaskPriority] = None,
+    db: Session = Depends(get_db)
+) -> Response:
+    """Get the board: tasks grouped by status with their assignee, in column order"""
+    try:
+        # Number and count the cards of each column in the same pass so the
+        # per-column limit and totals come out of a single joined query
+        position = func.row_number().over(
+            partition_by=Tasks.status, order_by=(Tasks.rank, Tasks.id)
+        ).label("position")
+        column_total = func.count().over(partition_by=Tasks.status).label("column_total")
+
+        cards = (
+            select(
+                Tasks.id,
+                Tasks.title,
+                Tasks.status,
+                Tasks.priority,
+                Tasks.rank,
+                Users.id.label("assignee_id"),
+                Users.name.label("assignee_name"),
+                Users.role.label("assignee_role"),
+                position,
+                column_total,
+            )
+            .select_from(Tasks)
+            .outerjoin(Users, Users.id == Tasks.assignee_id)
+        )
+        if assignee_id:
+            cards = cards.where(Tasks.assignee_id == assignee_id)
+        if priority:
+            cards = cards.where(Tasks.priority == priority)
+        cards = cards.subquery()
+
+        rows = db.execute(
+            select(cards)
+            .where(cards.c.position <= limit_per_column)
+            .order_by(cards.c.status, cards.c.position)
+        ).all()
+
+        columns = {
+            task_status: {"status": task_status, "total": 0, "tasks": []}
+            for task_status in TaskStatus
+        }
+        for row in rows:
+            column = columns[row.status]
+            column["total"] = row.column_total
+            column["tasks"].append({
+                "id": row.id,
+                "title": row.title,
+                "status": row.status,
+                "priority": row.priority,
+                "rank": row.rank,
+                "assignee": {
+                    "id": row.assignee_id,
+                    "name": row.assignee_name,
+                    "role": row.assignee_role,
+                } if row.assignee_id else None,
+            })
+
+        body = orjson.dumps({"columns": list(columns.values())})
+
+        # Let clients and proxies revalidate instead of downloading an unchanged board
+        etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+        if etag in request.headers.get("if-none-match", ""):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        return Response(content=body, media_type="application/json", headers=headers)
+
+    except Exception as e:
+        logger.error(f"Error retrieving board: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to retrieve board"
+        )
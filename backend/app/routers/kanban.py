@@ -1,24 +1,85 @@
-from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, Response, WebSocket, WebSocketDisconnect, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
+import asyncio
+import csv
+import io
 import uuid
+from datetime import date, datetime, timedelta, timezone
+from enum import Enum
+from typing import Callable, Iterator, List, Optional, Tuple, Union
+import orjson
+from pydantic import ValidationError
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
-from app.utils.postgres import Tasks, Users, get_db
+from app.utils.postgres import (
+    Tasks,
+    TaskTombstones,
+    TaskStatusDailyFlow,
+    TaskCycleTimeDaily,
+    Users,
+    get_db,
+    publish_task_change,
+    get_task_change_hub,
+    search_tasks,
+    RANK_REBALANCE_LENGTH,
+    lock_task_columns,
+    next_rank_in_column,
+    rank_between_neighbours,
+    rebalance_task_column,
+    notify,
+    TASK_CHANGES_CHANNEL,
+    add_task_dependency,
+    remove_task_dependency,
+    get_dependency_index,
+    record_task_event,
+    record_imported_task_events,
+    current_sync_horizon,
+    pruned_sync_horizon,
+    tombstone_tasks,
+)
+from app.utils.postgres.base import Session as SessionLocal
+from app.utils.cache import get_entity_cache
+from app.utils.fanout import RESYNC
+from app.utils.rank import rank_between
+from app.utils.serialization import rows_to_dicts, parse_fields
+from app.utils.streaming import iter_csv_records, iter_ndjson_records
 from app.logger import get_logger
-from typing import Optional
 from app.utils.models import (
     TaskStatus,
     TaskPriority,
     CreateTaskRequest,
     CreateTaskResponse,
     GetTasksResponse,
+    GetPartialTasksResponse,
     GetTaskRequest,
     GetTaskResponse,
     DeleteTaskRequest,
     TaskWithId,
+    TaskChange,
+    GetTaskChangesResponse,
+    TaskSearchResult,
+    SearchTasksResponse,
     UpdateTaskStatusRequest,
     UpdateTaskAssigneeRequest,
     UpdateTaskPriorityRequest,
     UpdateTaskTitleRequest,
     UpdateTaskDescriptionRequest,
+    MoveTaskRequest,
+    TaskExportFormat,
+    ImportTaskRecord,
+    ImportTaskError,
+    ImportTasksResponse,
+    AddTaskDependencyRequest,
+    TaskDependency,
+    TaskBlocker,
+    GetTaskBlockersResponse,
+    GetCriticalPathResponse,
+    TaskEventType,
+    GetBurndownResponse,
+    BurndownPoint,
+    GetCycleTimeResponse,
+    CycleTimePoint,
 )
 
 router = APIRouter(
@@ -50,10 +111,13 @@ async def create_task(
             description=task_data.description,
             assignee_id=task_data.assignee_id,
             status=task_data.status,
-            priority=task_data.priority
+            priority=task_data.priority,
+            rank=next_rank_in_column(db, task_data.status)
         )
         
         db.add(db_task)
+        publish_task_change(db, "create", db_task)
+        record_task_event(db, db_task.id, TaskEventType.CREATED, to_status=db_task.status)
         db.commit()
         db.refresh(db_task)
         
@@ -65,6 +129,7 @@ async def create_task(
                 assignee_id=db_task.assignee_id,
                 status=db_task.status,
                 priority=db_task.priority,
+                rank=db_task.rank,
             )
         )
 
@@ -78,28 +143,432 @@ async def create_task(
             detail="Failed to create task"
         )
 
-@router.get("")
+# Columns returned by list endpoints, selected as plain tuples. The rows skip
+# response model validation, so the nullable description is coalesced here to
+# keep it the string the model declares
+TASK_LIST_COLUMNS = (
+    Tasks.id,
+    Tasks.title,
+    func.coalesce(Tasks.description, "").label("description"),
+    Tasks.assignee_id,
+    Tasks.status,
+    Tasks.priority,
+    Tasks.rank,
+)
+
+TASK_LIST_FIELDS = {column.key: column for column in TASK_LIST_COLUMNS}
+
+# What the board needs to render a card; leaves out the description
+TASK_FIELD_PRESETS = {
+    "compact": ["id", "title", "assignee_id", "status", "priority", "rank"],
+}
+
+@router.get("", response_model=Union[GetTasksResponse, GetPartialTasksResponse])
 async def get_tasks(
     assignee_id: Optional[uuid.UUID] = None,
     priority: Optional[TaskPriority] = None,
-    status: Optional[TaskStatus] = None,
+    task_status: Optional[TaskStatus] = Query(None, alias="status"),
+    fields: Optional[str] = Query(
+        None,
+        description="Comma separated fields to return, or `compact` (default: all fields)",
+    ),
     db: Session = Depends(get_db)
-) -> GetTasksResponse:
+) -> ORJSONResponse:
     """Get all tasks with optional filtering"""
     try:
-        query = db.query(Tasks)
+        try:
+            keys = parse_fields(fields, list(TASK_LIST_FIELDS), TASK_FIELD_PRESETS)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+
+        # Unrequested columns are never read from the database
+        query = db.query(*[TASK_LIST_FIELDS[key] for key in keys])
         
         # Apply filters if provided
         if assignee_id:
             query = query.filter(Tasks.assignee_id == assignee_id)
         if priority:
             query = query.filter(Tasks.priority == priority)
-        if status:
-            query = query.filter(Tasks.status == status)
+        if task_status:
+            query = query.filter(Tasks.status == task_status)
             
-        tasks = query.all()
+        rows = query.order_by(Tasks.status, Tasks.rank, Tasks.id).all()
         
-        return GetTasksResponse(
+        # Encode the tuples directly instead of building and re-validating a
+        # TaskWithId per row; the response model is kept for the schema only
+        return ORJSONResponse({"tasks": rows_to_dicts(rows, keys)})
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error retrieving tasks: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to retrieve tasks"
+        )
+
+EXPORT_BATCH_SIZE = 1000
+IMPORT_BATCH_SIZE = 1000
+MAX_IMPORT_ERRORS = 100
+
+def encode_csv_rows(rows: List[tuple]) -> bytes:
+    """Encode rows as CSV lines, writing enums by value"""
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(
+        [value.value if isinstance(value, Enum) else value for value in row] for row in rows
+    )
+    return buffer.getvalue().encode("utf-8")
+
+def stream_task_export(export_format: TaskExportFormat, filters: list) -> Iterator[bytes]:
+    """Yield an encoded export batch by batch from a server-side cursor"""
+    # The request's session is closed before the body is streamed, so the
+    # export holds its own for as long as the client keeps reading
+    db = SessionLocal()
+    keys = [column.key for column in TASK_LIST_COLUMNS]
+    exported = 0
+    try:
+        result = db.execute(
+            select(*TASK_LIST_COLUMNS)
+            .where(*filters)
+            .order_by(Tasks.status, Tasks.rank, Tasks.id)
+            .execution_options(yield_per=EXPORT_BATCH_SIZE)
+        )
+
+        if export_format == TaskExportFormat.CSV:
+            yield encode_csv_rows([keys])
+        for rows in result.partitions():
+            if export_format == TaskExportFormat.CSV:
+                yield encode_csv_rows(rows)
+            else:
+                yield b"".join(
+                    orjson.dumps(dict(zip(keys, row)), option=orjson.OPT_APPEND_NEWLINE)
+                    for row in rows
+                )
+            exported += len(rows)
+            logger.debug(f"Exported {exported} tasks")
+
+        logger.info(f"Task export finished: {exported} tasks")
+    except Exception as e:
+        # Headers are already sent, all we can do is cut the stream short
+        logger.error(f"Error exporting tasks after {exported} rows: {str(e)}")
+        raise
+    finally:
+        db.close()
+
+@router.get("/export")
+async def export_tasks(
+    export_format: TaskExportFormat = Query(TaskExportFormat.NDJSON, alias="format"),
+    assignee_id: Optional[uuid.UUID] = None,
+    priority: Optional[TaskPriority] = None,
+    task_status: Optional[TaskStatus] = Query(None, alias="status"),
+    db: Session = Depends(get_db)
+) -> StreamingResponse:
+    """Stream all tasks as NDJSON or CSV in column order"""
+    try:
+        filters = []
+        if assignee_id:
+            filters.append(Tasks.assignee_id == assignee_id)
+        if priority:
+            filters.append(Tasks.priority == priority)
+        if task_status:
+            filters.append(Tasks.status == task_status)
+
+        # Lets clients show progress while they read the stream
+        total = db.query(func.count(Tasks.id)).filter(*filters).scalar()
+
+        return StreamingResponse(
+            stream_task_export(export_format, filters),
+            media_type="text/csv" if export_format == TaskExportFormat.CSV else "application/x-ndjson",
+            headers={
+                "X-Total-Count": str(total),
+                "Content-Disposition": f'attachment; filename="tasks.{export_format.value}"',
+            },
+        )
+
+    except Exception as e:
+        logger.error(f"Error exporting tasks: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to export tasks"
+        )
+
+def insert_task_batch(
+    db: Session,
+    batch: List[Tuple[int, ImportTaskRecord]],
+    record_error: Callable[[int, str], None],
+) -> int:
+    """Insert one batch of imported tasks in a single statement and commit it"""
+    # Cards created meanwhile went to the same bottom spots; read the columns
+    # again under their locks rather than trusting ranks from earlier batches
+    statuses = {record.status for _, record in batch}
+    lock_task_columns(db, statuses)
+    last_ranks = dict(
+        db.query(Tasks.status, func.max(Tasks.rank))
+        .filter(Tasks.status.in_(statuses))
+        .group_by(Tasks.status)
+        .all()
+    )
+    assignee_ids = {record.assignee_id for _, record in batch}
+    known_assignees = {
+        user_id for (user_id,) in db.query(Users.id).filter(Users.id.in_(assignee_ids))
+    }
+
+    rows = []
+    lines = {}
+    for line, record in batch:
+        if record.assignee_id not in known_assignees:
+            record_error(line, "Assignee not found")
+            continue
+        if record.id is not None and record.id in lines:
+            # The first line with an id is imported; the insert would
+            # silently drop the others
+            record_error(line, f"Duplicate task id, already used on line {lines[record.id]}")
+            continue
+
+        # Imported cards go to the bottom of their column, in file order
+        rank = rank_between(last_ranks.get(record.status), None)
+        last_ranks[record.status] = rank
+        task_id = record.id or uuid.uuid4()
+        lines[task_id] = line
+        rows.append({
+            "id": task_id,
+            "title": record.title,
+            "description": record.description,
+            "assignee_id": record.assignee_id,
+            "status": record.status,
+            "priority": record.priority,
+            "rank": rank,
+        })
+
+    if not rows:
+        return 0
+
+    inserted = set(db.execute(
+        insert(Tasks.__table__)
+        .on_conflict_do_nothing(index_elements=["id"])
+        .returning(Tasks.__table__.c.id),
+        rows,
+    ).scalars())
+    for task_id, line in lines.items():
+        if task_id not in inserted:
+            record_error(line, "Task with this id already exists")
+    record_imported_task_events(db, (row for row in rows if row["id"] in inserted))
+
+    # One event per batch; subscribers pick the rows up from GET /tasks/changes
+    notify(db, TASK_CHANGES_CHANNEL, {"op": "import", "count": len(inserted)})
+    db.commit()
+    return len(inserted)
+
+@router.post("/import")
+async def import_tasks(
+    request: Request,
+    import_format: TaskExportFormat = Query(TaskExportFormat.NDJSON, alias="format"),
+    db: Session = Depends(get_db)
+) -> ImportTasksResponse:
+    """Import tasks from an NDJSON or CSV request body, committed in batches"""
+    imported = 0
+    failed = 0
+    errors: List[ImportTaskError] = []
+
+    def record_error(line: int, error: str):
+        nonlocal failed
+        failed += 1
+        if len(errors) < MAX_IMPORT_ERRORS:
+            errors.append(ImportTaskError(line=line, error=error))
+
+    try:
+        if import_format == TaskExportFormat.CSV:
+            records = iter_csv_records(request.stream())
+        else:
+            records = iter_ndjson_records(request.stream())
+
+        batch: List[Tuple[int, ImportTaskRecord]] = []
+        async for line, raw in records:
+            try:
+                if import_format == TaskExportFormat.CSV:
+                    # Empty CSV cells mean "not set" for the optional id
+                    record = ImportTaskRecord.model_validate(
+                        {key: value for key, value in raw.items() if value != "" or key != "id"}
+                    )
+                else:
+                    record = ImportTaskRecord.model_validate_json(raw)
+            except ValidationError as e:
+                error = e.errors()[0]
+                record_error(line, f"{'.'.join(map(str, error['loc']))}: {error['msg']}".lstrip(": "))
+                continue
+
+            batch.append((line, record))
+            if len(batch) >= IMPORT_BATCH_SIZE:
+                imported += insert_task_batch(db, batch, record_error)
+                batch = []
+                logger.info(f"Task import progress: {imported} imported, {failed} failed")
+
+        if batch:
+            imported += insert_task_batch(db, batch, record_error)
+
+        logger.info(f"Task import finished: {imported} imported, {failed} failed")
+        return ImportTasksResponse(imported=imported, failed=failed, errors=errors)
+
+    except ValueError as e:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Malformed import body: {str(e)} ({imported} tasks were imported before the error)"
+        )
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error importing tasks: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to import tasks ({imported} tasks were imported before the error)"
+        )
+
+@router.get("/changes")
+async def get_task_changes(
+    since: int = Query(0, ge=0, description="Version returned by the previous poll (0 for a full sync)"),
+    limit: int = Query(500, ge=1, le=5000, description="Maximum number of changes to return"),
+    db: Session = Depends(get_db)
+) -> GetTaskChangesResponse:
+    """Get tasks created, updated or deleted since the given version"""
+    try:
+        # Pages are cut by writing transaction and stop below the oldest one
+        # still running, so a slow transaction that commits after a newer one
+        # is still picked up by the next poll. Taken before reading, so every
+        # transaction below it is visible to the queries that follow
+        horizon = current_sync_horizon(db)
+
+        db_tasks = (
+            db.query(Tasks)
+            .filter(Tasks.txid >= since, Tasks.txid < horizon)
+            .order_by(Tasks.txid, Tasks.version)
+            .limit(limit + 1)
+            .all()
+        )
+        db_tombstones = (
+            db.query(TaskTombstones)
+            .filter(TaskTombstones.txid >= since, TaskTombstones.txid < horizon)
+            .order_by(TaskTombstones.txid, TaskTombstones.version)
+            .limit(limit + 1)
+            .all()
+        )
+        changes = sorted(db_tasks + db_tombstones, key=lambda change: (change.txid, change.version))
+
+        has_more = len(changes) > limit
+        next_since = max(since, horizon)
+        if has_more:
+            boundary = changes[limit].txid
+            if boundary == changes[0].txid:
+                # A single transaction larger than a page is returned whole,
+                # since the cursor cannot point inside it
+                changes = sorted(
+                    db.query(Tasks).filter(Tasks.txid == boundary).all()
+                    + db.query(TaskTombstones).filter(TaskTombstones.txid == boundary).all(),
+                    key=lambda change: change.version,
+                )
+                next_since = boundary + 1
+            else:
+                changes = [change for change in changes if change.txid < boundary]
+                next_since = boundary
+
+        # Checked after reading, so tombstones pruned meanwhile are caught too
+        if since and since <= pruned_sync_horizon(db):
+            raise HTTPException(
+                status_code=status.HTTP_410_GONE,
+                detail="Changes since this version are no longer available, sync again from 0"
+            )
+
+        tasks = []
+        deleted_task_ids = []
+        for change in changes:
+            if isinstance(change, TaskTombstones):
+                deleted_task_ids.append(change.task_id)
+            else:
+                tasks.append(TaskChange(
+                    id=change.id,
+                    title=change.title,
+                    description=change.description,
+                    assignee_id=change.assignee_id,
+                    status=change.status,
+                    priority=change.priority,
+                    rank=change.rank,
+                    version=change.version,
+                ))
+
+        return GetTaskChangesResponse(
+            tasks=tasks,
+            deleted_task_ids=deleted_task_ids,
+            version=next_since,
+            has_more=has_more,
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error retrieving task changes: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to retrieve task changes"
+        )
+
+@router.get("/search")
+async def search_tasks_route(
+    q: str = Query(..., min_length=1, description="Search text, supports quoted phrases, OR and -exclusions"),
+    assignee_id: Optional[uuid.UUID] = None,
+    priority: Optional[TaskPriority] = None,
+    task_status: Optional[TaskStatus] = Query(None, alias="status"),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_db)
+) -> SearchTasksResponse:
+    """Search tasks by keywords in their title and description"""
+    try:
+        query = search_tasks(db, q)
+
+        # Apply filters if provided
+        if assignee_id:
+            query = query.filter(Tasks.assignee_id == assignee_id)
+        if priority:
+            query = query.filter(Tasks.priority == priority)
+        if task_status:
+            query = query.filter(Tasks.status == task_status)
+
+        # Fetch one extra row to know whether there is another page
+        rows = query.offset(offset).limit(limit + 1).all()
+
+        return SearchTasksResponse(
+            tasks=[TaskSearchResult(
+                id=task.id,
+                title=task.title,
+                description=task.description,
+                assignee_id=task.assignee_id,
+                status=task.status,
+                priority=task.priority,
+                rank=task.rank,
+                score=score,
+            ) for task, score in rows[:limit]],
+            has_more=len(rows) > limit,
+        )
+
+    except Exception as e:
+        logger.error(f"Error searching tasks: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to search tasks"
+        )
+
+@router.get("/critical-path")
+async def get_critical_path(
+    db: Session = Depends(get_db)
+) -> GetCriticalPathResponse:
+    """Get the longest chain of open tasks blocking one another"""
+    try:
+        path = get_dependency_index().get(db).critical_path()
+        tasks = {task.id: task for task in db.query(Tasks).filter(Tasks.id.in_(path)).all()}
+
+        return GetCriticalPathResponse(
             tasks=[TaskWithId(
                 id=task.id,
                 title=task.title,
@@ -107,16 +576,167 @@ async def get_tasks(
                 assignee_id=task.assignee_id,
                 status=task.status,
                 priority=task.priority,
-            ) for task in tasks]
+                rank=task.rank,
+            ) for task in (tasks.get(task_id) for task_id in path) if task is not None],
         )
-    
+
     except Exception as e:
-        logger.error(f"Error retrieving tasks: {str(e)}")
+        logger.error(f"Error computing critical path: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to retrieve tasks"
+            detail="Failed to compute critical path"
+        )
+
+METRICS_MAX_DAYS = 366
+
+def resolve_metrics_range(start: Optional[date], end: Optional[date]) -> Tuple[date, date]:
+    """Default to the last 30 days and cap the range length"""
+    end = end or datetime.now(timezone.utc).date()
+    start = start or end - timedelta(days=29)
+    if start > end or (end - start).days >= METRICS_MAX_DAYS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"start must not be after end and the range must not exceed {METRICS_MAX_DAYS} days"
+        )
+    return start, end
+
+@router.get("/metrics/burndown")
+async def get_burndown(
+    start: Optional[date] = Query(None, description="First day (UTC), defaults to 29 days before end"),
+    end: Optional[date] = Query(None, description="Last day (UTC), defaults to today"),
+    db: Session = Depends(get_db)
+) -> GetBurndownResponse:
+    """Get the number of tasks in each column at the end of every day"""
+    try:
+        start, end = resolve_metrics_range(start, end)
+        net_flow = func.sum(TaskStatusDailyFlow.entered - TaskStatusDailyFlow.exited)
+
+        # Columns as they stood before the range, then the daily changes inside
+        # it; both come from the rollup, never from the raw events
+        counts = {task_status: 0 for task_status in TaskStatus}
+        for task_status, count in (
+            db.query(TaskStatusDailyFlow.status, net_flow)
+            .filter(TaskStatusDailyFlow.day < start)
+            .group_by(TaskStatusDailyFlow.status)
+        ):
+            counts[task_status] = count
+        daily = {}
+        for day, task_status, count in (
+            db.query(TaskStatusDailyFlow.day, TaskStatusDailyFlow.status, net_flow)
+            .filter(TaskStatusDailyFlow.day.between(start, end))
+            .group_by(TaskStatusDailyFlow.day, TaskStatusDailyFlow.status)
+        ):
+            daily.setdefault(day, {})[task_status] = count
+
+        points = []
+        for offset in range((end - start).days + 1):
+            day = start + timedelta(days=offset)
+            for task_status, count in daily.get(day, {}).items():
+                counts[task_status] += count
+            points.append(BurndownPoint(
+                day=day,
+                todo=counts[TaskStatus.TODO],
+                in_progress=counts[TaskStatus.IN_PROGRESS],
+                review=counts[TaskStatus.REVIEW],
+                done=counts[TaskStatus.DONE],
+                remaining=sum(count for task_status, count in counts.items() if task_status != TaskStatus.DONE),
+            ))
+
+        return GetBurndownResponse(points=points)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error retrieving burndown: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to retrieve burndown"
+        )
+
+@router.get("/metrics/cycle-time")
+async def get_cycle_time(
+    start: Optional[date] = Query(None, description="First day (UTC), defaults to 29 days before end"),
+    end: Optional[date] = Query(None, description="Last day (UTC), defaults to today"),
+    db: Session = Depends(get_db)
+) -> GetCycleTimeResponse:
+    """Get how many tasks were completed each day and how long they took from start to done"""
+    try:
+        start, end = resolve_metrics_range(start, end)
+        # Shards of a day summed back together
+        rollups = {
+            rollup.day: rollup
+            for rollup in (
+                db.query(
+                    TaskCycleTimeDaily.day,
+                    func.sum(TaskCycleTimeDaily.completed).label("completed"),
+                    func.sum(TaskCycleTimeDaily.total_seconds).label("total_seconds"),
+                    func.max(TaskCycleTimeDaily.max_seconds).label("max_seconds"),
+                )
+                .filter(TaskCycleTimeDaily.day.between(start, end))
+                .group_by(TaskCycleTimeDaily.day)
+            )
+        }
+
+        points = []
+        for offset in range((end - start).days + 1):
+            day = start + timedelta(days=offset)
+            rollup = rollups.get(day)
+            points.append(CycleTimePoint(
+                day=day,
+                completed=rollup.completed if rollup else 0,
+                average_seconds=rollup.total_seconds / rollup.completed if rollup else None,
+                max_seconds=rollup.max_seconds if rollup else None,
+            ))
+
+        completed = sum(rollup.completed for rollup in rollups.values())
+        total_seconds = sum(rollup.total_seconds for rollup in rollups.values())
+        return GetCycleTimeResponse(
+            points=points,
+            completed=completed,
+            average_seconds=total_seconds / completed if completed else None,
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error retrieving cycle time: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to retrieve cycle time"
         )
 
+@router.websocket("/ws")
+async def task_updates(websocket: WebSocket):
+    """Push task change events to the client as they are committed"""
+    await websocket.accept()
+    hub = get_task_change_hub()
+    queue = hub.subscribe()
+
+    async def send_changes():
+        while True:
+            message = await queue.get()
+            if message is RESYNC:
+                # Events were dropped, the client should catch up via GET /tasks/changes
+                message = '{"op":"resync"}'
+            await websocket.send_text(message)
+
+    async def wait_for_disconnect():
+        while True:
+            if (await websocket.receive())["type"] == "websocket.disconnect":
+                return
+
+    tasks = [asyncio.create_task(send_changes()), asyncio.create_task(wait_for_disconnect())]
+    try:
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            # A send on a closed socket is the normal way for this loop to end
+            if task.exception() and not isinstance(task.exception(), WebSocketDisconnect):
+                logger.warning(f"Task updates socket closed: {str(task.exception())}")
+    finally:
+        hub.unsubscribe(queue)
+        for task in tasks:
+            task.cancel()
+
 @router.get("/{task_id}")
 async def get_task(
     request: GetTaskRequest = Depends(GetTaskRequest.query_params),
@@ -124,24 +744,30 @@ async def get_task(
 ) -> GetTaskResponse:
     """Get a specific task by ID"""
     try:
-        db_task = db.query(Tasks).filter(Tasks.id == request.task_id).first()
-        
-        if db_task is None:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Task not found"
-            )
-        
-        return GetTaskResponse(
-            task=TaskWithId(
+        def load_task() -> Optional[TaskWithId]:
+            db_task = db.query(Tasks).filter(Tasks.id == request.task_id).first()
+            if db_task is None:
+                return None
+            return TaskWithId(
                 id=db_task.id,
                 title=db_task.title,
                 description=db_task.description,
                 assignee_id=db_task.assignee_id,
                 status=db_task.status,
                 priority=db_task.priority,
+                rank=db_task.rank,
             )
-        )
+
+        # Every task mutation evicts the entry, see publish_task_change
+        task = get_entity_cache().get_or_load(("task", request.task_id), load_task)
+        
+        if task is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Task not found"
+            )
+        
+        return GetTaskResponse(task=task)
     
     except HTTPException:
         raise
@@ -168,7 +794,13 @@ async def update_task_status(
                 detail="Task not found"
             )
         
+        previous_status = db_task.status
+        if db_task.status != request.status:
+            # Changing column drops the card at the bottom of the new one
+            db_task.rank = next_rank_in_column(db, request.status)
         db_task.status = request.status
+        publish_task_change(db, "update", db_task)
+        record_task_event(db, db_task.id, TaskEventType.STATUS_CHANGED, previous_status, db_task.status)
         db.commit()
         db.refresh(db_task)
         
@@ -179,6 +811,7 @@ async def update_task_status(
             assignee_id=db_task.assignee_id,
             status=db_task.status,
             priority=db_task.priority,
+            rank=db_task.rank,
         )
     
     except HTTPException:
@@ -216,6 +849,8 @@ async def update_task_assignee(
             )
             
         db_task.assignee_id = request.assignee_id
+        publish_task_change(db, "update", db_task)
+        record_task_event(db, db_task.id, TaskEventType.ASSIGNEE_CHANGED)
         db.commit()
         db.refresh(db_task)
         
@@ -226,6 +861,7 @@ async def update_task_assignee(
             assignee_id=db_task.assignee_id,
             status=db_task.status,
             priority=db_task.priority,
+            rank=db_task.rank,
         )
     
     except HTTPException:
@@ -255,6 +891,8 @@ async def update_task_priority(
             )
         
         db_task.priority = request.priority
+        publish_task_change(db, "update", db_task)
+        record_task_event(db, db_task.id, TaskEventType.PRIORITY_CHANGED)
         db.commit()
         db.refresh(db_task)
         
@@ -265,6 +903,7 @@ async def update_task_priority(
             assignee_id=db_task.assignee_id,
             status=db_task.status,
             priority=db_task.priority,
+            rank=db_task.rank,
         )
     
     except HTTPException:
@@ -294,6 +933,8 @@ async def update_task_title(
             )
         
         db_task.title = request.title
+        publish_task_change(db, "update", db_task)
+        record_task_event(db, db_task.id, TaskEventType.TITLE_CHANGED)
         db.commit()
         db.refresh(db_task)
         
@@ -304,6 +945,7 @@ async def update_task_title(
             assignee_id=db_task.assignee_id,
             status=db_task.status,
             priority=db_task.priority,
+            rank=db_task.rank,
         )
     
     except HTTPException:
@@ -333,6 +975,8 @@ async def update_task_description(
             )
         
         db_task.description = request.description
+        publish_task_change(db, "update", db_task)
+        record_task_event(db, db_task.id, TaskEventType.DESCRIPTION_CHANGED)
         db.commit()
         db.refresh(db_task)
         
@@ -343,6 +987,7 @@ async def update_task_description(
             assignee_id=db_task.assignee_id,
             status=db_task.status,
             priority=db_task.priority,
+            rank=db_task.rank,
         )
     
     except HTTPException:
@@ -355,6 +1000,187 @@ async def update_task_description(
             detail="Failed to update task description"
         )
 
+@router.post("/{task_id}/move")
+async def move_task(
+    task_id: uuid.UUID,
+    request: MoveTaskRequest,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db)
+) -> TaskWithId:
+    """Move a task to a position between two cards, optionally in another column"""
+    try:
+        db_task = db.query(Tasks).filter(Tasks.id == task_id).first()
+        
+        if db_task is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Task not found"
+            )
+
+        previous_status = db_task.status
+        target_status = request.status or db_task.status
+
+        # Resolve the neighbours, which must already sit in the target column
+        neighbours = {}
+        for name, neighbour_id in (("previous", request.previous_id), ("next", request.next_id)):
+            if neighbour_id is None:
+                neighbours[name] = None
+                continue
+            neighbour = db.query(Tasks).filter(Tasks.id == neighbour_id).first()
+            if neighbour is None or neighbour.id == db_task.id or neighbour.status != target_status:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"The {name} task must be another task in the target column"
+                )
+            neighbours[name] = neighbour
+
+        try:
+            rank = rank_between_neighbours(
+                db, target_status, neighbours["previous"], neighbours["next"], db_task.id
+            )
+        except ValueError:
+            # Neighbours out of order or sharing a rank after concurrent moves
+            background_tasks.add_task(rebalance_task_column, target_status)
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Neighbouring tasks are out of order, reload the column and retry"
+            )
+
+        # Only the moved card is written
+        db_task.status = target_status
+        db_task.rank = rank
+        publish_task_change(db, "update", db_task)
+        record_task_event(db, db_task.id, TaskEventType.MOVED, previous_status, target_status)
+        db.commit()
+        db.refresh(db_task)
+
+        if len(rank) > RANK_REBALANCE_LENGTH:
+            background_tasks.add_task(rebalance_task_column, target_status)
+
+        return TaskWithId(
+            id=db_task.id,
+            title=db_task.title,
+            description=db_task.description,
+            assignee_id=db_task.assignee_id,
+            status=db_task.status,
+            priority=db_task.priority,
+            rank=db_task.rank,
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error moving task: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to move task"
+        )
+
+@router.post("/{task_id}/dependencies", status_code=status.HTTP_201_CREATED)
+async def add_dependency(
+    task_id: uuid.UUID,
+    request: AddTaskDependencyRequest,
+    db: Session = Depends(get_db)
+) -> TaskDependency:
+    """Mark a task as blocked by another task"""
+    try:
+        db_task = db.query(Tasks).filter(Tasks.id == task_id).first()
+        db_blocker = db.query(Tasks).filter(Tasks.id == request.blocker_id).first()
+
+        if db_task is None or db_blocker is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Task not found"
+            )
+
+        try:
+            add_task_dependency(db, db_task, db_blocker)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=str(e)
+            )
+        db.commit()
+
+        return TaskDependency(task_id=db_task.id, blocker_id=db_blocker.id)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error adding task dependency: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to add task dependency"
+        )
+
+@router.delete("/{task_id}/dependencies/{blocker_id}")
+async def remove_dependency(
+    task_id: uuid.UUID,
+    blocker_id: uuid.UUID,
+    db: Session = Depends(get_db)
+):
+    """Remove a blocked-by relationship between two tasks"""
+    try:
+        if not remove_task_dependency(db, task_id, blocker_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Dependency not found"
+            )
+        db.commit()
+
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error removing task dependency: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to remove task dependency"
+        )
+
+@router.get("/{task_id}/blockers")
+async def get_task_blockers(
+    task_id: uuid.UUID,
+    db: Session = Depends(get_db)
+) -> GetTaskBlockersResponse:
+    """Get every task blocking a task, directly or transitively"""
+    try:
+        if db.query(Tasks.id).filter(Tasks.id == task_id).first() is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Task not found"
+            )
+
+        blockers = get_dependency_index().get(db).transitive_blockers(task_id)
+        depths = dict(blockers)
+        tasks = {task.id: task for task in db.query(Tasks).filter(Tasks.id.in_(depths)).all()}
+
+        return GetTaskBlockersResponse(
+            blockers=[TaskBlocker(
+                id=task.id,
+                title=task.title,
+                description=task.description,
+                assignee_id=task.assignee_id,
+                status=task.status,
+                priority=task.priority,
+                rank=task.rank,
+                depth=depths[task.id],
+            ) for task in (tasks.get(blocker_id) for blocker_id, _ in blockers) if task is not None],
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error retrieving task blockers: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to retrieve task blockers"
+        )
+
 @router.delete("/{task_id}")
 async def delete_task(
     request: DeleteTaskRequest = Depends(DeleteTaskRequest.query_params),
@@ -371,6 +1197,9 @@ async def delete_task(
             )
         
         db.delete(db_task)
+        tombstone_tasks(db, db_task.id)
+        publish_task_change(db, "delete", db_task)
+        record_task_event(db, db_task.id, TaskEventType.DELETED, from_status=db_task.status)
         db.commit()
         
         return Response(status_code=status.HTTP_204_NO_CONTENT)
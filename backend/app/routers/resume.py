@@ -1,20 +1,39 @@
-from fastapi import APIRouter, Depends, HTTPException, Path, UploadFile, File, status
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Request, Response, UploadFile, File, status
 from fastapi.responses import StreamingResponse
-from motor.motor_asyncio import AsyncIOMotorClient
-import io
+import asyncio
+import hashlib
 import uuid
-from pdf2image import convert_from_bytes
-import PyPDF2
+import zipfile
+from contextlib import nullcontext
+from typing import Awaitable, BinaryIO, Callable, ContextManager, Dict, List, Optional, Tuple
+from minio.error import S3Error
 from app.utils.minio import get_minio_client, MinioClient
+from app.utils.resumes import store_resume, discard_resume, hash_resume_file, get_resume_pipeline, get_download_links, preview_widths, render_preview, render_previews
+from app.utils.process_pool import PoolSaturatedError
+from app.utils.streaming import UploadTooLargeError, iter_http_response, parse_byte_range
 from app.logger import get_logger
 from app.utils.models import (
+    ResumeStatus,
     ResumeUploadResponse,
+    BatchResumeResult,
+    BatchUploadResumesResponse,
+    ResumeStatusResponse,
     ResumeDownloadLinkRequest,
     ResumeDownloadLinkResponse,
+    ResumeDownloadLinksRequest,
+    ResumeDownloadLink,
+    ResumeDownloadLinksResponse,
+    ResumeSearchUser,
+    ResumeSearchResult,
+    SearchResumesResponse,
 )
 from app.config import get_settings
-from app.utils.postgres.schema import ResumeUploads
+from app.utils.postgres.schema import ResumeUploads, Users
+from app.utils.mongo import get_resumes_collection
+from app.utils.skills import SKILL_ALIASES, normalize_skill
+from app.utils.postgres import find_resume_by_hash, insert_resume_uploads
 from app.utils.postgres.base import get_db
+from sqlalchemy import select, update
 from sqlalchemy.orm import Session
 
 router = APIRouter(
@@ -25,44 +44,9 @@ router = APIRouter(
 logger = get_logger()
 settings = get_settings()
 
-# MongoDB client setup
-mongo_client = AsyncIOMotorClient(settings.get_mongo_uri())
-mongo_db = mongo_client[settings.MONGO_DB]
-resumes_collection = mongo_db[settings.MONGO_COLLECTION_RESUMES]
-
-async def extract_text_from_pdf(file: UploadFile) -> str:
-    """Extract text content from a PDF file"""
-    try:
-        content = await file.read()
-        pdf_file = io.BytesIO(content)
-        
-        # Reset file pointer for future use
-        await file.seek(0)
-        
-        pdf_reader = PyPDF2.PdfReader(pdf_file)
-        text = ""
-        
-        # Extract text from each page
-        for page_num in range(len(pdf_reader.pages)):
-            page = pdf_reader.pages[page_num]
-            text += page.extract_text() + "\n"
-            
-        return text
-    except Exception as e:
-        logger.error(f"Error extracting text from PDF: {str(e)}")
-        raise ValueError(f"Failed to extract text from PDF: {str(e)}")
-
-async def save_resume_to_mongodb(resume_text: str) -> uuid.UUID:
-    """Save resume text to MongoDB and return document ID"""
-    doc_id = uuid.uuid4()
-    await resumes_collection.insert_one({
-        "_id": str(doc_id),
-        "text": resume_text
-    })
-    return doc_id
-
 @router.post("", status_code=status.HTTP_201_CREATED)
 async def upload_resume(
+    response: Response,
     resume: UploadFile = File(...),
     minio_client: MinioClient = Depends(get_minio_client),
     db: Session = Depends(get_db)
@@ -74,39 +58,60 @@ async def upload_resume(
             detail="Only PDF files are supported"
         )
         
-    try:
-        # Read file content once
-        content = await resume.read()
-        
-        # Extract text from PDF using the content
-        pdf_file = io.BytesIO(content)
-        pdf_reader = PyPDF2.PdfReader(pdf_file)
-        resume_text = ""
-        
-        # Extract text from each page
-        for page_num in range(len(pdf_reader.pages)):
-            page = pdf_reader.pages[page_num]
-            resume_text += page.extract_text() + "\n"
-        
-        # Create a new BytesIO for MinIO upload
-        file_stream = io.BytesIO(content)
+    # Starlette has already spooled the body to a temporary file, so the
+    # size is known without reading it
+    if resume.size is not None and resume.size > settings.RESUME_MAX_UPLOAD_BYTES:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Resume exceeds {settings.RESUME_MAX_UPLOAD_BYTES} bytes"
+        )
         
-        # Upload to MinIO using the content directly
-        minio_resume_id = await minio_client.upload_file_from_bytes(file_stream, len(content), resume.filename)
+    try:
+        # Hash the spooled file first: a PDF that is already stored is not
+        # uploaded or processed again
+        await resume.seek(0)
+        sha256, _ = await asyncio.to_thread(hash_resume_file, resume.file)
+        existing = find_resume_by_hash(db, sha256)
+        if existing is not None:
+            if existing.status == ResumeStatus.FAILED:
+                # Uploading the same file again retries its processing
+                existing.status = ResumeStatus.PROCESSING
+                existing.attempts = 0
+                existing.error = None
+                db.commit()
+                get_resume_pipeline().enqueue(existing.id)
+            response.status_code = status.HTTP_200_OK
+            return ResumeUploadResponse(
+                resume_id=str(existing.id),
+                status=existing.status,
+                duplicate=True,
+            )
         
-        # Save text to MongoDB
-        mongodb_resume_id = await save_resume_to_mongodb(resume_text)
+        # Only the raw upload happens here, streamed from the spooled file;
+        # extraction, indexing and the preview run in the background pipeline
+        resume_upload = await store_resume(resume.file, minio_client)
         
-        # Create record in PostgreSQL
-        resume_upload = ResumeUploads(
-            minio_resume_id=minio_resume_id,
-            mongodb_resume_id=mongodb_resume_id
-        )
-        db.add(resume_upload)
+        # Create record in PostgreSQL, unless the same PDF was stored meanwhile
+        resume_id = insert_resume_uploads(db, [resume_upload])[resume_upload.sha256]
         db.commit()
+        if resume_id != resume_upload.id:
+            await discard_resume(resume_upload, minio_client)
+            response.status_code = status.HTTP_200_OK
+            return ResumeUploadResponse(
+                resume_id=str(resume_id),
+                status=db.get(ResumeUploads, resume_id).status,
+                duplicate=True,
+            )
+        get_resume_pipeline().enqueue(resume_upload.id)
         
         return ResumeUploadResponse(
-            resume_id=str(resume_upload.id)
+            resume_id=str(resume_upload.id),
+            status=ResumeStatus.PROCESSING,
+        )
+    except UploadTooLargeError:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Resume exceeds {settings.RESUME_MAX_UPLOAD_BYTES} bytes"
         )
     except Exception as e:
         db.rollback()
@@ -116,6 +121,281 @@ async def upload_resume(
             detail=f"Failed to process resume: {str(e)}"
         )
 
+# Limits of a single batch request
+MAX_BATCH_RESUMES = 500
+
+@router.post(":batch")
+async def upload_resumes_batch(
+    resumes: Optional[List[UploadFile]] = File(None, description="PDF files"),
+    archive: Optional[UploadFile] = File(None, description="ZIP archive of PDF files"),
+    minio_client: MinioClient = Depends(get_minio_client),
+    db: Session = Depends(get_db)
+) -> BatchUploadResumesResponse:
+    """Upload many resumes at once, as PDF files and/or a ZIP archive of them"""
+    results: List[BatchResumeResult] = []
+    # Accepted PDFs, with a way to open each one for reading
+    sources: List[Tuple[BatchResumeResult, Callable[[], ContextManager[BinaryIO]]]] = []
+
+    def accept(name: str, is_pdf: bool, size: Optional[int], open_file: Callable[[], ContextManager[BinaryIO]]):
+        result = BatchResumeResult(file=name)
+        results.append(result)
+        if not is_pdf:
+            result.error = "Only PDF files are supported"
+        elif size is not None and size > settings.RESUME_MAX_UPLOAD_BYTES:
+            result.error = f"Resume exceeds {settings.RESUME_MAX_UPLOAD_BYTES} bytes"
+        else:
+            sources.append((result, open_file))
+
+    try:
+        for resume in resumes or []:
+            accept(
+                resume.filename or "",
+                resume.content_type == "application/pdf",
+                resume.size,
+                lambda resume=resume: nullcontext(resume.file),
+            )
+        if archive is not None:
+            # Entries are streamed out of the archive, never extracted whole
+            archive_zip = zipfile.ZipFile(archive.file)
+            for info in archive_zip.infolist():
+                if info.is_dir() or info.filename.startswith("__MACOSX/"):
+                    continue
+                accept(
+                    info.filename,
+                    info.filename.lower().endswith(".pdf"),
+                    info.file_size,
+                    lambda info=info: archive_zip.open(info),
+                )
+    except zipfile.BadZipFile as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Malformed archive: {str(e)}"
+        )
+    if not results:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No resumes given"
+        )
+    if len(results) > MAX_BATCH_RESUMES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {MAX_BATCH_RESUMES} resumes can be uploaded at once"
+        )
+
+    semaphore = asyncio.Semaphore(settings.RESUME_PROCESSING_CONCURRENCY)
+
+    def hash_source(open_file: Callable[[], ContextManager[BinaryIO]]) -> str:
+        with open_file() as file:
+            file.seek(0)
+            return hash_resume_file(file)[0]
+
+    async def run_bounded(fn: Callable[..., Awaitable], *args):
+        async with semaphore:
+            return await fn(*args)
+
+    async def upload_source(open_file: Callable[[], ContextManager[BinaryIO]]) -> ResumeUploads:
+        with open_file() as file:
+            file.seek(0)
+            resume_upload = await store_resume(file, minio_client)
+        stored.append(resume_upload)
+        return resume_upload
+
+    def fail(result: BatchResumeResult, error: Exception):
+        if isinstance(error, UploadTooLargeError):
+            result.error = str(error)
+        else:
+            logger.error(f"Failed to upload resume {result.file}: {str(error)}")
+            result.error = "Failed to upload resume"
+
+    stored: List[ResumeUploads] = []
+    try:
+        # 1. Hash every PDF locally, so known ones are never uploaded
+        hashes = await asyncio.gather(
+            *(run_bounded(asyncio.to_thread, hash_source, open_file) for _, open_file in sources),
+            return_exceptions=True,
+        )
+        hashed = []
+        for (result, open_file), sha256 in zip(sources, hashes):
+            if isinstance(sha256, Exception):
+                fail(result, sha256)
+            else:
+                hashed.append((result, open_file, sha256))
+
+        existing = {
+            row.sha256: row for row in db.execute(
+                select(ResumeUploads.id, ResumeUploads.sha256, ResumeUploads.status)
+                .where(ResumeUploads.sha256.in_({sha256 for _, _, sha256 in hashed}))
+            )
+        }
+
+        # 2. Upload each new PDF once, however often it appears in the batch
+        first: Dict[str, Callable[[], ContextManager[BinaryIO]]] = {}
+        for _, open_file, sha256 in hashed:
+            if sha256 not in existing:
+                first.setdefault(sha256, open_file)
+        uploads = await asyncio.gather(
+            *(run_bounded(upload_source, open_file) for open_file in first.values()),
+            return_exceptions=True,
+        )
+        uploaded = dict(zip(first, uploads))
+
+        # 3. One transaction for all the new rows; uploads that lost a race
+        # with a concurrent request for the same PDF are dropped
+        resume_ids = insert_resume_uploads(
+            db, [upload for upload in uploaded.values() if isinstance(upload, ResumeUploads)]
+        )
+        kept = [upload for upload in stored if resume_ids[upload.sha256] == upload.id]
+        # Uploading a failed resume again retries its processing
+        retried = [row.id for row in existing.values() if row.status == ResumeStatus.FAILED]
+        if retried:
+            db.execute(
+                update(ResumeUploads)
+                .where(ResumeUploads.id.in_(retried))
+                .values(status=ResumeStatus.PROCESSING, attempts=0, error=None)
+            )
+        db.commit()
+
+        pipeline = get_resume_pipeline()
+        for resume_id in [upload.id for upload in kept] + retried:
+            pipeline.enqueue(resume_id)
+        await asyncio.gather(*(
+            discard_resume(upload, minio_client) for upload in stored if upload not in kept
+        ))
+
+        for result, open_file, sha256 in hashed:
+            if sha256 in existing:
+                result.resume_id = existing[sha256].id
+                result.status = ResumeStatus.PROCESSING if existing[sha256].id in retried else existing[sha256].status
+                result.duplicate = True
+            elif isinstance(uploaded[sha256], Exception):
+                fail(result, uploaded[sha256])
+            else:
+                resume_id = resume_ids[sha256]
+                stored_here = resume_id == uploaded[sha256].id
+                result.resume_id = resume_id
+                # A later copy within the batch, or a PDF another request stored meanwhile
+                result.duplicate = first[sha256] is not open_file or not stored_here
+                result.status = ResumeStatus.PROCESSING if stored_here else db.get(ResumeUploads, resume_id).status
+
+        failed = sum(1 for result in results if result.error is not None)
+        duplicates = sum(1 for result in results if result.duplicate)
+        logger.info(f"Resume batch finished: {len(results) - failed - duplicates} uploaded, {duplicates} duplicates, {failed} failed")
+        return BatchUploadResumesResponse(
+            uploaded=len(results) - failed - duplicates,
+            duplicates=duplicates,
+            failed=failed,
+            results=results,
+        )
+
+    except Exception as e:
+        db.rollback()
+        await asyncio.gather(*(discard_resume(upload, minio_client) for upload in stored))
+        logger.error(f"Failed to upload resume batch: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to upload resumes"
+        )
+
+@router.post(":download-links")
+async def get_resume_download_links(
+    request: ResumeDownloadLinksRequest,
+    minio_client: MinioClient = Depends(get_minio_client),
+    db: Session = Depends(get_db)
+) -> ResumeDownloadLinksResponse:
+    """Get download links for many resumes at once, e.g. for a page of the user list"""
+    try:
+        links = get_download_links(db, request.resume_ids, request.expiration, minio_client)
+        return ResumeDownloadLinksResponse(
+            links=[
+                ResumeDownloadLink(resume_id=resume_id, download_link=link)
+                for resume_id, link in links.items()
+            ],
+            missing=[resume_id for resume_id in dict.fromkeys(request.resume_ids) if resume_id not in links],
+        )
+    except Exception as e:
+        logger.error(f"Failed to generate download links: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to generate download links"
+        )
+
+# Limit of a single search request
+MAX_RESUME_SEARCH_RESULTS = 100
+
+@router.get("/search")
+async def search_resumes(
+    skill: List[str] = Query([], description="Skills the resume must all mention, e.g. kubernetes or k8s"),
+    q: Optional[str] = Query(None, min_length=1, max_length=200, description="Full-text search over the resume text"),
+    limit: int = Query(20, ge=1, le=MAX_RESUME_SEARCH_RESULTS, description="Maximum number of resumes"),
+    db: Session = Depends(get_db)
+) -> SearchResumesResponse:
+    """Find resumes by skill and/or text, with the users they belong to"""
+    skills = list(dict.fromkeys(normalize_skill(value) for value in skill if value.strip()))
+    if not skills and not q:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Pass at least one skill or q"
+        )
+
+    try:
+        # Known skills are matched on the extracted list, anything else on
+        # the keywords; both are indexed arrays
+        conditions = [
+            {"skills": value} if value in SKILL_ALIASES else {"keywords": value}
+            for value in skills
+        ]
+        projection = {"skills": 1}
+        if q:
+            conditions.append({"$text": {"$search": q}})
+            projection["score"] = {"$meta": "textScore"}
+        cursor = get_resumes_collection().find({"$and": conditions}, projection)
+        if q:
+            cursor = cursor.sort([("score", {"$meta": "textScore"})])
+        documents = await cursor.limit(limit).to_list(limit)
+
+        # Back to the users in one query
+        found = []
+        for document in documents:
+            try:
+                found.append((uuid.UUID(str(document["_id"])), document))
+            except ValueError:
+                continue
+        mongodb_ids = [mongodb_id for mongodb_id, _ in found]
+        users: Dict[uuid.UUID, List[ResumeSearchUser]] = {}
+        resume_ids: Dict[uuid.UUID, uuid.UUID] = {}
+        if mongodb_ids:
+            rows = db.execute(
+                select(ResumeUploads.mongodb_resume_id, ResumeUploads.id, Users.id, Users.name, Users.email, Users.role)
+                .join(Users, Users.resume_id == ResumeUploads.id)
+                .where(ResumeUploads.mongodb_resume_id.in_(mongodb_ids))
+                .order_by(Users.name)
+            )
+            for mongodb_id, resume_id, user_id, name, email, role in rows:
+                resume_ids[mongodb_id] = resume_id
+                users.setdefault(mongodb_id, []).append(
+                    ResumeSearchUser(id=user_id, name=name, email=email, role=role)
+                )
+
+        # Resumes nobody has been created with yet are left out
+        results = [
+            ResumeSearchResult(
+                resume_id=resume_ids[mongodb_id],
+                skills=document.get("skills", []),
+                score=document.get("score"),
+                users=users[mongodb_id],
+            )
+            for mongodb_id, document in found
+            if mongodb_id in users
+        ]
+        return SearchResumesResponse(results=results)
+
+    except Exception as e:
+        logger.error(f"Failed to search resumes: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to search resumes"
+        )
+
 @router.get("/{resume_id}")
 async def get_resume_download_link(
     request: ResumeDownloadLinkRequest = Depends(ResumeDownloadLinkRequest.query_params),
@@ -124,13 +404,17 @@ async def get_resume_download_link(
 ) -> ResumeDownloadLinkResponse:
     """Get a download link for a resume stored in MinIO"""
     try:
-        minio_resume_id = (
-            db.query(ResumeUploads)
-            .filter(ResumeUploads.id == request.resume_id)
-            .first()
-        )
-        download_url = minio_client.get_download_link(minio_resume_id, request.expiration)
-        return ResumeDownloadLinkResponse(download_link=download_url)
+        links = get_download_links(db, [request.resume_id], request.expiration, minio_client)
+        
+        if request.resume_id not in links:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Resume not found"
+            )
+        
+        return ResumeDownloadLinkResponse(download_link=links[request.resume_id])
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to generate download link: {str(e)}")
         raise HTTPException(
@@ -138,13 +422,145 @@ async def get_resume_download_link(
             detail="Failed to generate download link"
         )
 
-@router.get("/{resume_id}/preview", response_class=StreamingResponse)
+@router.get("/{resume_id}/status")
+async def get_resume_status(
+    resume_id: uuid.UUID = Path(..., title="Resume ID", description="The ID of the resume"),
+    db: Session = Depends(get_db)
+) -> ResumeStatusResponse:
+    """Get the background processing progress of an uploaded resume"""
+    try:
+        resume_upload = db.query(ResumeUploads).filter(ResumeUploads.id == resume_id).first()
+        
+        if not resume_upload:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Resume not found"
+            )
+        
+        return ResumeStatusResponse(
+            resume_id=resume_upload.id,
+            status=resume_upload.status,
+            stage=resume_upload.stage,
+            attempts=resume_upload.attempts,
+            error=resume_upload.error,
+            updated_at=resume_upload.updated_at,
+        )
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to retrieve resume status: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to retrieve resume status"
+        )
+
+@router.get("/{resume_id}/content")
+async def get_resume_content(
+    request: Request,
+    resume_id: uuid.UUID = Path(..., title="Resume ID", description="The ID of the resume to download"),
+    minio_client: MinioClient = Depends(get_minio_client),
+    db: Session = Depends(get_db)
+):
+    """Download a resume PDF through the API, for clients that cannot reach MinIO"""
+    try:
+        resume_upload = db.query(ResumeUploads).filter(ResumeUploads.id == resume_id).first()
+        
+        if not resume_upload:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Resume not found"
+            )
+        
+        minio_resume_id = str(resume_upload.minio_resume_id)
+        size, etag = await asyncio.to_thread(minio_client.stat_file, minio_resume_id)
+        headers = {
+            "ETag": f'"{etag}"',
+            "Accept-Ranges": "bytes",
+            "Content-Disposition": f'inline; filename="{resume_id}.pdf"',
+            # The PDF behind a resume ID never changes
+            "Cache-Control": "private, max-age=31536000, immutable",
+        }
+        
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and headers["ETag"] in if_none_match:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        
+        # A resumed download only gets the range if its copy is still current
+        if_range = request.headers.get("if-range")
+        try:
+            byte_range = None
+            if if_range is None or if_range == headers["ETag"]:
+                byte_range = parse_byte_range(request.headers.get("range"), size)
+        except ValueError:
+            return Response(
+                status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                headers={**headers, "Content-Range": f"bytes */{size}"}
+            )
+        
+        # Only the requested bytes are fetched, and relayed chunk by chunk
+        if byte_range is None:
+            status_code = status.HTTP_200_OK
+            object_response = await asyncio.to_thread(minio_client.open_file, minio_resume_id)
+            headers["Content-Length"] = str(size)
+        else:
+            start, end = byte_range
+            status_code = status.HTTP_206_PARTIAL_CONTENT
+            object_response = await asyncio.to_thread(
+                minio_client.open_file, minio_resume_id, start, end - start + 1
+            )
+            headers["Content-Length"] = str(end - start + 1)
+            headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+        
+        return StreamingResponse(
+            iter_http_response(object_response),
+            status_code=status_code,
+            media_type="application/pdf",
+            headers=headers
+        )
+    
+    except HTTPException:
+        raise
+    except S3Error as e:
+        if e.code == "NoSuchKey":
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Resume file not found"
+            )
+        logger.error(f"Failed to download resume: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to download resume"
+        )
+    except Exception as e:
+        logger.error(f"Failed to download resume: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to download resume"
+        )
+
+@router.get("/{resume_id}/preview")
 async def get_resume_preview_image(
+    request: Request,
     resume_id: str = Path(..., title="Resume ID", description="The ID of the resume to preview"),
+    width: Optional[int] = Query(
+        None, ge=16, le=settings.RESUME_PREVIEW_MAX_WIDTH, description="Width of the preview in pixels"
+    ),
+    dpi: Optional[int] = Query(
+        None, ge=36, le=settings.RESUME_PREVIEW_MAX_DPI, description="Resolution to render at, instead of a width"
+    ),
     minio_client: MinioClient = Depends(get_minio_client),
     db: Session = Depends(get_db)
 ):
     """Get a preview image of the first page of a resume"""
+    if width and dpi:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Pass either width or dpi, not both"
+        )
+    if not dpi:
+        width = width or settings.RESUME_PREVIEW_WIDTH
+
     try:
         # Get the MinIO resume ID from PostgreSQL
         resume_upload = db.query(ResumeUploads).filter(ResumeUploads.id == resume_id).first()
@@ -155,32 +571,54 @@ async def get_resume_preview_image(
                 detail="Resume not found"
             )
             
-        minio_resume_id = resume_upload.minio_resume_id
+        minio_resume_id = str(resume_upload.minio_resume_id)
+        if_none_match = request.headers.get("if-none-match")
         
-        # Retrieve the PDF from MinIO
-        pdf_content = minio_client.get_file_content(str(minio_resume_id))
+        # The PDF behind a resume ID never changes, so neither do its previews
+        headers = {"Cache-Control": "private, max-age=31536000, immutable"}
         
-        # Convert the first page of the PDF to image
-        images = convert_from_bytes(pdf_content, first_page=1, last_page=1)
+        if width not in preview_widths():
+            # One-off size: rendered on every miss and not stored, so the ETag
+            # is derived from the request instead of the image
+            etag = hashlib.blake2b(f"{minio_resume_id}:{width}:{dpi}".encode(), digest_size=16).hexdigest()
+            headers["ETag"] = f'"{etag}"'
+            if if_none_match and headers["ETag"] in if_none_match:
+                return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+            image = await render_preview(resume_upload.minio_resume_id, width, dpi, minio_client)
+            return Response(content=image, media_type="image/jpeg", headers=headers)
         
-        if not images:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to generate preview image"
-            )
+        # Revalidation only needs the object metadata
+        if if_none_match:
+            etag = await asyncio.to_thread(minio_client.stat_preview, minio_resume_id, width)
+            if etag and f'"{etag}"' in if_none_match:
+                headers["ETag"] = f'"{etag}"'
+                return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
         
-        # Take the first page and convert to JPEG
-        first_page = images[0]
-        img_byte_arr = io.BytesIO()
-        first_page.save(img_byte_arr, format='JPEG')
-        img_byte_arr.seek(0)
+        preview = await asyncio.to_thread(minio_client.get_preview, minio_resume_id, width)
+        if preview is not None:
+            image, etag = preview
+        else:
+            # Not rendered by the pipeline yet; render every size now and keep them
+            image = (await render_previews(resume_upload.minio_resume_id, minio_client))[width]
+            # Same value MinIO reports for a single-part upload
+            etag = hashlib.md5(image).hexdigest()
         
-        # Return the image
-        return StreamingResponse(
-            content=img_byte_arr,
-            media_type="image/jpeg"
-        )
+        headers["ETag"] = f'"{etag}"'
+        return Response(content=image, media_type="image/jpeg", headers=headers)
         
+    except HTTPException:
+        raise
+    except PoolSaturatedError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many previews are being rendered, retry shortly",
+            headers={"Retry-After": "2"}
+        )
+    except TimeoutError:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Rendering took too long for this PDF"
+        )
     except Exception as e:
         logger.error(f"Failed to generate resume preview image: {str(e)}")
         raise HTTPException(
@@ -1,8 +1,24 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from motor.motor_asyncio import AsyncIOMotorClient
-from app.utils.postgres import get_db, Users, ResumeUploads, Tasks
+from app.utils.postgres import (
+    get_db,
+    Users,
+    ResumeUploads,
+    Tasks,
+    TaskEvents,
+    TaskStatusDailyFlow,
+    TaskCycleTimeDaily,
+    notify,
+    clear_entity_cache,
+    tombstone_tasks,
+    TASK_CHANGES_CHANNEL,
+)
+from app.utils.cache import get_entity_cache, get_download_link_cache
+from app.utils.process_pool import get_pdf_pool, get_render_pool
 from app.utils.minio import get_minio_client, MinioClient
+from app.utils.mongo import ensure_resume_indexes
 from app.config import get_settings
 from app.logger import get_logger
 
@@ -27,7 +43,14 @@ async def reset_all_databases(
         # Drop all table data
         db.query(Users).delete()
         db.query(ResumeUploads).delete()
+        # Tombstone every task so delta sync clients drop them on their next poll
+        tombstone_tasks(db, select(Tasks.id))
         db.query(Tasks).delete()
+        db.query(TaskEvents).delete()
+        db.query(TaskStatusDailyFlow).delete()
+        db.query(TaskCycleTimeDaily).delete()
+        notify(db, TASK_CHANGES_CHANNEL, {"op": "resync"})
+        clear_entity_cache(db)
         db.commit()
         
         # 2. Clear MongoDB collections
@@ -38,6 +61,8 @@ async def reset_all_databases(
         # Drop specific collections
         await mongo_db[settings.MONGO_COLLECTION_RESUMES].drop()
         await mongo_db[settings.MONGO_COLLECTION_CHAT].drop()
+        # Dropping the collection took its search indexes with it
+        await ensure_resume_indexes()
         
         # 3. Clear MinIO storage
         logger.info("Clearing MinIO storage")
@@ -56,3 +81,20 @@ async def reset_all_databases(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to reset databases: {str(e)}"
         )
+
+@router.get("/metrics", status_code=status.HTTP_200_OK)
+async def get_metrics():
+    """Get in-process metrics for this worker"""
+    try:
+        return {
+            "entity_cache": get_entity_cache().stats(),
+            "download_link_cache": get_download_link_cache().stats(),
+            "pdf_extraction": get_pdf_pool().stats(),
+            "pdf_rendering": get_render_pool().stats(),
+        }
+    except Exception as e:
+        logger.error(f"Error retrieving metrics: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to retrieve metrics"
+        )
@@ -1,21 +1,52 @@
-from fastapi import APIRouter, Depends, HTTPException, Response, status, Path
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Response, UploadFile, status, Path
+from fastapi.responses import ORJSONResponse
+import asyncio
 import uuid
+import zipfile
+from collections import Counter
+from pydantic import ValidationError
+from sqlalchemy import delete, func, or_, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
+from typing import List, Optional, Tuple, Union
 from sqlalchemy.exc import IntegrityError
-from app.utils.postgres import Users, get_db
+from app.utils.postgres import (
+    Users,
+    ResumeUploads,
+    Tasks,
+    get_db,
+    invalidate_entity,
+    insert_resume_uploads,
+    acquire_resume,
+    release_resume,
+)
 from app.utils.minio import get_minio_client, MinioClient
+from app.utils.resumes import store_resume, discard_resume, get_resume_pipeline
+from app.utils.streaming import iter_upload, iter_csv_records, iter_ndjson_records
+from app.config import get_settings
 from app.logger import get_logger
+from app.utils.cache import get_entity_cache
+from app.utils.serialization import rows_to_dicts, parse_fields
+from app.utils.pagination import encode_cursor, decode_cursor, escape_like
 from app.utils.models import (
     UserRole,
+    TaskStatus,
+    TaskPriority,
     CreateUserRequest,
     CreateUserResponse,
     GetUsersResponse,
+    GetPartialUsersResponse,
     GetUserRequest,
     GetUserResponse,
     UpdateUserRequest,
     UpdateUserResponse,
     DeleteUserRequest,
     UserWithId,
+    ImportUserRecord,
+    ImportUserError,
+    ImportedUser,
+    ImportUsersResponse,
+    GetUsersWithWorkloadResponse,
     GetUserRolesResponse
 )
 
@@ -25,6 +56,7 @@ router = APIRouter(
 )
 
 logger = get_logger()
+settings = get_settings()
 minio_client = get_minio_client()
 
 @router.get("/roles")
@@ -59,6 +91,7 @@ async def create_user(
         )
         
         db.add(db_user)
+        acquire_resume(db, db_user.resume_id)
         db.commit()
         db.refresh(db_user)
         
@@ -88,25 +121,319 @@ async def create_user(
             detail="Failed to create user"
         )
 
-@router.get("")
+# Limits of a single import request
+MAX_USER_IMPORT_ROWS = 5000
+MAX_IMPORT_ERRORS = 100
+
+@router.post(":import")
+async def import_users(
+    manifest: UploadFile = File(..., description="CSV (by .csv extension) or NDJSON file with name, email, notes, role and resume_file or resume_id"),
+    archive: Optional[UploadFile] = File(None, description="ZIP archive holding the PDFs named by resume_file"),
+    db: Session = Depends(get_db),
+    minio_client: MinioClient = Depends(get_minio_client)
+) -> ImportUsersResponse:
+    """Create many users at once, uploading their resumes from a ZIP archive"""
+    failed = 0
+    errors: List[ImportUserError] = []
+
+    def record_error(line: int, error: str):
+        nonlocal failed
+        failed += 1
+        if len(errors) < MAX_IMPORT_ERRORS:
+            errors.append(ImportUserError(line=line, error=error))
+
+    stored: List[ResumeUploads] = []
+    try:
+        # 1. Validate the whole manifest before touching any storage
+        is_csv = (manifest.filename or "").lower().endswith(".csv")
+        if is_csv:
+            records = iter_csv_records(iter_upload(manifest))
+        else:
+            records = iter_ndjson_records(iter_upload(manifest))
+
+        parsed: List[Tuple[int, ImportUserRecord]] = []
+        async for line, raw in records:
+            if len(parsed) + failed >= MAX_USER_IMPORT_ROWS:
+                raise ValueError(f"Manifest has more than {MAX_USER_IMPORT_ROWS} rows")
+            try:
+                if is_csv:
+                    # Empty CSV cells mean "not set" for the optional columns
+                    record = ImportUserRecord.model_validate(
+                        {key: value for key, value in raw.items() if value != "" or key == "notes"}
+                    )
+                else:
+                    record = ImportUserRecord.model_validate_json(raw)
+            except ValidationError as e:
+                error = e.errors()[0]
+                record_error(line, f"{'.'.join(map(str, error['loc']))}: {error['msg']}".lstrip(": "))
+                continue
+            if (record.resume_file is None) == (record.resume_id is None):
+                record_error(line, "Exactly one of resume_file or resume_id is required")
+                continue
+            parsed.append((line, record))
+
+        archive_zip = zipfile.ZipFile(archive.file) if archive is not None else None
+        archive_entries = {info.filename: info for info in archive_zip.infolist()} if archive_zip else {}
+
+        # One query each for taken emails and referenced resumes
+        existing_emails = set(db.execute(
+            select(Users.email).where(Users.email.in_([record.email for _, record in parsed]))
+        ).scalars())
+        known_resume_ids = set(db.execute(
+            select(ResumeUploads.id).where(
+                ResumeUploads.id.in_([record.resume_id for _, record in parsed if record.resume_id])
+            )
+        ).scalars())
+
+        accepted: List[Tuple[int, ImportUserRecord]] = []
+        for line, record in parsed:
+            if record.email in existing_emails:
+                record_error(line, "User with this email already exists")
+                continue
+            if record.resume_id is not None and record.resume_id not in known_resume_ids:
+                record_error(line, "Resume not found")
+                continue
+            if record.resume_file is not None:
+                entry = archive_entries.get(record.resume_file)
+                if entry is None:
+                    record_error(line, "Resume file not found in archive")
+                    continue
+                if entry.file_size > settings.RESUME_MAX_UPLOAD_BYTES:
+                    record_error(line, f"Resume file exceeds {settings.RESUME_MAX_UPLOAD_BYTES} bytes")
+                    continue
+            existing_emails.add(record.email)
+            accepted.append((line, record))
+
+        # 2. Upload the new resumes with bounded parallelism; they are processed
+        # in the background once committed
+        semaphore = asyncio.Semaphore(settings.RESUME_PROCESSING_CONCURRENCY)
+
+        async def process_resume(record: ImportUserRecord) -> Optional[ResumeUploads]:
+            if record.resume_file is None:
+                return None
+            async with semaphore:
+                # Streamed out of the archive rather than extracted into memory
+                with archive_zip.open(record.resume_file) as resume_file:
+                    resume_upload = await store_resume(resume_file, minio_client)
+                stored.append(resume_upload)
+                return resume_upload
+
+        results = await asyncio.gather(
+            *(process_resume(record) for _, record in accepted), return_exceptions=True
+        )
+
+        # 3. Insert the resume links and users with one multi-row statement each.
+        # Identical PDFs share one resume, within the import and with resumes
+        # stored before
+        uploads = {}
+        for result in results:
+            if isinstance(result, ResumeUploads):
+                uploads.setdefault(result.sha256, result)
+        resume_ids = insert_resume_uploads(db, list(uploads.values()))
+        kept = [upload for upload in stored if resume_ids[upload.sha256] == upload.id]
+        duplicates = [upload for upload in stored if resume_ids[upload.sha256] != upload.id]
+
+        user_rows = []
+        lines = {}
+        for (line, record), result in zip(accepted, results):
+            if isinstance(result, Exception):
+                record_error(line, f"Failed to upload resume: {str(result)}")
+                continue
+            lines[record.email] = line
+            user_rows.append({
+                "id": uuid.uuid4(),
+                "name": record.name,
+                "email": record.email,
+                "notes": record.notes,
+                "resume_id": resume_ids[result.sha256] if result is not None else record.resume_id,
+                "role": record.role,
+            })
+
+        inserted = set()
+        if user_rows:
+            inserted = set(db.execute(
+                insert(Users.__table__)
+                .on_conflict_do_nothing(index_elements=["email"])
+                .returning(Users.__table__.c.email),
+                user_rows,
+            ).scalars())
+
+        # Emails taken by a concurrent request since the check above
+        for row in user_rows:
+            if row["email"] not in inserted:
+                record_error(lines[row["email"]], "User with this email already exists")
+        references = Counter(row["resume_id"] for row in user_rows if row["email"] in inserted)
+        for resume_id, count in references.items():
+            acquire_resume(db, resume_id, count)
+        orphaned = [upload for upload in kept if upload.id not in references]
+        if orphaned:
+            db.execute(delete(ResumeUploads).where(ResumeUploads.id.in_([upload.id for upload in orphaned])))
+        db.commit()
+
+        pipeline = get_resume_pipeline()
+        for upload in kept:
+            if upload not in orphaned:
+                pipeline.enqueue(upload.id)
+        for upload in duplicates + orphaned:
+            await discard_resume(upload, minio_client)
+
+        users = [
+            ImportedUser(line=lines[row["email"]], user_id=row["id"], resume_id=row["resume_id"])
+            for row in user_rows if row["email"] in inserted
+        ]
+        logger.info(f"User import finished: {len(users)} imported, {failed} failed")
+        errors.sort(key=lambda error: error.line)
+        return ImportUsersResponse(imported=len(users), failed=failed, users=users, errors=errors)
+
+    except (ValueError, zipfile.BadZipFile) as e:
+        db.rollback()
+        await asyncio.gather(*(discard_resume(upload, minio_client) for upload in stored))
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Malformed import: {str(e)}"
+        )
+    except Exception as e:
+        db.rollback()
+        await asyncio.gather(*(discard_resume(upload, minio_client) for upload in stored))
+        logger.error(f"Error importing users: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to import users"
+        )
+
+# Columns returned by list endpoints, selected as plain tuples
+USER_LIST_COLUMNS = (
+    Users.id,
+    Users.name,
+    Users.email,
+    func.coalesce(Users.notes, "").label("notes"),
+    Users.resume_id,
+    Users.role,
+)
+
+USER_LIST_FIELDS = {column.key: column for column in USER_LIST_COLUMNS}
+
+# What pickers and badges need; leaves out the notes
+USER_FIELD_PRESETS = {
+    "compact": ["id", "name", "email", "resume_id", "role"],
+}
+
+# Page size when a cursor is given without a limit
+DEFAULT_USER_PAGE_SIZE = 50
+
+USER_INCLUDES = ["tasks", "workload"]
+
+def attach_open_work(db: Session, users: List[dict], includes: List[str]) -> None:
+    """
+    Add each listed user's open tasks and/or workload counts, with one query per include
+    Args:
+        db: Database session
+        users: Users as returned by the listing, keyed by "id"
+        includes: "tasks" and/or "workload"
+    Returns:
+        None, the user dicts are updated in place
+    """
+    by_id = {user["id"]: user for user in users}
+    open_tasks = (Tasks.assignee_id.in_(list(by_id)), Tasks.status != TaskStatus.DONE)
+
+    if "workload" in includes:
+        for user in users:
+            user["workload"] = {
+                "open": 0,
+                "by_status": {task_status.value: 0 for task_status in TaskStatus if task_status != TaskStatus.DONE},
+                "by_priority": {priority.value: 0 for priority in TaskPriority},
+            }
+        if by_id:
+            for assignee_id, task_status, priority, count in db.execute(
+                select(Tasks.assignee_id, Tasks.status, Tasks.priority, func.count())
+                .where(*open_tasks)
+                .group_by(Tasks.assignee_id, Tasks.status, Tasks.priority)
+            ):
+                workload = by_id[assignee_id]["workload"]
+                workload["open"] += count
+                workload["by_status"][task_status.value] += count
+                workload["by_priority"][priority.value] += count
+
+    if "tasks" in includes:
+        for user in users:
+            user["tasks"] = []
+        if by_id:
+            for assignee_id, *task in db.execute(
+                select(Tasks.assignee_id, Tasks.id, Tasks.title, Tasks.status, Tasks.priority, Tasks.rank)
+                .where(*open_tasks)
+                .order_by(Tasks.status, Tasks.rank, Tasks.id)
+            ):
+                by_id[assignee_id]["tasks"].append(dict(zip(("id", "title", "status", "priority", "rank"), task)))
+
+@router.get("", response_model=Union[GetUsersResponse, GetPartialUsersResponse, GetUsersWithWorkloadResponse])
 async def get_all_users(
+    q: Optional[str] = Query(None, min_length=1, description="Match users whose name, email or notes contain this text"),
+    role: Optional[UserRole] = None,
+    limit: Optional[int] = Query(None, ge=1, le=500, description="Page size; omit to return every matching user"),
+    cursor: Optional[str] = Query(None, description="`next_cursor` of the previous page"),
+    fields: Optional[str] = Query(
+        None,
+        description="Comma separated fields to return, or `compact` (default: all fields)",
+    ),
+    include: Optional[str] = Query(
+        None,
+        description="Comma separated extras: `tasks` (open tasks) and/or `workload` (open task counts)",
+    ),
     db: Session = Depends(get_db)
-) -> GetUsersResponse:
-    """Get all users"""
+) -> ORJSONResponse:
+    """Get users ordered by name, optionally filtered and paginated"""
     try:
-        db_users = db.query(Users).all()
-        
-        users = [UserWithId(
-            id=user.id,
-            name=user.name,
-            email=user.email,
-            notes=user.notes or "",
-            resume_id=user.resume_id,
-            role=user.role
-        ) for user in db_users]
+        try:
+            keys = parse_fields(fields, list(USER_LIST_FIELDS), USER_FIELD_PRESETS)
+            includes = parse_fields(include, USER_INCLUDES, always=()) if include else []
+            after = None
+            if cursor:
+                name, user_id = decode_cursor(cursor, (str, str))
+                after = (name, uuid.UUID(user_id))
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+
+        # Unrequested columns are never read from the database; the sort key
+        # is selected after them for the cursor and dropped by rows_to_dicts
+        query = db.query(*[USER_LIST_FIELDS[key] for key in keys], Users.name, Users.id)
+
+        if q:
+            # Substring matches are served by the trigram indexes
+            pattern = f"%{escape_like(q)}%"
+            query = query.filter(or_(
+                Users.name.ilike(pattern, escape="\\"),
+                Users.email.ilike(pattern, escape="\\"),
+                Users.notes.ilike(pattern, escape="\\"),
+            ))
+        if role:
+            query = query.filter(Users.role == role)
+        if after:
+            query = query.filter(tuple_(Users.name, Users.id) > after)
+        query = query.order_by(Users.name, Users.id)
+
+        if cursor and limit is None:
+            limit = DEFAULT_USER_PAGE_SIZE
+        if limit is None:
+            rows, next_cursor = query.all(), None
+        else:
+            # Fetch one extra row to know whether there is another page
+            rows = query.limit(limit + 1).all()
+            next_cursor = encode_cursor((rows[limit - 1][-2], str(rows[limit - 1][-1]))) if len(rows) > limit else None
+            rows = rows[:limit]
         
-        return GetUsersResponse(users=users)
+        # Encode the tuples directly instead of building and re-validating a
+        # UserWithId per row; the response model is kept for the schema only
+        users = rows_to_dicts(rows, keys)
+        if includes:
+            # A fixed number of queries for the whole page, whatever its size
+            attach_open_work(db, users, includes)
+        return ORJSONResponse({"users": users, "next_cursor": next_cursor})
     
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error retrieving users: {str(e)}")
         raise HTTPException(
@@ -121,16 +448,11 @@ async def get_user(
 ) -> GetUserResponse:
     """Get a specific user by ID"""
     try:
-        db_user = db.query(Users).filter(Users.id == request.user_id).first()
-        
-        if db_user is None:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="User not found"
-            )
-        
-        return GetUserResponse(
-            user=UserWithId(
+        def load_user() -> Optional[UserWithId]:
+            db_user = db.query(Users).filter(Users.id == request.user_id).first()
+            if db_user is None:
+                return None
+            return UserWithId(
                 id=db_user.id,
                 name=db_user.name,
                 email=db_user.email,
@@ -138,7 +460,17 @@ async def get_user(
                 resume_id=db_user.resume_id,
                 role=db_user.role
             )
-        )
+
+        # update_user and delete_user evict the entry on every worker
+        user = get_entity_cache().get_or_load(("user", request.user_id), load_user)
+        
+        if user is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="User not found"
+            )
+        
+        return GetUserResponse(user=user)
     
     except HTTPException:
         raise
@@ -167,12 +499,7 @@ async def update_user(
             )
         
         user_data = request.user
-        
-        # Check if resume ID is being changed
-        if user_data.resume_id and db_user.resume_id != user_data.resume_id:
-            # Delete the old resume if it exists
-            if db_user.resume_id:
-                minio_client.delete_file(db_user.resume_id)
+        old_resume_id = db_user.resume_id
         
         # Update user data
         db_user.name = user_data.name
@@ -181,8 +508,19 @@ async def update_user(
         db_user.resume_id = user_data.resume_id
         db_user.role = user_data.role
         
+        # Resumes can be shared by users with identical PDFs; the old one is
+        # only deleted once nobody points at it
+        released = None
+        if db_user.resume_id != old_resume_id:
+            db.flush()
+            acquire_resume(db, db_user.resume_id)
+            released = release_resume(db, old_resume_id)
+        
+        invalidate_entity(db, "user", db_user.id)
         db.commit()
         db.refresh(db_user)
+        if released is not None:
+            await discard_resume(released, minio_client)
         
         return UpdateUserResponse(
             user=UserWithId(
@@ -227,13 +565,15 @@ async def delete_user(
                 detail="User not found"
             )
         
-        # Delete the resume from MinIO if it exists
-        if db_user.resume_id:
-            minio_client.delete_file(db_user.resume_id)
-        
-        # Delete the user from the database
+        # Delete the user from the database, and their resume unless another
+        # user shares it
         db.delete(db_user)
+        db.flush()
+        released = release_resume(db, db_user.resume_id)
+        invalidate_entity(db, "user", db_user.id)
         db.commit()
+        if released is not None:
+            await discard_resume(released, minio_client)
         
         return Response(status_code=status.HTTP_204_NO_CONTENT)
     
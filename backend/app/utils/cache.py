@@ -0,0 +1,123 @@
+# Path: app/utils/cache.py
+# Description: In-process LRU/TTL cache for entity-by-id reads.
+
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Callable, Dict, Hashable, Optional
+from app.config import get_settings
+
+settings = get_settings()
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries also expire after a time to live"""
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Bumped by every invalidation so loads that raced with one are not cached
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value, or None when missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+                self.evictions += 1
+            self.misses += 1
+            return None
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None, generation: Optional[int] = None) -> None:
+        """
+        Store a value
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Time to live in seconds, defaults to the cache's
+            generation: Generation read before loading the value; the value is dropped
+                if anything was invalidated since, as it may be stale
+        Returns:
+            None
+        """
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._entries[key] = (time.monotonic() + (ttl or self.ttl_seconds), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Optional[Any]], ttl: Optional[float] = None) -> Optional[Any]:
+        """Read-through lookup; `None` results from the loader are not cached"""
+        value = self.get(key)
+        if value is not None:
+            return value
+        generation = self._generation
+        value = loader()
+        if value is not None:
+            self.set(key, value, ttl=ttl, generation=generation)
+        return value
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._generation += 1
+            self.invalidations += 1
+            self._entries.pop(key, None)
+
+    def invalidate_where(self, predicate: Callable[[Hashable], bool]) -> None:
+        with self._lock:
+            self._generation += 1
+            self.invalidations += 1
+            for key in [key for key in self._entries if predicate(key)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self.invalidations += 1
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+@lru_cache
+def get_entity_cache() -> TTLCache:
+    """Cache of single tasks and users keyed by `(kind, id)`"""
+    return TTLCache(settings.ENTITY_CACHE_MAX_ENTRIES, settings.ENTITY_CACHE_TTL_SECONDS)
+
+
+@lru_cache
+def get_download_link_cache() -> TTLCache:
+    """Presigned resume download URLs keyed by `(resume_id, expiration)`"""
+    return TTLCache(settings.DOWNLOAD_LINK_CACHE_MAX_ENTRIES, 60.0)
@@ -0,0 +1,121 @@
+# Path: app/utils/compression.py
+# Description: Transparent zlib compression of large text fields in MongoDB documents, primed with a shared dictionary.
+
+import zlib
+from typing import Any, Dict, Mapping, Optional
+from app.config import get_settings
+
+settings = get_settings()
+
+# Preset dictionary, so short bodies compress well without carrying their own
+# history. Strings that occur most often go last, where matches are cheapest.
+# Never edit a published dictionary: add a new version and keep the old one
+# for the documents already written with it.
+TEXT_DICTIONARY_V1 = (
+    "curriculum vitae objective references available upon request "
+    "certifications certified languages fluent native proficient "
+    "volunteer awards honors publications interests hobbies "
+    "bachelor of science master of science phd degree university college gpa "
+    "computer science engineering mathematics information technology "
+    "python java javascript typescript sql html css react node.js django fastapi "
+    "docker kubernetes aws azure google cloud linux git ci/cd terraform "
+    "postgresql mongodb redis kafka spark machine learning data analysis "
+    "agile scrum jira stakeholders cross-functional collaborated mentored "
+    "designed developed implemented maintained improved reduced increased led managed "
+    "built delivered optimized automated migrated launched owned "
+    "performance scalability reliability architecture microservices api apis "
+    "responsible for the development of and the design of "
+    "january february march april may june july august september october november december "
+    "present 2018 2019 2020 2021 2022 2023 2024 2025 2026 "
+    "software engineer senior software engineer developer full stack backend frontend "
+    "product manager project manager data scientist analyst designer intern "
+    "summary skills technical skills experience work experience professional experience "
+    "education projects contact email phone linkedin github "
+    "task tasks assign assigned assignee status priority high medium low "
+    "todo in progress in_progress review done due date description title "
+    "create a task update the task move the task to "
+    "I have created the task and assigned it to "
+    "Here are the tasks Here is the list of users "
+    "Could you please Can you please Sure, I can help with that. "
+    "with experience in and of the to in for with on at by from as is are "
+).encode("utf-8")
+
+# Leading byte of every compressed value -> the dictionary it was written with
+DICTIONARIES: Dict[int, bytes] = {
+    1: TEXT_DICTIONARY_V1,
+}
+CURRENT_VERSION = 1
+
+# Raw deflate: the version byte already identifies the format, so the zlib
+# header and checksum would only add six bytes to every value
+WINDOW_BITS = -15
+
+def compress_text(text: str) -> Optional[bytes]:
+    """
+    Compress a text body with the current dictionary
+    Args:
+        text: Text to store
+    Returns:
+        The version byte followed by the deflated text, or None when the text
+        is below the size threshold or would not get smaller
+    """
+    raw = text.encode("utf-8")
+    if len(raw) < settings.TEXT_COMPRESSION_MIN_BYTES:
+        return None
+    compressor = zlib.compressobj(
+        settings.TEXT_COMPRESSION_LEVEL,
+        zlib.DEFLATED,
+        WINDOW_BITS,
+        zdict=DICTIONARIES[CURRENT_VERSION],
+    )
+    packed = bytes([CURRENT_VERSION]) + compressor.compress(raw) + compressor.flush()
+    return packed if len(packed) < len(raw) else None
+
+def decompress_text(packed: bytes) -> str:
+    """
+    Restore a text body written by compress_text
+    Args:
+        packed: Stored value, version byte included
+    Returns:
+        The original text
+    Raises:
+        ValueError: If the value was written with an unknown dictionary
+    """
+    dictionary = DICTIONARIES.get(packed[0]) if packed else None
+    if dictionary is None:
+        raise ValueError("Unknown compressed text format")
+    decompressor = zlib.decompressobj(WINDOW_BITS, zdict=dictionary)
+    raw = decompressor.decompress(packed[1:]) + decompressor.flush()
+    return raw.decode("utf-8")
+
+def compressed_field(field: str) -> str:
+    """Name of the binary field that holds the compressed form of `field`"""
+    return f"{field}_z"
+
+def pack_text(field: str, text: str) -> Dict[str, Any]:
+    """
+    Document fields storing a text body, compressed when it is worth it
+    Args:
+        field: Field name readers look for, e.g. "text" or "content"
+        text: Text to store
+    Returns:
+        Either {field: text} or {field_z: compressed bytes}
+    """
+    packed = compress_text(text)
+    if packed is None:
+        return {field: text}
+    return {compressed_field(field): packed}
+
+def unpack_text(document: Mapping[str, Any], field: str) -> Optional[str]:
+    """
+    Read a text body stored by pack_text, or by code written before it
+    Args:
+        document: MongoDB document or sub-document
+        field: Field name passed to pack_text
+    Returns:
+        The text, or None if the document has neither form
+    """
+    packed = document.get(compressed_field(field))
+    if packed is not None:
+        return decompress_text(bytes(packed))
+    return document.get(field)
@@ -0,0 +1,56 @@
+# Path: app/utils/fanout.py
+# Description: In-process fan-out of messages from a single source to many subscriber queues.
+
+import asyncio
+from typing import Optional, Set
+
+# Delivered to a subscriber instead of regular messages when it may have missed some,
+# either because it fell behind or because the upstream source reconnected.
+RESYNC = None
+
+
+class FanoutHub:
+    """Fan out messages to every subscriber without blocking the publisher"""
+
+    def __init__(self, max_queue_size: int = 256):
+        self.max_queue_size = max_queue_size
+        self._subscribers: Set[asyncio.Queue] = set()
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def subscribe(self) -> asyncio.Queue:
+        """Register a new subscriber and return the queue it should read from"""
+        queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        """Remove a subscriber"""
+        self._subscribers.discard(queue)
+
+    def publish(self, message: Optional[str]) -> None:
+        """
+        Deliver a message to every subscriber
+        Args:
+            message: Message to deliver, or `RESYNC` to tell subscribers to resynchronise
+        Returns:
+            None
+        """
+        for queue in self._subscribers:
+            if message is RESYNC:
+                self._reset(queue)
+                continue
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                # A slow consumer must never hold up the others: drop its backlog
+                # and let it catch up from the change feed instead
+                self._reset(queue)
+
+    @staticmethod
+    def _reset(queue: asyncio.Queue) -> None:
+        while not queue.empty():
+            queue.get_nowait()
+        queue.put_nowait(RESYNC)
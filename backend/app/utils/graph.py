@@ -0,0 +1,136 @@
+# Path: app/utils/graph.py
+# Description: In-memory adjacency index of "blocked by" edges between tasks.
+
+from collections import defaultdict, deque
+from typing import Dict, Hashable, List, Set, Tuple
+
+
+class DependencyGraph:
+    """Directed graph where an edge `task -> blocker` means task is blocked by blocker"""
+
+    def __init__(self):
+        # both directions are kept so walks never scan the whole edge list
+        self._blockers: Dict[Hashable, Set[Hashable]] = defaultdict(set)
+        self._blocking: Dict[Hashable, Set[Hashable]] = defaultdict(set)
+        # nodes whose task is done; they no longer hold up other work
+        self._closed: Set[Hashable] = set()
+
+    @property
+    def edge_count(self) -> int:
+        return sum(len(blockers) for blockers in self._blockers.values())
+
+    @property
+    def node_count(self) -> int:
+        return len(self._blockers.keys() | self._blocking.keys())
+
+    def __contains__(self, node: Hashable) -> bool:
+        return node in self._blockers or node in self._blocking
+
+    def add_edge(self, task: Hashable, blocker: Hashable) -> None:
+        self._blockers[task].add(blocker)
+        self._blocking[blocker].add(task)
+
+    def remove_edge(self, task: Hashable, blocker: Hashable) -> None:
+        self._discard(self._blockers, task, blocker)
+        self._discard(self._blocking, blocker, task)
+
+    def remove_node(self, node: Hashable) -> None:
+        for blocker in self._blockers.pop(node, ()):
+            self._discard(self._blocking, blocker, node)
+        for task in self._blocking.pop(node, ()):
+            self._discard(self._blockers, task, node)
+        self._closed.discard(node)
+
+    def set_closed(self, node: Hashable, closed: bool) -> None:
+        if closed:
+            self._closed.add(node)
+        else:
+            self._closed.discard(node)
+
+    def would_create_cycle(self, task: Hashable, blocker: Hashable) -> bool:
+        """
+        Check whether adding `task -> blocker` would close a cycle
+        Args:
+            task: Task that would become blocked
+            blocker: Task that would block it
+        Returns:
+            True if blocker is already (transitively) blocked by task
+        """
+        if task == blocker:
+            return True
+        # Depth-first walk upstream from the blocker, visiting every node and edge at most once
+        seen = {blocker}
+        stack = [blocker]
+        while stack:
+            for upstream in self._blockers.get(stack.pop(), ()):
+                if upstream == task:
+                    return True
+                if upstream not in seen:
+                    seen.add(upstream)
+                    stack.append(upstream)
+        return False
+
+    def transitive_blockers(self, task: Hashable) -> List[Tuple[Hashable, int]]:
+        """
+        Every task that blocks `task`, directly or through other blockers
+        Returns:
+            `(blocker, depth)` pairs in breadth-first order, depth 1 being direct blockers
+        """
+        depths = {task: 0}
+        queue = deque([task])
+        result = []
+        while queue:
+            node = queue.popleft()
+            for blocker in self._blockers.get(node, ()):
+                if blocker not in depths:
+                    depths[blocker] = depths[node] + 1
+                    result.append((blocker, depths[blocker]))
+                    queue.append(blocker)
+        return result
+
+    def critical_path(self) -> List[Hashable]:
+        """
+        Longest chain of open tasks, ignoring edges to closed tasks
+        Returns:
+            The chain ordered from the first task to work on to the last
+        """
+        nodes = [node for node in self._blockers.keys() | self._blocking.keys() if node not in self._closed]
+        pending = {
+            node: sum(1 for blocker in self._blockers.get(node, ()) if blocker not in self._closed)
+            for node in nodes
+        }
+
+        # Kahn's algorithm: relax each node once all its open blockers are done
+        length = {node: 1 for node in nodes}
+        previous: Dict[Hashable, Hashable] = {}
+        ready = deque(node for node, count in pending.items() if count == 0)
+        while ready:
+            node = ready.popleft()
+            for task in self._blocking.get(node, ()):
+                if task in self._closed:
+                    continue
+                if length[node] + 1 > length[task]:
+                    length[task] = length[node] + 1
+                    previous[task] = node
+                pending[task] -= 1
+                if pending[task] == 0:
+                    ready.append(task)
+
+        if not length:
+            return []
+        node = max(length, key=length.get)
+        path = [node]
+        while node in previous:
+            node = previous[node]
+            path.append(node)
+        path.reverse()
+        return path
+
+    @staticmethod
+    def _discard(index: Dict[Hashable, Set[Hashable]], key: Hashable, value: Hashable) -> None:
+        values = index.get(key)
+        if values is None:
+            return
+        values.discard(value)
+        if not values:
+            del index[key]
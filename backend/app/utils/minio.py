@@ -1,5 +1,7 @@
 import uuid
+from datetime import timedelta
 from io import BytesIO
+from typing import BinaryIO, Optional, Tuple
 from functools import lru_cache
 from minio import Minio
 from minio.error import S3Error
@@ -63,20 +65,30 @@ class MinioClient:
     #     finally:
     #         await file.close()
 
-    async def upload_file_from_bytes(self, file_stream: BytesIO, file_size: int, original_filename: str = None) -> str:
-        """Upload file from BytesIO stream to MinIO and return the generated ID"""
+    def upload_pdf(self, file_stream: BinaryIO, file_size: int = -1) -> str:
+        """
+        Upload a PDF under a new ID; blocking, so run it in a thread from async code
+        Args:
+            file_stream: Readable stream with the file content
+            file_size: Size of the content in bytes, or -1 to stream it in
+                multipart chunks until the end of the stream
+        Returns:
+            The generated file ID
+        """
         try:
             # Generate a unique ID for the file
             file_id = str(uuid.uuid4())
             file_name = f"{file_id}.pdf"
             
-            # Upload the file to MinIO
+            # Upload the file to MinIO; at most one part is held in memory
             self.client.put_object(
                 self.bucket_name,
                 file_name,
                 file_stream,
                 file_size,
-                content_type="application/pdf"
+                content_type="application/pdf",
+                part_size=settings.RESUME_UPLOAD_PART_SIZE,
+                num_parallel_uploads=1
             )
             
             logger.info(f"Successfully uploaded file {file_name} to bucket {self.bucket_name}")
@@ -87,10 +99,12 @@ class MinioClient:
             raise
 
     def delete_file(self, file_id: str) -> bool:
-        """Delete a file from MinIO"""
+        """Delete a file and its previews from MinIO"""
         try:
             file_name = f"{file_id}.pdf"
             self.client.remove_object(self.bucket_name, file_name)
+            for preview in self.client.list_objects(self.bucket_name, prefix=f"{file_id}.preview"):
+                self.client.remove_object(self.bucket_name, preview.object_name)
             logger.info(f"Successfully deleted file {file_name} from bucket {self.bucket_name}")
             return True
         except S3Error as e:
@@ -112,7 +126,7 @@ class MinioClient:
             url = self.client.presigned_get_object(
                 self.bucket_name,
                 file_name,
-                expires=expires
+                expires=timedelta(seconds=expires)
             )
             logger.info(f"Generated download link for file {file_name}")
             return url
@@ -140,6 +154,101 @@ class MinioClient:
             logger.error(f"Error retrieving file from MinIO: {e}")
             raise
 
+    def stat_file(self, file_id: str) -> Tuple[int, str]:
+        """
+        Get the size and ETag of a file without downloading it
+        Args:
+            file_id: The ID of the file
+        Returns:
+            Size in bytes and ETag
+        """
+        try:
+            stat = self.client.stat_object(self.bucket_name, f"{file_id}.pdf")
+            return stat.size, stat.etag
+        except S3Error as e:
+            logger.error(f"Error retrieving file metadata from MinIO: {e}")
+            raise
+
+    def open_file(self, file_id: str, offset: int = 0, length: int = 0):
+        """
+        Open a file, or a byte range of it, for streaming
+        Args:
+            file_id: The ID of the file
+            offset: First byte to read
+            length: Number of bytes to read, 0 for up to the end
+        Returns:
+            The unread HTTP response; the caller must close it and release
+            its connection
+        """
+        try:
+            return self.client.get_object(self.bucket_name, f"{file_id}.pdf", offset=offset, length=length)
+        except S3Error as e:
+            logger.error(f"Error retrieving file from MinIO: {e}")
+            raise
+
+    def download_file(self, file_id: str, path: str) -> None:
+        """
+        Download a file from MinIO to a local path, streaming it to disk
+        Args:
+            file_id: The ID of the file
+            path: Where to write it
+        """
+        try:
+            self.client.fget_object(self.bucket_name, f"{file_id}.pdf", path)
+        except S3Error as e:
+            logger.error(f"Error retrieving file from MinIO: {e}")
+            raise
+
+    def upload_preview(self, file_id: str, width: int, image: bytes) -> None:
+        """Store a preview image of a file next to it, replacing any previous one of that width"""
+        try:
+            self.client.put_object(
+                self.bucket_name,
+                self.preview_name(file_id, width),
+                BytesIO(image),
+                len(image),
+                content_type="image/jpeg"
+            )
+        except S3Error as e:
+            logger.error(f"Error uploading preview to MinIO: {e}")
+            raise
+
+    def get_preview(self, file_id: str, width: int) -> Optional[Tuple[bytes, str]]:
+        """
+        Get a stored preview image of a file
+        Args:
+            file_id: The ID of the file
+            width: Width of the preview in pixels
+        Returns:
+            The JPEG and its ETag, or None if no preview of that width has been rendered
+        """
+        try:
+            response = self.client.get_object(self.bucket_name, self.preview_name(file_id, width))
+        except S3Error as e:
+            if e.code == "NoSuchKey":
+                return None
+            logger.error(f"Error retrieving preview from MinIO: {e}")
+            raise
+        try:
+            return response.read(), response.headers.get("ETag", "").strip('"')
+        finally:
+            response.close()
+            response.release_conn()
+
+    def stat_preview(self, file_id: str, width: int) -> Optional[str]:
+        """ETag of a stored preview image, without downloading it; None if there is none"""
+        try:
+            return self.client.stat_object(self.bucket_name, self.preview_name(file_id, width)).etag
+        except S3Error as e:
+            if e.code == "NoSuchKey":
+                return None
+            logger.error(f"Error retrieving preview from MinIO: {e}")
+            raise
+
+    @staticmethod
+    def preview_name(file_id: str, width: int) -> str:
+        return f"{file_id}.preview.{width}.jpg"
+
 @lru_cache
 def get_minio_client():
     return MinioClient()
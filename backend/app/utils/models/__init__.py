@@ -7,15 +7,32 @@ from .users import (
     GetUserRequest,
     GetUserResponse,
     GetUsersResponse,
+    PartialUser,
+    GetPartialUsersResponse,
     UpdateUserRequest,
     UpdateUserResponse,
     DeleteUserRequest,
+    ImportUserRecord,
+    ImportUserError,
+    ImportedUser,
+    ImportUsersResponse,
     GetUserRolesResponse
 )
 from .resume import (
+    ResumeStatus,
+    ResumeStage,
     ResumeUploadResponse,
+    BatchResumeResult,
+    BatchUploadResumesResponse,
+    ResumeStatusResponse,
     ResumeDownloadLinkRequest,
     ResumeDownloadLinkResponse,
+    ResumeDownloadLinksRequest,
+    ResumeDownloadLink,
+    ResumeDownloadLinksResponse,
+    ResumeSearchUser,
+    ResumeSearchResult,
+    SearchResumesResponse,
 )
 from .kanban import (
     TaskStatus,
@@ -26,14 +43,39 @@ from .kanban import (
     CreateTaskRequest,
     CreateTaskResponse,
     GetTasksResponse,
+    PartialTask,
+    GetPartialTasksResponse,
     GetTaskRequest,
     GetTaskResponse,
     DeleteTaskRequest,
+    TaskChange,
+    GetTaskChangesResponse,
+    TaskSearchResult,
+    SearchTasksResponse,
+    TaskExportFormat,
+    ImportTaskRecord,
+    ImportTaskError,
+    ImportTasksResponse,
+    AddTaskDependencyRequest,
+    TaskDependency,
+    TaskBlocker,
+    GetTaskBlockersResponse,
+    GetCriticalPathResponse,
+    TaskEventType,
+    BurndownPoint,
+    GetBurndownResponse,
+    CycleTimePoint,
+    GetCycleTimeResponse,
+    BoardAssignee,
+    BoardCard,
+    BoardColumn,
+    GetBoardResponse,
     UpdateTaskStatusRequest,
     UpdateTaskAssigneeRequest,
     UpdateTaskPriorityRequest,
     UpdateTaskTitleRequest,
     UpdateTaskDescriptionRequest,
+    MoveTaskRequest,
 )
 from .assistant import (
     Message,
@@ -41,6 +83,12 @@ from .assistant import (
     ChatResponse,
     GetChatHistoryResponse,
 )
+from .workload import (
+    UserTaskSummary,
+    UserWorkload,
+    UserWithWorkload,
+    GetUsersWithWorkloadResponse,
+)
 
 __all__ = [
     "UserRole",
@@ -51,14 +99,31 @@ __all__ = [
     "GetUserRequest",
     "GetUserResponse",
     "GetUsersResponse",
+    "PartialUser",
+    "GetPartialUsersResponse",
     "UpdateUserRequest",
     "UpdateUserResponse",
     "DeleteUserRequest",
+    "ImportUserRecord",
+    "ImportUserError",
+    "ImportedUser",
+    "ImportUsersResponse",
     "GetUserRolesResponse",
 
+    "ResumeStatus",
+    "ResumeStage",
     "ResumeUploadResponse",
+    "BatchResumeResult",
+    "BatchUploadResumesResponse",
+    "ResumeStatusResponse",
     "ResumeDownloadLinkRequest",
     "ResumeDownloadLinkResponse",
+    "ResumeDownloadLinksRequest",
+    "ResumeDownloadLink",
+    "ResumeDownloadLinksResponse",
+    "ResumeSearchUser",
+    "ResumeSearchResult",
+    "SearchResumesResponse",
 
     "TaskStatus",
     "TaskPriority",
@@ -68,17 +133,47 @@ __all__ = [
     "CreateTaskRequest",
     "CreateTaskResponse",
     "GetTasksResponse",
+    "PartialTask",
+    "GetPartialTasksResponse",
     "GetTaskRequest",
     "GetTaskResponse",
     "DeleteTaskRequest",
+    "TaskChange",
+    "GetTaskChangesResponse",
+    "TaskSearchResult",
+    "SearchTasksResponse",
+    "TaskExportFormat",
+    "ImportTaskRecord",
+    "ImportTaskError",
+    "ImportTasksResponse",
+    "AddTaskDependencyRequest",
+    "TaskDependency",
+    "TaskBlocker",
+    "GetTaskBlockersResponse",
+    "GetCriticalPathResponse",
+    "TaskEventType",
+    "BurndownPoint",
+    "GetBurndownResponse",
+    "CycleTimePoint",
+    "GetCycleTimeResponse",
+    "BoardAssignee",
+    "BoardCard",
+    "BoardColumn",
+    "GetBoardResponse",
     "UpdateTaskStatusRequest",
     "UpdateTaskAssigneeRequest",
     "UpdateTaskPriorityRequest",
     "UpdateTaskTitleRequest",
     "UpdateTaskDescriptionRequest",
+    "MoveTaskRequest",
 
     "Message",
     "ChatRequest",
     "ChatResponse",
     "GetChatHistoryResponse",
+
+    "UserTaskSummary",
+    "UserWorkload",
+    "UserWithWorkload",
+    "GetUsersWithWorkloadResponse",
 ]
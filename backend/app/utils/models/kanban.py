@@ -1,8 +1,10 @@
 import uuid
-from typing import List
+from datetime import date
+from typing import List, Optional
 from enum import Enum
 from pydantic import BaseModel
 from fastapi import Path
+from .users import UserRole
 
 class TaskStatus(str, Enum):
     TODO = "todo"
@@ -24,6 +26,8 @@ class TaskBase(BaseModel):
 
 class TaskWithId(TaskBase):
     id: uuid.UUID
+    # position of the card inside its status column; sort ascending
+    rank: str
 
 class TaskWithoutId(TaskBase):
     pass
@@ -38,6 +42,19 @@ class CreateTaskResponse(BaseModel):
 class GetTasksResponse(BaseModel):
     tasks: List[TaskWithId]
 
+class PartialTask(BaseModel):
+    # returned when `fields=` trims the listing; unrequested fields are omitted
+    id: uuid.UUID
+    title: Optional[str] = None
+    description: Optional[str] = None
+    assignee_id: Optional[uuid.UUID] = None
+    status: Optional[TaskStatus] = None
+    priority: Optional[TaskPriority] = None
+    rank: Optional[str] = None
+
+class GetPartialTasksResponse(BaseModel):
+    tasks: List[PartialTask]
+
 class GetTaskRequest(BaseModel):
     task_id: uuid.UUID
     
@@ -61,6 +78,121 @@ class DeleteTaskRequest(BaseModel):
     ):
         return cls(task_id=task_id)
 
+class TaskChange(TaskWithId):
+    version: int
+
+class GetTaskChangesResponse(BaseModel):
+    # tasks created or updated since the requested version
+    tasks: List[TaskChange]
+    # ids of tasks deleted since the requested version
+    deleted_task_ids: List[uuid.UUID]
+    # high-water mark to pass as `since` on the next poll; it trails the
+    # oldest running transaction, so it is not the newest task version
+    version: int
+    has_more: bool
+
+class TaskSearchResult(TaskWithId):
+    score: float
+
+class SearchTasksResponse(BaseModel):
+    tasks: List[TaskSearchResult]
+    has_more: bool
+
+class TaskExportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+class ImportTaskRecord(TaskWithoutId):
+    # optional so that an export can be imported back with the same ids
+    id: Optional[uuid.UUID] = None
+
+class ImportTaskError(BaseModel):
+    line: int
+    error: str
+
+class ImportTasksResponse(BaseModel):
+    imported: int
+    failed: int
+    # capped, see `failed` for the full count
+    errors: List[ImportTaskError]
+
+class AddTaskDependencyRequest(BaseModel):
+    blocker_id: uuid.UUID
+
+class TaskDependency(BaseModel):
+    task_id: uuid.UUID
+    blocker_id: uuid.UUID
+
+class TaskBlocker(TaskWithId):
+    # 1 for direct blockers, 2 for their blockers and so on
+    depth: int
+
+class GetTaskBlockersResponse(BaseModel):
+    blockers: List[TaskBlocker]
+
+class GetCriticalPathResponse(BaseModel):
+    # ordered from the first task to work on to the last
+    tasks: List[TaskWithId]
+
+class TaskEventType(str, Enum):
+    CREATED = "created"
+    IMPORTED = "imported"
+    UPDATED = "updated"
+    STATUS_CHANGED = "status_changed"
+    MOVED = "moved"
+    ASSIGNEE_CHANGED = "assignee_changed"
+    PRIORITY_CHANGED = "priority_changed"
+    TITLE_CHANGED = "title_changed"
+    DESCRIPTION_CHANGED = "description_changed"
+    DELETED = "deleted"
+
+class BurndownPoint(BaseModel):
+    # number of tasks in each column at the end of the day (UTC)
+    day: date
+    todo: int
+    in_progress: int
+    review: int
+    done: int
+    # tasks not done yet
+    remaining: int
+
+class GetBurndownResponse(BaseModel):
+    points: List[BurndownPoint]
+
+class CycleTimePoint(BaseModel):
+    day: date
+    completed: int
+    average_seconds: Optional[float]
+    max_seconds: Optional[float]
+
+class GetCycleTimeResponse(BaseModel):
+    points: List[CycleTimePoint]
+    # over the whole range
+    completed: int
+    average_seconds: Optional[float]
+
+class BoardAssignee(BaseModel):
+    id: uuid.UUID
+    name: str
+    role: UserRole
+
+class BoardCard(BaseModel):
+    id: uuid.UUID
+    title: str
+    status: TaskStatus
+    priority: TaskPriority
+    rank: str
+    assignee: Optional[BoardAssignee]
+
+class BoardColumn(BaseModel):
+    status: TaskStatus
+    # number of matching cards in the column, including those beyond the limit
+    total: int
+    tasks: List[BoardCard]
+
+class GetBoardResponse(BaseModel):
+    columns: List[BoardColumn]
+
 class UpdateTaskStatusRequest(BaseModel):
     status: TaskStatus
 
@@ -75,3 +207,11 @@ class UpdateTaskTitleRequest(BaseModel):
 
 class UpdateTaskDescriptionRequest(BaseModel):
     description: str
+
+class MoveTaskRequest(BaseModel):
+    # target column, defaults to the task's current status
+    status: Optional[TaskStatus] = None
+    # card that should end up directly above the moved one
+    previous_id: Optional[uuid.UUID] = None
+    # card that should end up directly below the moved one
+    next_id: Optional[uuid.UUID] = None
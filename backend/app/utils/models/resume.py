@@ -1,20 +1,102 @@
-from pydantic import BaseModel, AnyHttpUrl
+import uuid
+from datetime import datetime
+from enum import Enum
+from typing import List, Optional
+from pydantic import BaseModel, AnyHttpUrl, Field
 from fastapi import Path, Query
+from .users import UserRole
+
+class ResumeStatus(str, Enum):
+    PROCESSING = "processing"
+    READY = "ready"
+    FAILED = "failed"
+
+class ResumeStage(str, Enum):
+    # last completed ingestion stage, in order
+    UPLOADED = "uploaded"
+    INDEXED = "indexed"
+    THUMBNAILED = "thumbnailed"
 
 class ResumeUploadResponse(BaseModel):
     resume_id: str
+    status: ResumeStatus
+    # an identical PDF was already stored; its resume is returned
+    duplicate: bool = False
+
+class BatchResumeResult(BaseModel):
+    # uploaded file name, or path inside the archive
+    file: str
+    resume_id: Optional[uuid.UUID] = None
+    status: Optional[ResumeStatus] = None
+    duplicate: bool = False
+    error: Optional[str] = None
+
+class BatchUploadResumesResponse(BaseModel):
+    uploaded: int
+    duplicates: int
+    failed: int
+    # in request order, archive entries after the plain files
+    results: List[BatchResumeResult]
+
+class ResumeStatusResponse(BaseModel):
+    resume_id: uuid.UUID
+    status: ResumeStatus
+    stage: ResumeStage
+    attempts: int
+    # last error, kept while retrying and when a ready resume has no previews
+    error: Optional[str]
+    updated_at: datetime
+
+# Presigned URLs are valid for at most a week
+MAX_DOWNLOAD_LINK_EXPIRATION = 7 * 24 * 3600
 
 class ResumeDownloadLinkRequest(BaseModel):
-    resume_id: str
+    resume_id: uuid.UUID
     expiration: int = 3600
 
     @classmethod
     def query_params(
         cls,
-        resume_id: str = Path(..., title="Resume ID", description="The ID of the resume to retrieve"),
-        expiration: int = Query(3600, title="Expiration", description="Link expiration time in seconds (default 1 hour)")
+        resume_id: uuid.UUID = Path(..., title="Resume ID", description="The ID of the resume to retrieve"),
+        expiration: int = Query(
+            3600,
+            ge=60,
+            le=MAX_DOWNLOAD_LINK_EXPIRATION,
+            title="Expiration",
+            description="Link expiration time in seconds (default 1 hour)"
+        )
     ):
         return cls(resume_id=resume_id, expiration=expiration)
 
 class ResumeDownloadLinkResponse(BaseModel):
     download_link: AnyHttpUrl
+
+class ResumeDownloadLinksRequest(BaseModel):
+    resume_ids: List[uuid.UUID] = Field(..., max_length=500)
+    expiration: int = Field(3600, ge=60, le=MAX_DOWNLOAD_LINK_EXPIRATION)
+
+class ResumeDownloadLink(BaseModel):
+    resume_id: uuid.UUID
+    download_link: AnyHttpUrl
+
+class ResumeDownloadLinksResponse(BaseModel):
+    links: List[ResumeDownloadLink]
+    # requested IDs with no such resume
+    missing: List[uuid.UUID]
+
+class ResumeSearchUser(BaseModel):
+    id: uuid.UUID
+    name: str
+    email: str
+    role: UserRole
+
+class ResumeSearchResult(BaseModel):
+    resume_id: uuid.UUID
+    skills: List[str]
+    # text search relevance, when searching with q
+    score: Optional[float] = None
+    # users with this resume; several when they uploaded the same PDF
+    users: List[ResumeSearchUser]
+
+class SearchResumesResponse(BaseModel):
+    results: List[ResumeSearchResult]
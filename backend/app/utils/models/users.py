@@ -1,7 +1,7 @@
 import uuid
 from pydantic import BaseModel, EmailStr
 from fastapi import Path
-from typing import List
+from typing import List, Optional
 from enum import Enum
 
 class UserRole(str, Enum):
@@ -35,6 +35,21 @@ class CreateUserResponse(BaseModel):
 
 class GetUsersResponse(BaseModel):
     users: List[UserWithId]
+    # pass as `cursor` to get the next page; null on the last page or when not paginating
+    next_cursor: Optional[str] = None
+
+class PartialUser(BaseModel):
+    # returned when `fields=` trims the listing; unrequested fields are omitted
+    id: uuid.UUID
+    name: Optional[str] = None
+    email: Optional[EmailStr] = None
+    notes: Optional[str] = None
+    resume_id: Optional[uuid.UUID] = None
+    role: Optional[UserRole] = None
+
+class GetPartialUsersResponse(BaseModel):
+    users: List[PartialUser]
+    next_cursor: Optional[str] = None
 
 class GetUserRequest(BaseModel):
     user_id: uuid.UUID
@@ -68,5 +83,30 @@ class DeleteUserRequest(BaseModel):
     ):
         return cls(user_id=user_id)
 
+class ImportUserRecord(BaseModel):
+    name: str
+    email: EmailStr
+    notes: str = ""
+    role: UserRole
+    # exactly one of: a PDF inside the uploaded archive, or an already uploaded resume
+    resume_file: Optional[str] = None
+    resume_id: Optional[uuid.UUID] = None
+
+class ImportUserError(BaseModel):
+    line: int
+    error: str
+
+class ImportedUser(BaseModel):
+    line: int
+    user_id: uuid.UUID
+    resume_id: uuid.UUID
+
+class ImportUsersResponse(BaseModel):
+    imported: int
+    failed: int
+    users: List[ImportedUser]
+    # capped, see `failed` for the full count
+    errors: List[ImportUserError]
+
 class GetUserRolesResponse(BaseModel):
     roles: List[str]
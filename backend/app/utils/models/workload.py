@@ -0,0 +1,27 @@
+import uuid
+from typing import Dict, List, Optional
+from pydantic import BaseModel
+from .users import PartialUser
+from .kanban import TaskStatus, TaskPriority
+
+class UserTaskSummary(BaseModel):
+    id: uuid.UUID
+    title: str
+    status: TaskStatus
+    priority: TaskPriority
+    rank: str
+
+class UserWorkload(BaseModel):
+    # counts of the user's tasks that are not done
+    open: int
+    by_status: Dict[TaskStatus, int]
+    by_priority: Dict[TaskPriority, int]
+
+class UserWithWorkload(PartialUser):
+    # present when requested with `include=`
+    tasks: Optional[List[UserTaskSummary]] = None
+    workload: Optional[UserWorkload] = None
+
+class GetUsersWithWorkloadResponse(BaseModel):
+    users: List[UserWithWorkload]
+    next_cursor: Optional[str] = None
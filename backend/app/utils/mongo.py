@@ -0,0 +1,29 @@
+# Path: app/utils/mongo.py
+# Description: Shared MongoDB client, collections and their indexes.
+
+from functools import lru_cache
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorCollection
+from pymongo import ASCENDING, TEXT
+from app.config import get_settings
+
+settings = get_settings()
+
+@lru_cache
+def get_mongo_client() -> AsyncIOMotorClient:
+    return AsyncIOMotorClient(settings.get_mongo_uri())
+
+def get_resumes_collection() -> AsyncIOMotorCollection:
+    return get_mongo_client()[settings.MONGO_DB][settings.MONGO_COLLECTION_RESUMES]
+
+async def ensure_resume_indexes() -> None:
+    """Create the resume search indexes; a no-op once they exist"""
+    collection = get_resumes_collection()
+    # Multikey indexes, one entry per array element
+    await collection.create_index([("skills", ASCENDING)], name="skills")
+    await collection.create_index([("keywords", ASCENDING)], name="keywords")
+    # A collection has a single text index; the one over the full body went
+    # away when the body started being stored compressed
+    indexes = await collection.index_information()
+    if "text" in indexes:
+        await collection.drop_index("text")
+    await collection.create_index([("terms", TEXT)], name="terms", default_language="english")
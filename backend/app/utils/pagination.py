@@ -0,0 +1,43 @@
+# Path: app/utils/pagination.py
+# Description: Opaque cursors for keyset pagination.
+
+import base64
+from typing import Any, List, Sequence
+import orjson
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """
+    Encode the sort key of the last returned row as an opaque cursor
+    Args:
+        values: Sort key columns of the row, JSON serialisable by orjson
+    Returns:
+        URL-safe cursor string
+    """
+    return base64.urlsafe_b64encode(orjson.dumps(list(values))).decode("ascii").rstrip("=")
+
+def decode_cursor(cursor: str, types: Sequence[type]) -> List[Any]:
+    """
+    Decode a cursor produced by `encode_cursor`
+    Args:
+        cursor: Cursor string from a previous page
+        types: Expected JSON type of each sort key column, e.g. (str, int)
+    Returns:
+        The sort key values
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        values = orjson.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (ValueError, orjson.JSONDecodeError):
+        raise ValueError("Invalid cursor")
+    # Cursors come back from clients; a tampered one must not reach the query
+    # with values the caller cannot handle
+    if not isinstance(values, list) or len(values) != len(types):
+        raise ValueError("Invalid cursor")
+    if not all(isinstance(value, expected) for value, expected in zip(values, types)):
+        raise ValueError("Invalid cursor")
+    return values
+
+def escape_like(text: str, escape: str = "\\") -> str:
+    """Escape LIKE wildcards so user input matches literally"""
+    return text.replace(escape, escape * 2).replace("%", escape + "%").replace("_", escape + "_")
@@ -0,0 +1,115 @@
+# Path: app/utils/pdf.py
+# Description: CPU-bound PDF work, run inside worker processes; keep imports light.
+
+import io
+import math
+from itertools import islice
+from typing import Dict, List, Optional
+import PyPDF2
+from pdf2image import convert_from_path
+from pdf2image.exceptions import PDFPopplerTimeoutError
+from PIL import Image
+from app.utils.skills import analyze_resume_text
+
+def extract_pdf_text(path: str, max_pages: int) -> str:
+    """
+    Extract the text of the first pages of a PDF
+    Args:
+        path: Path of the PDF file, read lazily page by page
+        max_pages: Pages after this one are ignored
+    Returns:
+        Page texts, one line break after each page
+    """
+    pdf_reader = PyPDF2.PdfReader(path)
+    return "".join(page.extract_text() + "\n" for page in islice(pdf_reader.pages, max_pages))
+
+def extract_resume_fields(path: str, max_pages: int) -> Dict:
+    """
+    Extract the text of a resume along with its normalised skills and keywords
+    Args:
+        path: Path of the PDF file
+        max_pages: Pages after this one are ignored
+    Returns:
+        The `text`, `skills`, `keywords` and `terms` fields of the resume document
+    """
+    text = extract_pdf_text(path, max_pages)
+    return {"text": text, **analyze_resume_text(text)}
+
+def _render_first_page(
+    path: str,
+    width: Optional[int],
+    dpi: Optional[int],
+    max_pixels: int,
+    timeout: float,
+) -> Image.Image:
+    # Size the render from the page box before poppler allocates anything,
+    # shrinking it to stay under max_pixels
+    box = PyPDF2.PdfReader(path).pages[0].mediabox
+    page_width, page_height = float(box.width), float(box.height)
+    if width:
+        pixels = width * width * page_height / page_width
+    else:
+        pixels = (page_width * dpi / 72) * (page_height * dpi / 72)
+    scale = min(1.0, math.sqrt(max_pixels / pixels))
+
+    # A single page straight at the target size; the timeout kills poppler
+    # rather than leaving it running after the caller has given up
+    options = dict(first_page=1, last_page=1, single_file=True, timeout=timeout)
+    try:
+        if width:
+            images = convert_from_path(path, size=(max(1, int(width * scale)), None), **options)
+        else:
+            images = convert_from_path(path, dpi=max(1, int(dpi * scale)), **options)
+    except PDFPopplerTimeoutError:
+        raise TimeoutError(f"Rendering did not finish in {timeout}s")
+    if not images:
+        raise ValueError("The PDF has no pages")
+    return images[0].convert("RGB")
+
+def _encode_jpeg(image: Image.Image) -> bytes:
+    output = io.BytesIO()
+    image.save(output, format="JPEG", quality=85, optimize=True)
+    return output.getvalue()
+
+def render_page_jpeg(
+    path: str,
+    width: Optional[int],
+    dpi: Optional[int],
+    max_pixels: int,
+    timeout: float,
+) -> bytes:
+    """
+    Render the first page of a PDF as a JPEG at a requested size
+    Args:
+        path: Path of the PDF file
+        width: Width of the image in pixels, the height follows the page
+        dpi: Resolution to render at, used when no width is given
+        max_pixels: Larger renders are scaled down to this many pixels
+        timeout: Seconds poppler may take
+    Returns:
+        The encoded image
+    """
+    return _encode_jpeg(_render_first_page(path, width, dpi, max_pixels, timeout))
+
+def render_preview_jpegs(path: str, widths: List[int], max_pixels: int, timeout: float) -> Dict[int, bytes]:
+    """
+    Render the first page of a PDF as JPEGs in several sizes
+    Args:
+        path: Path of the PDF file
+        widths: Widths of the images in pixels, the heights follow the page
+        max_pixels: Larger renders are scaled down to this many pixels
+        timeout: Seconds poppler may take
+    Returns:
+        The encoded image for each width
+    """
+    # Rasterise once at the largest size and downscale, rather than running
+    # poppler per size
+    page = _render_first_page(path, max(widths), None, max_pixels, timeout)
+
+    previews = {}
+    for width in widths:
+        image = page
+        if width < page.width:
+            image = page.resize((width, max(1, round(page.height * width / page.width))), Image.LANCZOS)
+        previews[width] = _encode_jpeg(image)
+    return previews
@@ -2,12 +2,100 @@ from .schema import (
     Users,
     Tasks,
     ResumeUploads,
+    TaskTombstones,
+    TaskSyncHorizon,
+    TaskDependencies,
+    TaskEvents,
+    TaskStatusDailyFlow,
+    TaskCycleTimeDaily,
 )
 from .base import get_db
+from .search import search_tasks
+from .ranking import (
+    RANK_REBALANCE_LENGTH,
+    lock_task_columns,
+    next_rank_in_column,
+    rank_between_neighbours,
+    rebalance_task_column,
+)
+from .notify import (
+    TASK_CHANGES_CHANNEL,
+    ENTITY_CACHE_CHANNEL,
+    notify,
+    publish_task_change,
+    invalidate_on_commit,
+    invalidate_entity,
+    clear_entity_cache,
+    handle_entity_cache_notification,
+    handle_task_change_notification,
+    get_postgres_listener,
+    get_task_change_hub,
+)
+from .dependencies import (
+    DEPENDENCY_CHANGES_CHANNEL,
+    add_task_dependency,
+    remove_task_dependency,
+    get_dependency_index,
+)
+from .events import (
+    record_task_event,
+    record_imported_task_events,
+)
+from .sync import (
+    current_sync_horizon,
+    pruned_sync_horizon,
+    tombstone_tasks,
+    prune_task_tombstones,
+    run_tombstone_pruning,
+)
+from .resume_references import (
+    find_resume_by_hash,
+    insert_resume_uploads,
+    acquire_resume,
+    release_resume,
+)
 
 __all__ = [
     "Users",
     "Tasks",
     "ResumeUploads",
+    "TaskTombstones",
+    "TaskSyncHorizon",
+    "TaskDependencies",
+    "TaskEvents",
+    "TaskStatusDailyFlow",
+    "TaskCycleTimeDaily",
     "get_db",
+    "search_tasks",
+    "RANK_REBALANCE_LENGTH",
+    "lock_task_columns",
+    "next_rank_in_column",
+    "rank_between_neighbours",
+    "rebalance_task_column",
+    "TASK_CHANGES_CHANNEL",
+    "ENTITY_CACHE_CHANNEL",
+    "notify",
+    "publish_task_change",
+    "invalidate_on_commit",
+    "invalidate_entity",
+    "clear_entity_cache",
+    "handle_entity_cache_notification",
+    "handle_task_change_notification",
+    "get_postgres_listener",
+    "get_task_change_hub",
+    "DEPENDENCY_CHANGES_CHANNEL",
+    "add_task_dependency",
+    "remove_task_dependency",
+    "get_dependency_index",
+    "record_task_event",
+    "record_imported_task_events",
+    "current_sync_horizon",
+    "pruned_sync_horizon",
+    "tombstone_tasks",
+    "prune_task_tombstones",
+    "run_tombstone_pruning",
+    "find_resume_by_hash",
+    "insert_resume_uploads",
+    "acquire_resume",
+    "release_resume",
 ]
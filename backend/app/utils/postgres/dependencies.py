@@ -0,0 +1,208 @@
+# Path: app/utils/postgres/dependencies.py
+# Description: Task dependency edges and the per-worker graph index built from them.
+
+import json
+import uuid
+from functools import lru_cache
+from typing import Optional
+from sqlalchemy import event, exists, func, select, union
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+from app.logger import get_logger
+from app.utils.fanout import RESYNC
+from app.utils.graph import DependencyGraph
+from app.utils.models import TaskStatus
+from .base import Session as SessionLocal
+from .schema import Tasks, TaskDependencies
+from .notify import notify
+
+logger = get_logger()
+
+DEPENDENCY_CHANGES_CHANNEL = "task_dependencies"
+
+# Transaction-level advisory lock serialising edge inserts, so two requests
+# cannot each pass the cycle check with the two halves of a cycle
+DEPENDENCY_LOCK_KEY = 0x74646570
+
+def add_task_dependency(db: Session, task: Tasks, blocker: Tasks) -> bool:
+    """
+    Record that a task is blocked by another task
+    Args:
+        db: Database session, committed by the caller
+        task: Task that is blocked
+        blocker: Task blocking it
+    Returns:
+        False if the edge already existed
+    Raises:
+        ValueError: If the edge would create a cycle
+    """
+    if task.id == blocker.id:
+        raise ValueError("A task cannot block itself")
+
+    # The worker's graph may lag edges removed by other workers, so it only
+    # picks out likely cycles; those are confirmed against the table without
+    # queueing on the lock below
+    if get_dependency_index().get(db).would_create_cycle(task.id, blocker.id) and \
+            _reaches_upstream(db, blocker.id, task.id):
+        raise ValueError("The dependency would create a cycle")
+
+    db.execute(select(func.pg_advisory_xact_lock(DEPENDENCY_LOCK_KEY)))
+    if _reaches_upstream(db, blocker.id, task.id):
+        raise ValueError("The dependency would create a cycle")
+
+    inserted = db.execute(
+        insert(TaskDependencies)
+        .values(task_id=task.id, blocker_id=blocker.id)
+        .on_conflict_do_nothing()
+        .returning(TaskDependencies.task_id)
+    ).first()
+    if inserted is None:
+        return False
+
+    _publish_dependency_change(db, {
+        "op": "add",
+        "task_id": str(task.id),
+        "blocker_id": str(blocker.id),
+        "task_done": task.status == TaskStatus.DONE,
+        "blocker_done": blocker.status == TaskStatus.DONE,
+    })
+    return True
+
+def remove_task_dependency(db: Session, task_id: uuid.UUID, blocker_id: uuid.UUID) -> bool:
+    """
+    Remove a dependency edge
+    Args:
+        db: Database session, committed by the caller
+        task_id: Blocked task
+        blocker_id: Blocking task
+    Returns:
+        False if there was no such edge
+    """
+    deleted = db.execute(
+        TaskDependencies.__table__.delete()
+        .where(TaskDependencies.task_id == task_id, TaskDependencies.blocker_id == blocker_id)
+        .returning(TaskDependencies.task_id)
+    ).first()
+    if deleted is None:
+        return False
+
+    _publish_dependency_change(db, {
+        "op": "remove",
+        "task_id": str(task_id),
+        "blocker_id": str(blocker_id),
+    })
+    return True
+
+def _reaches_upstream(db: Session, start_id: uuid.UUID, target_id: uuid.UUID) -> bool:
+    # Walk everything upstream of start; UNION drops rows already seen, so
+    # each task and edge is visited at most once
+    upstream = (
+        select(TaskDependencies.blocker_id.label("id"))
+        .where(TaskDependencies.task_id == start_id)
+        .cte("upstream", recursive=True)
+    )
+    upstream = upstream.union(
+        select(TaskDependencies.blocker_id)
+        .join(upstream, TaskDependencies.task_id == upstream.c.id)
+    )
+    return db.execute(select(exists().where(upstream.c.id == target_id))).scalar()
+
+def _publish_dependency_change(db: Session, message: dict) -> None:
+    """Send an edge change to every worker, applying it to this worker's graph as soon as the transaction commits"""
+    notify(db, DEPENDENCY_CHANGES_CHANNEL, message)
+    # Without this a request following the commit could read the graph
+    # before this worker's own notification arrives
+    db.info.setdefault("dependency_changes", []).append(message)
+
+@event.listens_for(SessionLocal, "after_commit")
+def apply_committed_dependency_changes(session: Session) -> None:
+    index = get_dependency_index()
+    for message in session.info.pop("dependency_changes", ()):
+        index.apply(message)
+
+@event.listens_for(SessionLocal, "after_rollback")
+def discard_pending_dependency_changes(session: Session) -> None:
+    session.info.pop("dependency_changes", None)
+
+def load_dependency_graph(db: Session) -> DependencyGraph:
+    """Build the graph from every stored edge"""
+    graph = DependencyGraph()
+    for task_id, blocker_id in db.execute(select(TaskDependencies.task_id, TaskDependencies.blocker_id)):
+        graph.add_edge(task_id, blocker_id)
+
+    nodes = union(select(TaskDependencies.task_id), select(TaskDependencies.blocker_id))
+    done = db.execute(
+        select(Tasks.id).where(Tasks.status == TaskStatus.DONE, Tasks.id.in_(nodes))
+    ).scalars()
+    for task_id in done:
+        graph.set_closed(task_id, True)
+    return graph
+
+
+class DependencyIndex:
+    """
+    Per-worker copy of the dependency graph, loaded on first use and kept
+    current by change notifications from every worker
+    """
+
+    def __init__(self):
+        self._graph: Optional[DependencyGraph] = None
+
+    def get(self, db: Session) -> DependencyGraph:
+        if self._graph is None:
+            self._graph = load_dependency_graph(db)
+            logger.info(
+                f"Loaded dependency graph: {self._graph.node_count} tasks, {self._graph.edge_count} edges"
+            )
+        return self._graph
+
+    def invalidate(self) -> None:
+        self._graph = None
+
+    def handle_dependency_notification(self, payload: Optional[str]) -> None:
+        """Apply an edge change made by any worker"""
+        if payload is RESYNC:
+            self.invalidate()
+            return
+        self.apply(json.loads(payload))
+
+    def apply(self, message: dict) -> None:
+        """Apply an edge change message"""
+        if self._graph is None:
+            return
+        # Edge operations are idempotent, so replaying one the graph was
+        # loaded with, or this worker's own change a second time, is harmless
+        task_id, blocker_id = uuid.UUID(message["task_id"]), uuid.UUID(message["blocker_id"])
+        if message["op"] == "add":
+            self._graph.add_edge(task_id, blocker_id)
+            self._graph.set_closed(task_id, message["task_done"])
+            self._graph.set_closed(blocker_id, message["blocker_done"])
+        elif message["op"] == "remove":
+            self._graph.remove_edge(task_id, blocker_id)
+
+    def handle_task_change_notification(self, payload: Optional[str]) -> None:
+        """Track deletes and status changes of tasks in the graph"""
+        if payload is RESYNC:
+            self.invalidate()
+            return
+        if self._graph is None:
+            return
+        message = json.loads(payload)
+        if "id" not in message:
+            # Imports cannot add edges; anything else, such as a reset, can
+            # remove them
+            if message["op"] not in ("import", "rebalance"):
+                self.invalidate()
+            return
+        task_id = uuid.UUID(message["id"])
+        if task_id not in self._graph:
+            return
+        if message["op"] == "delete":
+            self._graph.remove_node(task_id)
+        else:
+            self._graph.set_closed(task_id, message["status"] == TaskStatus.DONE.value)
+
+
+@lru_cache
+def get_dependency_index() -> DependencyIndex:
+    return DependencyIndex()
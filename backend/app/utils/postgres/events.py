@@ -0,0 +1,112 @@
+# Path: app/utils/postgres/events.py
+# Description: Append-only task history and the daily rollups maintained from it.
+
+import uuid
+from collections import Counter
+from typing import Iterable, Optional, Union
+from sqlalchemy import Date, cast, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+from app.utils.models import TaskStatus, TaskEventType
+from .schema import TaskEvents, TaskStatusDailyFlow, TaskCycleTimeDaily
+
+# Rollups are bucketed by UTC day of the transaction time, the same clock
+# as TaskEvents.created_at
+TODAY = cast(func.timezone("UTC", func.now()), Date)
+
+# Every task change bumps today's rollup rows. Each connection writes its own
+# shard of them, so concurrent writers do not queue on a single row lock;
+# readers sum the shards
+ROLLUP_SHARDS = 16
+SHARD = func.pg_backend_pid() % ROLLUP_SHARDS
+
+def record_task_event(
+    db: Session,
+    task_id: uuid.UUID,
+    event_type: TaskEventType,
+    from_status: Optional[Union[TaskStatus, str]] = None,
+    to_status: Optional[Union[TaskStatus, str]] = None,
+) -> None:
+    """
+    Append a task event and fold it into the daily rollups, in the caller's transaction
+    Args:
+        db: Database session holding the mutation
+        task_id: ID of the mutated task
+        event_type: What happened
+        from_status: Column the task was in, None for new tasks
+        to_status: Column the task is in now, None for deleted tasks
+    Returns:
+        None
+    """
+    from_status = TaskStatus(from_status) if from_status is not None else None
+    to_status = TaskStatus(to_status) if to_status is not None else None
+
+    db.execute(insert(TaskEvents).values(
+        task_id=task_id,
+        event_type=event_type,
+        from_status=from_status,
+        to_status=to_status,
+    ))
+
+    if from_status == to_status:
+        return
+    if from_status is not None:
+        bump_status_flow(db, from_status, exited=1)
+    if to_status is not None:
+        bump_status_flow(db, to_status, entered=1)
+    if to_status == TaskStatus.DONE:
+        record_completion(db, task_id)
+
+def record_imported_task_events(db: Session, tasks: Iterable[dict]) -> None:
+    """Bulk variant of `record_task_event` for imported tasks, given their inserted rows"""
+    tasks = list(tasks)
+    if not tasks:
+        return
+    db.execute(insert(TaskEvents), [
+        {"task_id": task["id"], "event_type": TaskEventType.IMPORTED, "to_status": task["status"]}
+        for task in tasks
+    ])
+    # Imported tasks have no start time, so they count towards burndown only
+    for task_status, count in Counter(TaskStatus(task["status"]) for task in tasks).items():
+        bump_status_flow(db, task_status, entered=count)
+
+def bump_status_flow(db: Session, status: TaskStatus, entered: int = 0, exited: int = 0) -> None:
+    stmt = insert(TaskStatusDailyFlow).values(day=TODAY, status=status, shard=SHARD, entered=entered, exited=exited)
+    db.execute(stmt.on_conflict_do_update(
+        index_elements=[TaskStatusDailyFlow.day, TaskStatusDailyFlow.status, TaskStatusDailyFlow.shard],
+        set_={
+            "entered": TaskStatusDailyFlow.entered + stmt.excluded.entered,
+            "exited": TaskStatusDailyFlow.exited + stmt.excluded.exited,
+        },
+    ))
+
+def record_completion(db: Session, task_id: uuid.UUID) -> None:
+    """Add a task that just moved to done to the cycle time rollup"""
+    # Work starts when the task first entered in progress, or when it was
+    # created if it skipped that column
+    first_event = func.min(TaskEvents.created_at)
+    started_at = (
+        select(func.coalesce(
+            first_event.filter(TaskEvents.to_status == TaskStatus.IN_PROGRESS),
+            first_event.filter(TaskEvents.event_type == TaskEventType.CREATED),
+        ))
+        .where(TaskEvents.task_id == task_id)
+        .scalar_subquery()
+    )
+    seconds = db.execute(select(func.extract("epoch", func.now() - started_at))).scalar()
+    if seconds is None:
+        # Task predates the event history
+        return
+
+    seconds = float(seconds)
+    stmt = insert(TaskCycleTimeDaily).values(
+        day=TODAY, shard=SHARD, completed=1, total_seconds=seconds, max_seconds=seconds
+    )
+    db.execute(stmt.on_conflict_do_update(
+        index_elements=[TaskCycleTimeDaily.day, TaskCycleTimeDaily.shard],
+        set_={
+            "completed": TaskCycleTimeDaily.completed + 1,
+            "total_seconds": TaskCycleTimeDaily.total_seconds + stmt.excluded.total_seconds,
+            "max_seconds": func.greatest(TaskCycleTimeDaily.max_seconds, stmt.excluded.max_seconds),
+        },
+    ))
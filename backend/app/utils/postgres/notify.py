@@ -0,0 +1,262 @@
+# Path: app/utils/postgres/notify.py
+# Description: PostgreSQL LISTEN/NOTIFY helpers used to push change events to every worker.
+
+import asyncio
+import json
+import uuid
+from collections import defaultdict
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Union
+import psycopg2
+from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+from app.config import get_settings
+from app.logger import get_logger
+from app.utils.cache import get_entity_cache, get_download_link_cache
+from app.utils.fanout import FanoutHub, RESYNC
+from app.utils.models import TaskStatus, TaskPriority
+from .base import Session as SessionLocal
+from .schema import Tasks, TaskTombstones
+
+settings = get_settings()
+logger = get_logger()
+
+TASK_CHANGES_CHANNEL = "task_changes"
+ENTITY_CACHE_CHANNEL = "entity_cache"
+
+def notify(db: Session, channel: str, payload: dict) -> None:
+    """
+    Queue a NOTIFY on the session's transaction
+    Args:
+        db: Database session
+        channel: Channel to notify
+        payload: JSON serialisable payload (must stay under 8000 bytes once encoded)
+    Returns:
+        None
+    """
+    # Postgres only delivers the notification once the transaction commits,
+    # and drops it if the transaction rolls back
+    db.execute(
+        text("SELECT pg_notify(:channel, :payload)"),
+        {"channel": channel, "payload": json.dumps(payload, separators=(",", ":"))},
+    )
+
+def publish_task_change(db: Session, op: str, task: Tasks) -> None:
+    """
+    Publish a compact change event for a task mutation
+    Args:
+        db: Database session holding the uncommitted mutation
+        op: One of "create", "update" or "delete"
+        task: The mutated task
+    Returns:
+        None
+    """
+    # Flush so the change version has been assigned
+    db.flush()
+    # Other workers evict the task when they receive the event below
+    invalidate_on_commit(db, "task", task.id)
+
+    payload = {"op": op, "id": str(task.id)}
+    if op == "delete":
+        # Written with a Core upsert, so never trust a copy already in the session
+        tombstone = db.get(TaskTombstones, task.id, populate_existing=True)
+        if tombstone is not None:
+            payload["version"] = tombstone.version
+    else:
+        payload["version"] = task.version
+        payload["status"] = TaskStatus(task.status).value
+        payload["priority"] = TaskPriority(task.priority).value
+        payload["assignee_id"] = str(task.assignee_id)
+        payload["rank"] = task.rank
+
+    notify(db, TASK_CHANGES_CHANNEL, payload)
+
+def _evict(kind: str, entity_id: uuid.UUID) -> None:
+    if kind == "resume":
+        # Presigned links are cached per requested expiration
+        get_download_link_cache().invalidate_where(lambda key: key[0] == entity_id)
+    else:
+        get_entity_cache().invalidate((kind, entity_id))
+
+def _clear_caches() -> None:
+    get_entity_cache().clear()
+    get_download_link_cache().clear()
+
+def invalidate_on_commit(db: Session, kind: str, entity_id: Union[str, uuid.UUID]) -> None:
+    """Evict an entity from this worker's cache once the session commits"""
+    db.info.setdefault("cache_invalidations", set()).add((kind, uuid.UUID(str(entity_id))))
+
+def invalidate_entity(db: Session, kind: str, entity_id: Union[str, uuid.UUID]) -> None:
+    """
+    Evict a cached entity from every worker once the transaction commits
+    Args:
+        db: Database session holding the uncommitted mutation
+        kind: Entity kind, "task", "user" or "resume" (its download links)
+        entity_id: ID of the mutated entity
+    Returns:
+        None
+    """
+    invalidate_on_commit(db, kind, entity_id)
+    notify(db, ENTITY_CACHE_CHANNEL, {"kind": kind, "id": str(entity_id)})
+
+def clear_entity_cache(db: Session) -> None:
+    """Empty every worker's entity and download link caches once the transaction commits"""
+    db.info["cache_clear"] = True
+    notify(db, ENTITY_CACHE_CHANNEL, {"op": "clear"})
+
+@event.listens_for(SessionLocal, "after_commit")
+def evict_committed_entities(session: Session) -> None:
+    if session.info.pop("cache_clear", False):
+        _clear_caches()
+    for kind, entity_id in session.info.pop("cache_invalidations", ()):
+        _evict(kind, entity_id)
+
+@event.listens_for(SessionLocal, "after_rollback")
+def discard_pending_invalidations(session: Session) -> None:
+    session.info.pop("cache_clear", None)
+    session.info.pop("cache_invalidations", None)
+
+def handle_entity_cache_notification(payload: Optional[str]) -> None:
+    """Apply an invalidation published by any worker"""
+    if payload is RESYNC:
+        _clear_caches()
+        return
+    message = json.loads(payload)
+    if "id" in message:
+        _evict(message["kind"], uuid.UUID(message["id"]))
+    else:
+        _clear_caches()
+
+def handle_task_change_notification(payload: Optional[str]) -> None:
+    """Evict tasks changed by any worker"""
+    cache = get_entity_cache()
+    if payload is RESYNC:
+        cache.invalidate_where(lambda key: key[0] == "task")
+        return
+    message = json.loads(payload)
+    if "id" in message:
+        cache.invalidate(("task", uuid.UUID(message["id"])))
+    elif message["op"] != "import":
+        # Column rebalances and resets touch many tasks at once
+        cache.invalidate_where(lambda key: key[0] == "task")
+
+
+class PostgresListener:
+    """Single LISTEN connection per worker that dispatches notifications to handlers"""
+
+    def __init__(self, dsn: str, reconnect_delay: float = 1.0, max_reconnect_delay: float = 30.0):
+        self.dsn = dsn
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self._handlers: Dict[str, List[Callable[[Optional[str]], None]]] = defaultdict(list)
+        self._connection = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._reconnect_task: Optional[asyncio.Task] = None
+
+    def add_handler(self, channel: str, handler: Callable[[Optional[str]], None]) -> None:
+        """
+        Register a handler for a channel
+        Args:
+            channel: Channel to listen on
+            handler: Called on the event loop with each payload, or with `RESYNC` (None)
+                when notifications may have been lost during a reconnect
+        Returns:
+            None
+        """
+        self._handlers[channel].append(handler)
+        if self._connection is not None and len(self._handlers[channel]) == 1:
+            self._listen(channel)
+
+    async def start(self) -> None:
+        """Open the listening connection"""
+        self._loop = asyncio.get_running_loop()
+        try:
+            self._connect()
+        except psycopg2.Error as e:
+            logger.error(f"Error connecting Postgres listener: {str(e)}")
+            self._schedule_reconnect()
+
+    async def stop(self) -> None:
+        """Close the listening connection"""
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+            self._reconnect_task = None
+        self._disconnect()
+
+    def _connect(self) -> None:
+        connection = psycopg2.connect(self.dsn)
+        connection.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+        self._connection = connection
+        for channel in self._handlers:
+            self._listen(channel)
+        self._loop.add_reader(connection.fileno(), self._on_readable)
+        logger.info(f"Postgres listener subscribed to: {', '.join(self._handlers)}")
+
+    def _disconnect(self) -> None:
+        if self._connection is None:
+            return
+        try:
+            self._loop.remove_reader(self._connection.fileno())
+        except (ValueError, OSError):
+            pass
+        try:
+            self._connection.close()
+        except psycopg2.Error:
+            pass
+        self._connection = None
+
+    def _listen(self, channel: str) -> None:
+        with self._connection.cursor() as cursor:
+            # Channel names are internal constants, never user input
+            cursor.execute(f'LISTEN "{channel}"')
+
+    def _on_readable(self) -> None:
+        try:
+            self._connection.poll()
+        except psycopg2.Error as e:
+            logger.error(f"Postgres listener connection lost: {str(e)}")
+            self._disconnect()
+            self._schedule_reconnect()
+            return
+
+        notifies = self._connection.notifies
+        while notifies:
+            notification = notifies.pop(0)
+            self._dispatch(notification.channel, notification.payload)
+
+    def _dispatch(self, channel: str, payload: Optional[str]) -> None:
+        for handler in self._handlers.get(channel, ()):
+            try:
+                handler(payload)
+            except Exception as e:
+                logger.error(f"Error handling notification on {channel}: {str(e)}")
+
+    def _schedule_reconnect(self) -> None:
+        if self._reconnect_task is None or self._reconnect_task.done():
+            self._reconnect_task = self._loop.create_task(self._reconnect())
+
+    async def _reconnect(self) -> None:
+        delay = self.reconnect_delay
+        while True:
+            await asyncio.sleep(delay)
+            try:
+                self._connect()
+            except psycopg2.Error as e:
+                logger.error(f"Error reconnecting Postgres listener: {str(e)}")
+                delay = min(delay * 2, self.max_reconnect_delay)
+                continue
+
+            # Anything sent while we were disconnected is gone
+            for channel in list(self._handlers):
+                self._dispatch(channel, RESYNC)
+            return
+
+
+@lru_cache
+def get_postgres_listener() -> PostgresListener:
+    return PostgresListener(settings.get_postgres_uri())
+
+@lru_cache
+def get_task_change_hub() -> FanoutHub:
+    return FanoutHub()
@@ -0,0 +1,100 @@
+# Path: app/utils/postgres/ranking.py
+# Description: Card ordering inside kanban columns using fractional ranks.
+
+import uuid
+from typing import Iterable, Optional
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from app.logger import get_logger
+from app.utils.models import TaskStatus
+from app.utils.rank import rank_between, sequential_ranks
+from .base import Session as SessionLocal
+from .schema import Tasks
+from .notify import notify, invalidate_on_commit, TASK_CHANGES_CHANNEL
+
+logger = get_logger()
+
+# Ranks longer than this are a sign of many inserts at the same spot; the
+# column gets rewritten with short ranks in the background
+RANK_REBALANCE_LENGTH = 16
+
+# Transaction-level advisory locks, one per column, serialising rank
+# assignment: two cards read against the same neighbours would otherwise get
+# the same rank and their order would be left to chance
+COLUMN_LOCK_KEY = 0x72616e6b
+
+def lock_task_columns(db: Session, statuses: Iterable[TaskStatus]) -> None:
+    """Hold the rank lock of each column until the transaction ends, taken in a fixed order"""
+    for value in sorted({TaskStatus(status).value for status in statuses}):
+        db.execute(select(func.pg_advisory_xact_lock(COLUMN_LOCK_KEY, func.hashtext(value))))
+
+def next_rank_in_column(db: Session, status: TaskStatus) -> str:
+    """Rank that places a card at the bottom of a column"""
+    lock_task_columns(db, [status])
+    last_rank = db.query(func.max(Tasks.rank)).filter(Tasks.status == status).scalar()
+    return rank_between(last_rank, None)
+
+def rank_between_neighbours(
+    db: Session,
+    status: TaskStatus,
+    previous: Optional[Tasks],
+    following: Optional[Tasks],
+    task_id: uuid.UUID,
+) -> str:
+    """
+    Rank that places a card between two neighbours in a column
+    Args:
+        db: Database session
+        status: Column the card is moved to
+        previous: Card that should end up directly above, if any
+        following: Card that should end up directly below, if any
+        task_id: The card being moved, ignored when looking up implicit neighbours
+    Returns:
+        The new rank
+    """
+    lock_task_columns(db, [status])
+    # The neighbours were loaded before the lock; a rebalance may have moved them since
+    for neighbour in (previous, following):
+        if neighbour is not None:
+            db.refresh(neighbour)
+    column = db.query(Tasks.rank).filter(Tasks.status == status, Tasks.id != task_id)
+
+    if previous is not None and following is not None:
+        lower, upper = previous.rank, following.rank
+    elif previous is not None:
+        lower = previous.rank
+        upper = column.filter(Tasks.rank > lower).order_by(Tasks.rank).limit(1).scalar()
+    elif following is not None:
+        upper = following.rank
+        lower = column.filter(Tasks.rank < upper).order_by(Tasks.rank.desc()).limit(1).scalar()
+    else:
+        lower = column.order_by(Tasks.rank.desc()).limit(1).scalar()
+        upper = None
+
+    return rank_between(lower, upper)
+
+def rebalance_task_column(status: TaskStatus) -> None:
+    """Rewrite the ranks of every card in a column as short, sequential ranks"""
+    db = SessionLocal()
+    try:
+        lock_task_columns(db, [status])
+        tasks = (
+            db.query(Tasks)
+            .filter(Tasks.status == status)
+            .order_by(Tasks.rank, Tasks.id)
+            .with_for_update()
+            .all()
+        )
+        for task, rank in zip(tasks, sequential_ranks(len(tasks))):
+            task.rank = rank
+            invalidate_on_commit(db, "task", task.id)
+
+        # One event for the whole column rather than one per card
+        notify(db, TASK_CHANGES_CHANNEL, {"op": "rebalance", "status": TaskStatus(status).value})
+        db.commit()
+        logger.info(f"Rebalanced {len(tasks)} ranks in column {TaskStatus(status).value}")
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error rebalancing column {status}: {str(e)}")
+    finally:
+        db.close()
@@ -0,0 +1,96 @@
+# Path: app/utils/postgres/resume_references.py
+# Description: Content-addressed resume rows shared between users, with reference counting.
+
+import uuid
+from typing import Dict, List, Optional
+from sqlalchemy import exists, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+from .notify import invalidate_entity
+from .schema import ResumeUploads, Users
+
+def find_resume_by_hash(db: Session, sha256: str) -> Optional[ResumeUploads]:
+    """Stored resume with exactly this content, if any"""
+    return db.query(ResumeUploads).filter(ResumeUploads.sha256 == sha256).first()
+
+def insert_resume_uploads(db: Session, uploads: List[ResumeUploads]) -> Dict[str, uuid.UUID]:
+    """
+    Insert freshly stored resumes, skipping any whose content is already stored
+    Args:
+        db: Database session, committed by the caller
+        uploads: Rows returned by `store_resume`, with distinct hashes
+    Returns:
+        The ID of the stored resume for every hash; an upload whose ID differs
+        was a duplicate and should be discarded
+    """
+    if not uploads:
+        return {}
+    table = ResumeUploads.__table__
+    stored = dict(db.execute(
+        insert(table)
+        .on_conflict_do_nothing(index_elements=["sha256"])
+        .returning(table.c.sha256, table.c.id),
+        [
+            {
+                "id": upload.id,
+                "minio_resume_id": upload.minio_resume_id,
+                "sha256": upload.sha256,
+                "size_bytes": upload.size_bytes,
+                "status": upload.status,
+                "stage": upload.stage,
+                "attempts": upload.attempts,
+            }
+            for upload in uploads
+        ],
+    ).all())
+
+    # Stored earlier, or by a concurrent request since the caller looked
+    missing = [upload.sha256 for upload in uploads if upload.sha256 not in stored]
+    if missing:
+        stored.update(db.execute(
+            select(ResumeUploads.sha256, ResumeUploads.id).where(ResumeUploads.sha256.in_(missing))
+        ).all())
+    return stored
+
+def acquire_resume(db: Session, resume_id: uuid.UUID, count: int = 1) -> None:
+    """Record that `count` more users point at a resume"""
+    db.execute(
+        ResumeUploads.__table__.update()
+        .where(ResumeUploads.id == resume_id)
+        .values(ref_count=ResumeUploads.ref_count + count)
+    )
+
+def release_resume(db: Session, resume_id: uuid.UUID) -> Optional[Row]:
+    """
+    Record that one user less points at a resume, deleting its row with the last reference
+    Args:
+        db: Database session, flushed so the user no longer references the resume
+        resume_id: The resume the user pointed at
+    Returns:
+        The deleted row (id, minio_resume_id, mongodb_resume_id), whose stored
+        copies the caller removes after committing; None while the resume is
+        still referenced
+    """
+    ref_count = db.execute(
+        ResumeUploads.__table__.update()
+        .where(ResumeUploads.id == resume_id)
+        .values(ref_count=ResumeUploads.ref_count - 1)
+        .returning(ResumeUploads.ref_count)
+    ).scalar()
+    if ref_count is None or ref_count > 0:
+        return None
+    # The count is an optimisation; never delete a resume a user still points at
+    deleted = db.execute(
+        ResumeUploads.__table__.delete()
+        .where(
+            ResumeUploads.id == resume_id,
+            ResumeUploads.ref_count <= 0,
+            ~exists().where(Users.resume_id == resume_id),
+        )
+        .returning(ResumeUploads.id, ResumeUploads.minio_resume_id, ResumeUploads.mongodb_resume_id)
+    ).first()
+    if deleted is not None:
+        # Links handed out before must not be served from any worker's cache
+        invalidate_entity(db, "resume", deleted.id)
+    return deleted
@@ -9,13 +9,38 @@ from sqlalchemy import (
     UUID,
     Enum,
     ForeignKey,
+    BigInteger,
+    Sequence,
+    Computed,
+    Index,
+    CheckConstraint,
+    Identity,
+    Integer,
+    SmallInteger,
+    Float,
+    Date,
+    DateTime,
+    Text,
+    cast,
+    text,
+    func,
 )
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from app.config import get_settings
-from sqlalchemy.orm import relationship
-from app.utils.models import UserRole, TaskStatus, TaskPriority
+from sqlalchemy.orm import relationship, deferred
+from app.utils.models import UserRole, TaskStatus, TaskPriority, TaskEventType, ResumeStatus, ResumeStage
 
 settings = get_settings()
 
+# Shared change counter for tasks and their tombstones, used for delta sync
+task_version_seq = Sequence("task_version_seq")
+
+# ID of the writing transaction. Versions are drawn when a row is written,
+# not when it commits, so delta sync pages by this instead and only hands a
+# change out once every older transaction has finished
+CURRENT_TXID = cast(cast(func.pg_current_xact_id(), Text), BigInteger)
+CURRENT_TXID_DEFAULT = text("(pg_current_xact_id()::text::bigint)")
+
 class Users(DatabaseBase):
     __tablename__ = "users"
     
@@ -23,18 +48,43 @@ class Users(DatabaseBase):
     name = Column(String, nullable=False)
     email = Column(String, nullable=False, unique=True)
     notes = Column(String, nullable=True)
-    resume_id = Column(UUID(as_uuid=True), ForeignKey("resume_uploads.id"), nullable=False)
+    resume_id = Column(UUID(as_uuid=True), ForeignKey("resume_uploads.id"), nullable=False, index=True)
     role = Column(Enum(UserRole), nullable=False)
 
     # relationship to tasks
     tasks = relationship("Tasks", back_populates="assignee")
 
+    __table_args__ = (
+        # directory order, also used as the pagination key
+        Index("ix_users_name_id", "name", "id"),
+        # substring search with ILIKE (needs the pg_trgm extension)
+        Index("ix_users_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+        Index("ix_users_email_trgm", "email", postgresql_using="gin", postgresql_ops={"email": "gin_trgm_ops"}),
+        Index("ix_users_notes_trgm", "notes", postgresql_using="gin", postgresql_ops={"notes": "gin_trgm_ops"}),
+    )
+
 class ResumeUploads(DatabaseBase):
     __tablename__ = "resume_uploads"
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     minio_resume_id = Column(UUID(as_uuid=True), nullable=False)
-    mongodb_resume_id = Column(UUID(as_uuid=True), nullable=False)
+    # set once the text has been indexed
+    mongodb_resume_id = Column(UUID(as_uuid=True), nullable=True, index=True)
+    # hex SHA-256 and size of the PDF, computed while it streams to MinIO;
+    # unknown for resumes uploaded before they were recorded. Uploads are
+    # deduplicated on the hash
+    sha256 = Column(String(64), nullable=True, unique=True)
+    size_bytes = Column(BigInteger, nullable=True)
+    # users pointing at this resume; identical uploads share one row
+    ref_count = Column(Integer, nullable=False, default=0)
+    # background ingestion progress, see app/utils/resumes.py
+    status = Column(Enum(ResumeStatus), nullable=False, default=ResumeStatus.PROCESSING, index=True)
+    stage = Column(Enum(ResumeStage), nullable=False, default=ResumeStage.UPLOADED)
+    error = Column(String, nullable=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    # a pipeline worker owns the row until then
+    leased_until = Column(DateTime(timezone=True), nullable=True)
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
 
 class Tasks(DatabaseBase):
     __tablename__ = "tasks"
@@ -45,6 +95,114 @@ class Tasks(DatabaseBase):
     assignee_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     status = Column(Enum(TaskStatus), nullable=False, default=TaskStatus.TODO)
     priority = Column(Enum(TaskPriority), nullable=False, default=TaskPriority.MEDIUM)
+    # position inside the status column, see app/utils/rank.py; byte-wise
+    # collation so the database sorts ranks the same way Python compares them
+    rank = Column(String(collation="C"), nullable=False)
+    version = Column(
+        BigInteger,
+        task_version_seq,
+        server_default=task_version_seq.next_value(),
+        onupdate=task_version_seq.next_value(),
+        nullable=False,
+        index=True,
+    )
+    txid = Column(BigInteger, server_default=CURRENT_TXID_DEFAULT, onupdate=CURRENT_TXID, nullable=False, index=True)
+    # weighted full-text document, maintained by Postgres; deferred so plain
+    # task loads never pull it
+    search_vector = deferred(Column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(description, '')), 'B')",
+            persisted=True,
+        ),
+    ))
 
     # relationship to users
     assignee = relationship("Users", back_populates="tasks")
+
+    __table_args__ = (
+        Index("ix_tasks_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_tasks_status_rank", "status", "rank"),
+        Index("ix_tasks_assignee_id_status", "assignee_id", "status"),
+    )
+
+    # return the server-assigned version on INSERT/UPDATE instead of expiring it
+    __mapper_args__ = {"eager_defaults": True}
+
+class TaskTombstones(DatabaseBase):
+    __tablename__ = "task_tombstones"
+
+    task_id = Column(UUID(as_uuid=True), primary_key=True)
+    version = Column(
+        BigInteger,
+        task_version_seq,
+        server_default=task_version_seq.next_value(),
+        nullable=False,
+        index=True,
+    )
+    txid = Column(BigInteger, server_default=CURRENT_TXID_DEFAULT, nullable=False, index=True)
+    # tombstones are pruned after TASK_TOMBSTONE_RETENTION_DAYS
+    deleted_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), index=True)
+
+    __mapper_args__ = {"eager_defaults": True}
+
+class TaskSyncHorizon(DatabaseBase):
+    __tablename__ = "task_sync_horizon"
+
+    # single row: newest transaction whose tombstones have been pruned; delta
+    # sync clients that have not seen past it must resync from scratch
+    id = Column(Integer, primary_key=True, default=1)
+    pruned_txid = Column(BigInteger, nullable=False, default=0)
+
+    __table_args__ = (
+        CheckConstraint("id = 1", name="ck_task_sync_horizon_single_row"),
+    )
+
+class TaskDependencies(DatabaseBase):
+    __tablename__ = "task_dependencies"
+
+    # task_id is blocked by blocker_id; edges go away with either task
+    task_id = Column(UUID(as_uuid=True), ForeignKey("tasks.id", ondelete="CASCADE"), primary_key=True)
+    blocker_id = Column(UUID(as_uuid=True), ForeignKey("tasks.id", ondelete="CASCADE"), primary_key=True, index=True)
+
+    __table_args__ = (
+        CheckConstraint("task_id <> blocker_id", name="ck_task_dependencies_not_self"),
+    )
+
+class TaskEvents(DatabaseBase):
+    __tablename__ = "task_events"
+
+    # append-only history; no foreign key so events outlive deleted tasks
+    id = Column(BigInteger, Identity(), primary_key=True)
+    task_id = Column(UUID(as_uuid=True), nullable=False)
+    event_type = Column(Enum(TaskEventType), nullable=False)
+    from_status = Column(Enum(TaskStatus), nullable=True)
+    to_status = Column(Enum(TaskStatus), nullable=True)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+    __table_args__ = (
+        Index("ix_task_events_task_id_to_status", "task_id", "to_status"),
+    )
+
+class TaskStatusDailyFlow(DatabaseBase):
+    __tablename__ = "task_status_daily_flow"
+
+    # tasks that entered and left each column per UTC day, maintained on write;
+    # spread over ROLLUP_SHARDS rows per key and summed on read
+    day = Column(Date, primary_key=True)
+    status = Column(Enum(TaskStatus), primary_key=True)
+    shard = Column(SmallInteger, primary_key=True, default=0)
+    entered = Column(Integer, nullable=False, default=0)
+    exited = Column(Integer, nullable=False, default=0)
+
+class TaskCycleTimeDaily(DatabaseBase):
+    __tablename__ = "task_cycle_time_daily"
+
+    # tasks completed per UTC day and how long they took since work started;
+    # sharded like TaskStatusDailyFlow
+    day = Column(Date, primary_key=True)
+    shard = Column(SmallInteger, primary_key=True, default=0)
+    completed = Column(Integer, nullable=False, default=0)
+    total_seconds = Column(Float, nullable=False, default=0)
+    max_seconds = Column(Float, nullable=False, default=0)
@@ -0,0 +1,27 @@
+# Path: app/utils/postgres/search.py
+# Description: Full-text search queries over the database.
+
+from sqlalchemy import func
+from sqlalchemy.orm import Query, Session
+from .schema import Tasks
+
+# Must match the configuration used by the generated `tasks.search_vector` column
+TASK_SEARCH_CONFIG = "english"
+
+def search_tasks(db: Session, q: str) -> Query:
+    """
+    Build a ranked full-text search over task titles and descriptions
+    Args:
+        db: Database session
+        q: Search text in web search syntax (quoted phrases, OR, -negation)
+    Returns:
+        Query yielding `(Tasks, score)` rows, best match first
+    """
+    tsquery = func.websearch_to_tsquery(TASK_SEARCH_CONFIG, q)
+    # Labelled "score" so it cannot clash with the tasks.rank column
+    score = func.ts_rank_cd(Tasks.search_vector, tsquery).label("score")
+    return (
+        db.query(Tasks, score)
+        .filter(Tasks.search_vector.op("@@")(tsquery))
+        .order_by(score.desc(), Tasks.id)
+    )
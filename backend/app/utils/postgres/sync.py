@@ -0,0 +1,104 @@
+# Path: app/utils/postgres/sync.py
+# Description: Delta sync bookkeeping: the commit-safe change horizon and tombstone retention.
+
+import asyncio
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Union
+from sqlalchemy import Select, delete, func, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+from app.config import get_settings
+from app.logger import get_logger
+from .base import Session as SessionLocal
+from .schema import CURRENT_TXID, TaskTombstones, TaskSyncHorizon, task_version_seq
+
+settings = get_settings()
+logger = get_logger()
+
+def current_sync_horizon(db: Session) -> int:
+    """
+    Oldest transaction that may still be running
+    Args:
+        db: Database session
+    Returns:
+        Every transaction with a lower id has committed or rolled back, so
+        changes below it can be handed out without skipping a later commit
+    """
+    return db.execute(text("SELECT pg_snapshot_xmin(pg_current_snapshot())::text::bigint")).scalar_one()
+
+def pruned_sync_horizon(db: Session) -> int:
+    """Newest transaction whose tombstones have been pruned, 0 if none were"""
+    return db.execute(select(TaskSyncHorizon.pruned_txid)).scalar() or 0
+
+def tombstone_tasks(db: Session, tasks: Union[uuid.UUID, Select]) -> None:
+    """
+    Leave tombstones for deleted tasks, in the caller's transaction
+    Args:
+        db: Database session
+        tasks: ID of one task, or a select of task ids
+    Returns:
+        None
+    """
+    stmt = insert(TaskTombstones)
+    if isinstance(tasks, Select):
+        stmt = stmt.from_select(["task_id"], tasks)
+    else:
+        stmt = stmt.values(task_id=tasks)
+    # Ids come back through imports; a task deleted again gets a fresh
+    # tombstone, or clients past the old one would never see this delete
+    db.execute(stmt.on_conflict_do_update(
+        index_elements=[TaskTombstones.task_id],
+        set_={
+            "version": task_version_seq.next_value(),
+            "txid": CURRENT_TXID,
+            "deleted_at": func.now(),
+        },
+    ))
+
+def prune_task_tombstones(db: Session, retention: timedelta) -> int:
+    """
+    Delete tombstones older than the retention window and move the pruned horizon past them
+    Args:
+        db: Database session, committed by the caller
+        retention: How long deletes stay visible to delta sync
+    Returns:
+        Number of tombstones deleted
+    """
+    cutoff = datetime.now(timezone.utc) - retention
+    pruned = db.execute(
+        delete(TaskTombstones)
+        .where(TaskTombstones.deleted_at < cutoff)
+        .returning(TaskTombstones.txid)
+    ).scalars().all()
+    if pruned:
+        db.execute(
+            insert(TaskSyncHorizon)
+            .values(id=1, pruned_txid=max(pruned))
+            .on_conflict_do_update(
+                index_elements=[TaskSyncHorizon.id],
+                set_={"pruned_txid": func.greatest(TaskSyncHorizon.pruned_txid, max(pruned))},
+            )
+        )
+    return len(pruned)
+
+async def run_tombstone_pruning() -> None:
+    """Prune expired tombstones now and then every TASK_TOMBSTONE_PRUNE_INTERVAL_SECONDS"""
+    retention = timedelta(days=settings.TASK_TOMBSTONE_RETENTION_DAYS)
+    while True:
+        try:
+            pruned = await asyncio.to_thread(_prune_once, retention)
+            if pruned:
+                logger.info(f"Pruned {pruned} task tombstones")
+        except Exception as e:
+            logger.error(f"Error pruning task tombstones: {str(e)}")
+        await asyncio.sleep(settings.TASK_TOMBSTONE_PRUNE_INTERVAL_SECONDS)
+
+def _prune_once(retention: timedelta) -> int:
+    db = SessionLocal()
+    try:
+        pruned = prune_task_tombstones(db, retention)
+        db.commit()
+        return pruned
+    finally:
+        db.close()
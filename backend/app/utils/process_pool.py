@@ -0,0 +1,225 @@
+# Path: app/utils/process_pool.py
+# Description: Bounded process pools for CPU-bound work that must not block the event loop.
+
+import asyncio
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Tuple
+from app.config import get_settings
+from app.logger import get_logger
+
+settings = get_settings()
+logger = get_logger()
+
+
+class PoolSaturatedError(RuntimeError):
+    """Raised instead of queueing when a pool already has its maximum of pending jobs"""
+
+
+def _limit_memory(limit_bytes: int) -> None:
+    # Worker initializer; the limit is inherited by subprocesses such as poppler
+    import resource
+    resource.setrlimit(resource.RLIMIT_AS, (limit_bytes, limit_bytes))
+
+
+def _timed_call(submitted_at: float, fn: Callable, *args: Any) -> Tuple[float, float, Any]:
+    # Runs in the worker process; wall clock so both sides agree on the queue wait
+    started_at = time.time()
+    result = fn(*args)
+    return started_at - submitted_at, time.time() - started_at, result
+
+
+class BoundedProcessPool:
+    """ProcessPoolExecutor with a cap on pending jobs, per-job timeouts that kill stuck workers, and timing metrics"""
+
+    def __init__(
+        self,
+        name: str,
+        max_workers: int,
+        max_pending: int,
+        timeout_seconds: float,
+        memory_limit_bytes: Optional[int] = None,
+    ):
+        self.name = name
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.timeout_seconds = timeout_seconds
+        self.memory_limit_bytes = memory_limit_bytes
+        self._executor: Optional[ProcessPoolExecutor] = None
+        # Unfinished and timed out-but-still-running jobs of every executor,
+        # the current one and those being retired
+        self._running: Dict[ProcessPoolExecutor, int] = {}
+        self._hung: Dict[ProcessPoolExecutor, int] = {}
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._stats = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "timeouts": 0,
+            "rejected": 0,
+            "workers_recycled": 0,
+            "queue_wait_seconds_total": 0.0,
+            "queue_wait_seconds_max": 0.0,
+            "run_seconds_total": 0.0,
+            "run_seconds_max": 0.0,
+        }
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        # Called with the lock held
+        if self._executor is None:
+            # Spawned workers start clean instead of inheriting the server's
+            # sockets, threads and event loop. A job that runs out of memory
+            # fails on its own instead of taking the host down
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_limit_memory if self.memory_limit_bytes else None,
+                initargs=(self.memory_limit_bytes,) if self.memory_limit_bytes else (),
+            )
+            self._running[self._executor] = 0
+            self._hung[self._executor] = 0
+        return self._executor
+
+    async def run(self, fn: Callable, *args: Any, timeout: Optional[float] = None) -> Any:
+        """
+        Run a picklable, module-level function in the pool
+        Args:
+            fn: Function to call in a worker process
+            args: Picklable arguments
+            timeout: Seconds to wait for the result, defaults to the pool's
+        Returns:
+            The function's result
+        Raises:
+            PoolSaturatedError: If the pool already has `max_pending` jobs
+            TimeoutError: If the job did not finish in time
+        """
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self._stats["rejected"] += 1
+                raise PoolSaturatedError(f"The {self.name} pool is busy")
+            self._pending += 1
+            self._stats["submitted"] += 1
+            executor = self._get_executor()
+            self._running[executor] += 1
+
+        hung = False
+        try:
+            future = executor.submit(_timed_call, time.time(), fn, *args)
+            try:
+                queue_wait, run_time, result = await asyncio.wait_for(
+                    asyncio.wrap_future(future), timeout or self.timeout_seconds
+                )
+            except asyncio.TimeoutError:
+                # A job that has not started yet is simply dropped. One that
+                # has cannot be interrupted, so its worker has to go
+                hung = not future.cancel()
+                self._record("timeouts")
+                raise TimeoutError(f"The {self.name} job did not finish in {timeout or self.timeout_seconds}s")
+            except Exception:
+                self._record("failed")
+                raise
+        finally:
+            with self._lock:
+                self._running[executor] -= 1
+                if hung:
+                    # The slot stays taken until the worker has been killed
+                    self._hung[executor] += 1
+                else:
+                    self._pending -= 1
+                # A broken executor (a worker was killed) fails every job, and
+                # one with a hung job must not take new ones
+                if executor is self._executor and (hung or executor._broken):
+                    self._executor = None
+                self._retire_if_idle(executor)
+
+        with self._lock:
+            stats = self._stats
+            stats["completed"] += 1
+            stats["queue_wait_seconds_total"] += queue_wait
+            stats["queue_wait_seconds_max"] = max(stats["queue_wait_seconds_max"], queue_wait)
+            stats["run_seconds_total"] += run_time
+            stats["run_seconds_max"] = max(stats["run_seconds_max"], run_time)
+        return result
+
+    def _retire_if_idle(self, executor: ProcessPoolExecutor) -> None:
+        # Called with the lock held. An executor with a hung job takes no new
+        # work; once its other jobs are done its workers are killed, which is
+        # the only way to stop the hung one
+        if executor is self._executor or self._running[executor]:
+            return
+        hung = self._hung.pop(executor)
+        del self._running[executor]
+        if not hung:
+            # Replaced after a worker died; nothing left running in it
+            executor.shutdown(wait=False, cancel_futures=True)
+            return
+        self._stats["workers_recycled"] += 1
+        logger.warning(f"Replacing {self.name} workers stuck on {hung} timed out job(s)")
+        threading.Thread(target=self._terminate, args=(executor, hung), daemon=True).start()
+
+    def _terminate(self, executor: ProcessPoolExecutor, hung: int) -> None:
+        # ProcessPoolExecutor has no public way to stop a running job
+        processes = list((executor._processes or {}).values())
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.join(5)
+            if process.is_alive():
+                process.kill()
+                process.join()
+        executor.shutdown(wait=False, cancel_futures=True)
+        with self._lock:
+            self._pending -= hung
+
+    def _record(self, counter: str) -> None:
+        with self._lock:
+            self._stats[counter] += 1
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executors = list(self._running)
+            self._executor = None
+            self._running.clear()
+            self._hung.clear()
+        for executor in executors:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            completed = stats["completed"]
+            return {
+                "max_workers": self.max_workers,
+                "max_pending": self.max_pending,
+                "pending": self._pending,
+                **stats,
+                "queue_wait_seconds_avg": stats["queue_wait_seconds_total"] / completed if completed else 0.0,
+                "run_seconds_avg": stats["run_seconds_total"] / completed if completed else 0.0,
+            }
+
+
+@lru_cache
+def get_pdf_pool() -> BoundedProcessPool:
+    """Pool for PDF text extraction"""
+    return BoundedProcessPool(
+        "PDF extraction",
+        max_workers=settings.PDF_POOL_WORKERS,
+        max_pending=settings.PDF_POOL_MAX_PENDING,
+        timeout_seconds=settings.PDF_EXTRACTION_TIMEOUT_SECONDS,
+    )
+
+
+@lru_cache
+def get_render_pool() -> BoundedProcessPool:
+    """Pool for rendering PDF pages to images, kept apart so previews cannot starve extraction"""
+    return BoundedProcessPool(
+        "PDF rendering",
+        max_workers=settings.PDF_RENDER_POOL_WORKERS,
+        max_pending=settings.PDF_RENDER_POOL_MAX_PENDING,
+        timeout_seconds=settings.PDF_RENDER_TIMEOUT_SECONDS,
+        memory_limit_bytes=settings.PDF_RENDER_MEMORY_LIMIT_MB * 1024 * 1024,
+    )
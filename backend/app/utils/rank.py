@@ -0,0 +1,151 @@
+# Path: app/utils/rank.py
+# Description: Lexicographic fractional ranks used to order cards inside a kanban column.
+#
+# A rank is an "integer" part, whose first character encodes its length, followed by an
+# optional fractional part. Ranks sort correctly as plain byte strings (COLLATE "C"), and
+# a new rank can always be generated strictly between two others, so reordering a card
+# only ever rewrites that card. Appending keeps ranks short because it increments the
+# integer part; repeatedly inserting between the same two cards grows the fractional part,
+# which is what periodic rebalancing cleans up.
+
+from typing import List, Optional
+
+DIGITS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+ZERO = DIGITS[0]
+SMALLEST_INTEGER = "A" + ZERO * 26
+
+
+def _midpoint(a: str, b: Optional[str]) -> str:
+    """Fractional part strictly between `a` and `b` (`None` means the upper bound)"""
+    if b is not None:
+        # Skip the common prefix
+        n = 0
+        while (a[n] if n < len(a) else ZERO) == b[n]:
+            n += 1
+        if n > 0:
+            return b[:n] + _midpoint(a[n:], b[n:])
+
+    digit_a = DIGITS.index(a[0]) if a else 0
+    digit_b = DIGITS.index(b[0]) if b is not None else len(DIGITS)
+    if digit_b - digit_a > 1:
+        return DIGITS[(digit_a + digit_b + 1) // 2]
+    if b is not None and len(b) > 1:
+        return b[:1]
+    return DIGITS[digit_a] + _midpoint(a[1:], None)
+
+
+def _integer_length(head: str) -> int:
+    if "a" <= head <= "z":
+        return ord(head) - ord("a") + 2
+    if "A" <= head <= "Z":
+        return ord("Z") - ord(head) + 2
+    raise ValueError(f"Invalid rank head: {head}")
+
+
+def _split(rank: str):
+    length = _integer_length(rank[0])
+    if length > len(rank):
+        raise ValueError(f"Invalid rank: {rank}")
+    integer, fraction = rank[:length], rank[length:]
+    if rank == SMALLEST_INTEGER or fraction.endswith(ZERO):
+        raise ValueError(f"Invalid rank: {rank}")
+    return integer, fraction
+
+
+def _increment_integer(integer: str) -> Optional[str]:
+    head, digits = integer[0], list(integer[1:])
+    for i in range(len(digits) - 1, -1, -1):
+        d = DIGITS.index(digits[i]) + 1
+        if d < len(DIGITS):
+            digits[i] = DIGITS[d]
+            return head + "".join(digits)
+        digits[i] = ZERO
+
+    # Carried past the most significant digit: move to the next length
+    if head == "Z":
+        return "a" + ZERO
+    if head == "z":
+        return None
+    head = chr(ord(head) + 1)
+    if head > "a":
+        digits.append(ZERO)
+    else:
+        digits.pop()
+    return head + "".join(digits)
+
+
+def _decrement_integer(integer: str) -> Optional[str]:
+    head, digits = integer[0], list(integer[1:])
+    for i in range(len(digits) - 1, -1, -1):
+        d = DIGITS.index(digits[i]) - 1
+        if d >= 0:
+            digits[i] = DIGITS[d]
+            return head + "".join(digits)
+        digits[i] = DIGITS[-1]
+
+    if head == "a":
+        return "Z" + DIGITS[-1]
+    if head == "A":
+        return None
+    head = chr(ord(head) - 1)
+    if head < "Z":
+        digits.append(DIGITS[-1])
+    else:
+        digits.pop()
+    return head + "".join(digits)
+
+
+def rank_between(before: Optional[str], after: Optional[str]) -> str:
+    """
+    Generate a rank that sorts strictly between two others
+    Args:
+        before: Rank of the previous card, or None for the start of the column
+        after: Rank of the next card, or None for the end of the column
+    Returns:
+        The new rank
+    """
+    if before is not None and after is not None and before >= after:
+        raise ValueError(f"Rank {before} does not sort before {after}")
+
+    if before is None:
+        if after is None:
+            return "a" + ZERO
+        integer, fraction = _split(after)
+        if integer == SMALLEST_INTEGER:
+            return integer + _midpoint("", fraction)
+        if integer < after:
+            return integer
+        decremented = _decrement_integer(integer)
+        if decremented is None:
+            raise ValueError("Cannot generate a rank before the smallest rank")
+        return decremented
+
+    integer, fraction = _split(before)
+    if after is None:
+        incremented = _increment_integer(integer)
+        return integer + _midpoint(fraction, None) if incremented is None else incremented
+
+    after_integer, after_fraction = _split(after)
+    if integer == after_integer:
+        return integer + _midpoint(fraction, after_fraction)
+    incremented = _increment_integer(integer)
+    if incremented is not None and incremented < after:
+        return incremented
+    return integer + _midpoint(fraction, None)
+
+
+def sequential_ranks(count: int, start: Optional[str] = None) -> List[str]:
+    """
+    Generate `count` short, increasing ranks after `start`
+    Args:
+        count: Number of ranks to generate
+        start: Rank the first generated rank must follow, or None to start afresh
+    Returns:
+        List of ranks in ascending order
+    """
+    ranks = []
+    previous = start
+    for _ in range(count):
+        previous = rank_between(previous, None)
+        ranks.append(previous)
+    return ranks
@@ -0,0 +1,410 @@
+# Path: app/utils/resumes.py
+# Description: Resume ingestion: raw upload on request, then a background pipeline of retryable stages.
+
+import asyncio
+import os
+import random
+import tempfile
+import uuid
+from contextlib import asynccontextmanager
+from datetime import timedelta
+from functools import lru_cache
+from typing import AsyncIterator, Awaitable, BinaryIO, Callable, Dict, List, Optional, Set, Tuple
+from pymongo import UpdateOne
+from sqlalchemy import func, or_, select, update
+from sqlalchemy.orm import Session
+from app.config import get_settings
+from app.logger import get_logger
+from app.utils.cache import get_download_link_cache
+from app.utils.compression import compressed_field, pack_text, unpack_text
+from app.utils.minio import MinioClient, get_minio_client
+from app.utils.models import ResumeStatus, ResumeStage
+from app.utils.mongo import get_resumes_collection
+from app.utils.pdf import extract_resume_fields, render_page_jpeg, render_preview_jpegs
+from app.utils.process_pool import PoolSaturatedError, get_pdf_pool, get_render_pool
+from app.utils.skills import analyze_resume_text
+from app.utils.streaming import HashingReader
+from app.utils.postgres import ResumeUploads
+from app.utils.postgres.base import Session as SessionLocal
+
+settings = get_settings()
+logger = get_logger()
+
+async def store_resume(file: BinaryIO, minio_client: MinioClient) -> ResumeUploads:
+    """
+    Stream the raw PDF to MinIO; everything else happens in the background pipeline
+    Args:
+        file: Readable binary file positioned at the start of the PDF
+        minio_client: MinIO client
+    Returns:
+        The ResumeUploads row in processing state, not yet added to a session.
+        Enqueue it on the pipeline once committed.
+    Raises:
+        UploadTooLargeError: If the file is over RESUME_MAX_UPLOAD_BYTES; nothing is stored
+    """
+    # Hashed and size-checked as MinIO reads it part by part, so memory stays
+    # at one part whatever the file size. The client is blocking; keep it
+    # off the event loop
+    reader = HashingReader(file, settings.RESUME_MAX_UPLOAD_BYTES)
+    minio_resume_id = await asyncio.to_thread(minio_client.upload_pdf, reader)
+    return ResumeUploads(
+        id=uuid.uuid4(),
+        minio_resume_id=minio_resume_id,
+        sha256=reader.sha256,
+        size_bytes=reader.size,
+        status=ResumeStatus.PROCESSING,
+        stage=ResumeStage.UPLOADED,
+        attempts=0,
+    )
+
+def hash_resume_file(file: BinaryIO) -> Tuple[str, int]:
+    """
+    Hash a local file before uploading it, rewinding it afterwards; blocking
+    Returns:
+        The hex SHA-256 and size of the file
+    Raises:
+        UploadTooLargeError: If the file is over RESUME_MAX_UPLOAD_BYTES
+    """
+    reader = HashingReader(file, settings.RESUME_MAX_UPLOAD_BYTES)
+    while reader.read(1024 * 1024):
+        pass
+    file.seek(0)
+    return reader.sha256, reader.size
+
+async def discard_resume(resume_upload: ResumeUploads, minio_client: MinioClient) -> None:
+    """Best-effort removal of the stored copies of a resume whose row is gone or was never committed"""
+    try:
+        await asyncio.to_thread(minio_client.delete_file, str(resume_upload.minio_resume_id))
+        # Resumes stored before documents were keyed by the upload id keep their own
+        document_id = resume_upload.mongodb_resume_id or resume_upload.id
+        await get_resumes_collection().delete_one({"_id": str(document_id)})
+    except Exception as e:
+        logger.error(f"Error discarding resume {resume_upload.minio_resume_id}: {str(e)}")
+
+@asynccontextmanager
+async def local_pdf(minio_resume_id: uuid.UUID, minio_client: MinioClient) -> AsyncIterator[str]:
+    """Download a resume to a temporary file for the worker processes to read"""
+    fd, path = tempfile.mkstemp(suffix=".pdf")
+    os.close(fd)
+    try:
+        await asyncio.to_thread(minio_client.download_file, str(minio_resume_id), path)
+        yield path
+    finally:
+        os.unlink(path)
+
+def get_download_links(
+    db: Session,
+    resume_ids: List[uuid.UUID],
+    expiration: int,
+    minio_client: MinioClient,
+) -> Dict[uuid.UUID, str]:
+    """
+    Presigned download URLs for resumes, reusing cached ones while they are fresh enough
+    Args:
+        db: Database session
+        resume_ids: Resumes to link to
+        expiration: Requested link validity in seconds
+        minio_client: MinIO client
+    Returns:
+        The URL of every resume that exists
+    """
+    cache = get_download_link_cache()
+    links = {}
+    misses = []
+    for resume_id in dict.fromkeys(resume_ids):
+        link = cache.get((resume_id, expiration))
+        if link is None:
+            misses.append(resume_id)
+        else:
+            links[resume_id] = link
+    if not misses:
+        return links
+
+    # A URL is handed out again until this share of its validity has passed,
+    # so every link returned is valid for most of the requested time
+    reuse_seconds = expiration * settings.DOWNLOAD_LINK_REUSE_FRACTION
+    generation = cache.generation
+    rows = db.execute(
+        select(ResumeUploads.id, ResumeUploads.minio_resume_id).where(ResumeUploads.id.in_(misses))
+    )
+    for resume_id, minio_resume_id in rows:
+        # Signing is local; no request to MinIO
+        link = minio_client.get_download_link(str(minio_resume_id), expiration)
+        links[resume_id] = link
+        cache.set((resume_id, expiration), link, ttl=reuse_seconds, generation=generation)
+    return links
+
+# Stages are idempotent so a retry or a second worker can safely redo one:
+# the text document is keyed by the resume id and the previews overwrite themselves
+
+async def index_resume(resume_id: uuid.UUID, minio_resume_id: uuid.UUID, minio_client: MinioClient) -> Dict:
+    """Extract the text, skills and keywords and save them to MongoDB"""
+    async with local_pdf(minio_resume_id, minio_client) as path:
+        fields = await get_pdf_pool().run(extract_resume_fields, path, settings.PDF_MAX_PAGES)
+    # The body is only read back whole, so it is stored compressed; search
+    # runs on the skills, keywords and terms instead
+    text = fields.pop("text")
+    await get_resumes_collection().replace_one(
+        {"_id": str(resume_id)},
+        {"_id": str(resume_id), **fields, **pack_text("text", text)},
+        upsert=True,
+    )
+    return {"mongodb_resume_id": resume_id}
+
+async def backfill_resume_documents(batch_size: int = 100) -> None:
+    """Bring resume documents indexed by older versions to the current layout"""
+    collection = get_resumes_collection()
+    backfilled = 0
+    try:
+        while True:
+            # Documents without search terms predate both the skills and the
+            # compressed text
+            documents = await collection.find(
+                {"terms": {"$exists": False}}, {"text": 1, compressed_field("text"): 1}
+            ).limit(batch_size).to_list(batch_size)
+            if not documents:
+                break
+            updates = []
+            for document in documents:
+                text = unpack_text(document, "text") or ""
+                fields = {**await _analyze_document(document["_id"], text), **pack_text("text", text)}
+                update = {"$set": fields}
+                if "text" not in fields:
+                    update["$unset"] = {"text": ""}
+                updates.append(UpdateOne({"_id": document["_id"]}, update))
+            await collection.bulk_write(updates, ordered=False)
+            backfilled += len(updates)
+    except Exception as e:
+        logger.error(f"Error backfilling resume documents: {str(e)}")
+    if backfilled:
+        logger.info(f"Backfilled {backfilled} resume documents")
+
+async def _analyze_document(resume_id: str, text: str) -> Dict:
+    while True:
+        try:
+            return await get_pdf_pool().run(analyze_resume_text, text)
+        except PoolSaturatedError:
+            # Uploads come first; wait for room in the pool
+            await asyncio.sleep(1)
+        except Exception as e:
+            # Marked done anyway so one bad document cannot stall the backfill
+            logger.error(f"Error extracting skills of resume {resume_id}: {str(e)}")
+            return {"skills": [], "keywords": [], "terms": ""}
+
+def preview_widths() -> List[int]:
+    """Preview sizes kept for every resume, the default one included"""
+    return sorted(set(settings.RESUME_PREVIEW_WIDTHS) | {settings.RESUME_PREVIEW_WIDTH})
+
+async def render_previews(minio_resume_id: uuid.UUID, minio_client: MinioClient) -> Dict[int, bytes]:
+    """
+    Render every configured preview size of a resume and store them next to the PDF
+    Args:
+        minio_resume_id: MinIO ID of the PDF
+        minio_client: MinIO client
+    Returns:
+        The JPEG for each width
+    """
+    async with local_pdf(minio_resume_id, minio_client) as path:
+        previews = await get_render_pool().run(
+            render_preview_jpegs,
+            path,
+            preview_widths(),
+            settings.RESUME_PREVIEW_MAX_PIXELS,
+            settings.PDF_RENDER_TIMEOUT_SECONDS,
+        )
+    await asyncio.gather(*(
+        asyncio.to_thread(minio_client.upload_preview, str(minio_resume_id), width, image)
+        for width, image in previews.items()
+    ))
+    return previews
+
+async def render_preview(
+    minio_resume_id: uuid.UUID,
+    width: Optional[int],
+    dpi: Optional[int],
+    minio_client: MinioClient,
+) -> bytes:
+    """
+    Render a one-off preview of a resume at a size outside the configured ones; not stored
+    Args:
+        minio_resume_id: MinIO ID of the PDF
+        width: Width of the image in pixels
+        dpi: Resolution to render at, used when no width is given
+        minio_client: MinIO client
+    Returns:
+        The JPEG
+    """
+    async with local_pdf(minio_resume_id, minio_client) as path:
+        return await get_render_pool().run(
+            render_page_jpeg,
+            path,
+            width,
+            dpi,
+            settings.RESUME_PREVIEW_MAX_PIXELS,
+            settings.PDF_RENDER_TIMEOUT_SECONDS,
+        )
+
+async def thumbnail_resume(resume_id: uuid.UUID, minio_resume_id: uuid.UUID, minio_client: MinioClient) -> Dict:
+    """Render the first page previews and store them next to the PDF"""
+    await render_previews(minio_resume_id, minio_client)
+    return {}
+
+# Each stage runs after the previous one has been recorded as done
+RESUME_STAGES: List[Tuple[ResumeStage, Callable[..., Awaitable[Dict]]]] = [
+    (ResumeStage.INDEXED, index_resume),
+    (ResumeStage.THUMBNAILED, thumbnail_resume),
+]
+# Stages whose failure leaves the resume usable: missing previews are
+# rendered on demand by the preview endpoint
+OPTIONAL_STAGES = {ResumeStage.THUMBNAILED}
+
+# Retry delay when a pool is full, which does not count as a failed attempt
+POOL_BUSY_RETRY_SECONDS = 2.0
+
+
+class ResumePipeline:
+    """
+    Per-worker background processing of uploaded resumes. Rows are claimed
+    with a lease so several workers (or processes) never run the same resume
+    at once, and anything left behind by a crash is picked up again by the sweeper.
+    """
+
+    def __init__(self, workers: int, max_attempts: int, lease_seconds: float, sweep_seconds: float):
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.lease_seconds = lease_seconds
+        self.sweep_seconds = sweep_seconds
+        self._queue: Optional[asyncio.Queue] = None
+        self._queued: Set[uuid.UUID] = set()
+        self._tasks: List[asyncio.Task] = []
+
+    async def start(self) -> None:
+        self._queue = asyncio.Queue()
+        self._tasks = [asyncio.create_task(self._work()) for _ in range(self.workers)]
+        self._tasks.append(asyncio.create_task(self._sweep()))
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def enqueue(self, resume_id: uuid.UUID) -> None:
+        """Schedule a committed resume for processing"""
+        if self._queue is None or resume_id in self._queued:
+            return
+        self._queued.add(resume_id)
+        self._queue.put_nowait(resume_id)
+
+    async def _work(self) -> None:
+        while True:
+            resume_id = await self._queue.get()
+            self._queued.discard(resume_id)
+            try:
+                await self._process(resume_id)
+            except Exception as e:
+                logger.error(f"Error processing resume {resume_id}: {str(e)}")
+
+    async def _sweep(self) -> None:
+        # On startup and then periodically: resumes whose worker died or whose
+        # retry is due
+        while True:
+            try:
+                for resume_id in self._due_resumes():
+                    self.enqueue(resume_id)
+            except Exception as e:
+                logger.error(f"Error sweeping resume pipeline: {str(e)}")
+            await asyncio.sleep(self.sweep_seconds)
+
+    def _due_resumes(self) -> List[uuid.UUID]:
+        db = SessionLocal()
+        try:
+            return list(db.execute(
+                select(ResumeUploads.id)
+                .where(ResumeUploads.status == ResumeStatus.PROCESSING, self._lease_free())
+                .limit(1000)
+            ).scalars())
+        finally:
+            db.close()
+
+    def _lease_free(self):
+        return or_(ResumeUploads.leased_until.is_(None), ResumeUploads.leased_until < func.now())
+
+    def _update(self, resume_id: uuid.UUID, *criteria, **values):
+        db = SessionLocal()
+        try:
+            row = db.execute(
+                update(ResumeUploads)
+                .where(ResumeUploads.id == resume_id, *criteria)
+                .values(**values)
+                .returning(ResumeUploads.minio_resume_id, ResumeUploads.stage, ResumeUploads.attempts)
+            ).first()
+            db.commit()
+            return row
+        finally:
+            db.close()
+
+    async def _process(self, resume_id: uuid.UUID) -> None:
+        lease = func.now() + timedelta(seconds=self.lease_seconds)
+        claim = self._update(
+            resume_id,
+            ResumeUploads.status == ResumeStatus.PROCESSING,
+            self._lease_free(),
+            attempts=ResumeUploads.attempts + 1,
+            leased_until=lease,
+        )
+        if claim is None:
+            # Done, failed, or owned by another worker
+            return
+
+        minio_resume_id, completed, attempts = claim
+        minio_client = get_minio_client()
+        # Resume after the last stage recorded as done
+        stages = [stage for stage, _ in RESUME_STAGES]
+        remaining = RESUME_STAGES[stages.index(completed) + 1:] if completed in stages else RESUME_STAGES
+        stage = None
+        try:
+            for stage, run in remaining:
+                values = await run(resume_id, minio_resume_id, minio_client)
+                self._update(resume_id, stage=stage, leased_until=lease, **values)
+        except PoolSaturatedError:
+            # Says nothing about this resume (previews share the render pool);
+            # give the attempt back and try again shortly
+            delay = POOL_BUSY_RETRY_SECONDS * random.uniform(1, 2)
+            self._update(
+                resume_id,
+                attempts=ResumeUploads.attempts - 1,
+                leased_until=func.now() + timedelta(seconds=delay),
+            )
+            asyncio.get_running_loop().call_later(delay + 0.1, self.enqueue, resume_id)
+            logger.info(f"Resume {resume_id} waiting for a busy pool at stage {stage.value}")
+            return
+        except Exception as e:
+            error = str(e)[:1000] or type(e).__name__
+            if attempts >= self.max_attempts:
+                if stage in OPTIONAL_STAGES:
+                    self._update(resume_id, status=ResumeStatus.READY, error=error, leased_until=None)
+                    logger.warning(f"Resume {resume_id} ready without stage {stage.value} after {attempts} attempts: {error}")
+                    return
+                self._update(resume_id, status=ResumeStatus.FAILED, error=error, leased_until=None)
+                logger.error(f"Resume {resume_id} failed after {attempts} attempts: {error}")
+                return
+            # Back off exponentially; the sweeper re-enqueues once the lease expires
+            delay = min(2 ** attempts, self.sweep_seconds)
+            self._update(resume_id, error=error, leased_until=func.now() + timedelta(seconds=delay))
+            asyncio.get_running_loop().call_later(delay + 0.1, self.enqueue, resume_id)
+            logger.warning(f"Resume {resume_id} attempt {attempts} failed, retrying in {delay}s: {error}")
+            return
+
+        self._update(resume_id, status=ResumeStatus.READY, error=None, leased_until=None)
+        logger.info(f"Resume {resume_id} processed")
+
+
+@lru_cache
+def get_resume_pipeline() -> ResumePipeline:
+    return ResumePipeline(
+        workers=settings.RESUME_PROCESSING_CONCURRENCY,
+        max_attempts=settings.RESUME_PIPELINE_MAX_ATTEMPTS,
+        lease_seconds=settings.RESUME_PIPELINE_LEASE_SECONDS,
+        sweep_seconds=settings.RESUME_PIPELINE_SWEEP_SECONDS,
+    )
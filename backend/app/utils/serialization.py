@@ -0,0 +1,53 @@
+# Path: app/utils/serialization.py
+# Description: Fast serialization helpers for large list responses.
+
+from typing import Any, Dict, List, Optional, Sequence
+
+def rows_to_dicts(rows: Sequence[Sequence[Any]], keys: Sequence[str]) -> List[Dict[str, Any]]:
+    """
+    Turn column tuples into plain dicts that can be handed straight to orjson
+    Args:
+        rows: Result rows selected column by column
+        keys: Output key for each column, in select order
+    Returns:
+        List of dicts, one per row
+    """
+    # No per-row model construction or validation: the columns come from the
+    # database with the types the response model declares
+    return [dict(zip(keys, row)) for row in rows]
+
+def parse_fields(
+    fields: Optional[str],
+    available: Sequence[str],
+    presets: Optional[Dict[str, Sequence[str]]] = None,
+    always: Sequence[str] = ("id",),
+) -> List[str]:
+    """
+    Resolve a `fields=` query parameter into the list of fields to return
+    Args:
+        fields: Comma separated field names and/or preset names, or None for all fields
+        available: Every field the endpoint can return, in output order
+        presets: Named groups of fields, e.g. "compact"
+        always: Fields returned whether requested or not
+    Returns:
+        Requested fields in output order
+    Raises:
+        ValueError: If a name is neither a field nor a preset
+    """
+    if not fields:
+        return list(available)
+
+    presets = presets or {}
+    requested = set(always)
+    for name in fields.split(","):
+        name = name.strip()
+        if not name:
+            continue
+        if name in presets:
+            requested.update(presets[name])
+        elif name in available:
+            requested.add(name)
+        else:
+            raise ValueError(f"Unknown field: {name}")
+
+    return [name for name in available if name in requested]
@@ -0,0 +1,142 @@
+# Path: app/utils/skills.py
+# Description: Normalised skills and keywords from resume text; pure Python, safe to run in worker processes.
+
+import re
+from collections import Counter
+from typing import Any, Dict, List, Tuple
+
+# Canonical skill name -> spellings found in resumes, lowercase
+SKILL_ALIASES: Dict[str, Tuple[str, ...]] = {
+    "python": ("python", "python3"),
+    "java": ("java",),
+    "javascript": ("javascript", "js", "ecmascript"),
+    "typescript": ("typescript",),
+    "go": ("golang",),
+    "rust": ("rust",),
+    "c++": ("c++", "cpp"),
+    "c#": ("c#", "csharp"),
+    "kotlin": ("kotlin",),
+    "swift": ("swift",),
+    "ruby": ("ruby",),
+    "php": ("php",),
+    "scala": ("scala",),
+    "sql": ("sql",),
+    "bash": ("bash", "shell scripting"),
+    "html": ("html", "html5"),
+    "css": ("css", "css3"),
+    "react": ("react", "reactjs", "react.js"),
+    "angular": ("angular", "angularjs"),
+    "vue": ("vue", "vuejs", "vue.js"),
+    "nodejs": ("nodejs", "node.js"),
+    "django": ("django",),
+    "flask": ("flask",),
+    "fastapi": ("fastapi",),
+    "spring": ("spring boot", "springboot", "spring framework"),
+    "dotnet": ("dotnet", "asp.net"),
+    "graphql": ("graphql",),
+    "rest": ("restful", "rest api", "rest apis"),
+    "postgresql": ("postgresql", "postgres", "psql"),
+    "mysql": ("mysql",),
+    "mongodb": ("mongodb", "mongo"),
+    "redis": ("redis",),
+    "elasticsearch": ("elasticsearch", "elastic search"),
+    "kafka": ("kafka", "apache kafka"),
+    "rabbitmq": ("rabbitmq",),
+    "spark": ("spark", "apache spark", "pyspark"),
+    "hadoop": ("hadoop",),
+    "airflow": ("airflow", "apache airflow"),
+    "docker": ("docker",),
+    "kubernetes": ("kubernetes", "k8s"),
+    "helm": ("helm",),
+    "terraform": ("terraform",),
+    "ansible": ("ansible",),
+    "aws": ("aws", "amazon web services"),
+    "gcp": ("gcp", "google cloud", "google cloud platform"),
+    "azure": ("azure", "microsoft azure"),
+    "linux": ("linux",),
+    "git": ("git",),
+    "ci/cd": ("ci/cd", "cicd", "continuous integration", "continuous delivery"),
+    "jenkins": ("jenkins",),
+    "github actions": ("github actions",),
+    "machine learning": ("machine learning", "ml"),
+    "deep learning": ("deep learning",),
+    "nlp": ("nlp", "natural language processing"),
+    "computer vision": ("computer vision",),
+    "tensorflow": ("tensorflow",),
+    "pytorch": ("pytorch", "torch"),
+    "scikit-learn": ("scikit-learn", "sklearn", "scikit"),
+    "pandas": ("pandas",),
+    "numpy": ("numpy",),
+    "data analysis": ("data analysis", "data analytics"),
+    "tableau": ("tableau",),
+    "power bi": ("power bi", "powerbi"),
+    "excel": ("excel",),
+    "figma": ("figma",),
+    "agile": ("agile",),
+    "scrum": ("scrum",),
+    "kanban": ("kanban",),
+    "jira": ("jira",),
+    "project management": ("project management",),
+    "product management": ("product management",),
+    "microservices": ("microservices", "microservice"),
+    "security": ("cybersecurity", "security engineering", "infosec"),
+    "testing": ("unit testing", "test automation", "pytest", "jest", "selenium"),
+}
+
+# Words with symbols kept whole, so "c++", "c#", "node.js" and "ci/cd" survive
+TOKEN_PATTERN = re.compile(r"[a-z0-9.+#/][a-z0-9.+#/-]*[a-z0-9+#]|[a-z0-9]")
+
+STOPWORDS = frozenset("""
+a about above after all also an and any are as at be been being both but by can could did do does
+during each for from had has have having he her his i in into is it its may me more most my no not
+of on or our out over own same she so some such than that the their them then there these they this
+those through to too under until up very was we were what when where which while who will with would
+you your using used use work worked working including years year experience team teams
+""".split())
+
+MAX_KEYWORDS = 50
+
+def tokenize(text: str) -> List[str]:
+    return [token.strip(".") for token in TOKEN_PATTERN.findall(text.lower())]
+
+# Token sequence of every spelling -> canonical skill
+ALIASES: Dict[Tuple[str, ...], str] = {
+    tuple(tokenize(alias)): skill
+    for skill, aliases in SKILL_ALIASES.items()
+    for alias in aliases
+}
+MAX_ALIAS_WORDS = max(len(alias) for alias in ALIASES)
+
+def normalize_skill(value: str) -> str:
+    """Canonical name of a skill as typed by a user, or the cleaned value if it is not a known skill"""
+    words = tuple(tokenize(value))
+    return ALIASES.get(words, " ".join(words))
+
+def analyze_resume_text(text: str) -> Dict[str, Any]:
+    """
+    Find the known skills and the most frequent keywords in a resume
+    Args:
+        text: Extracted resume text
+    Returns:
+        Sorted `skills` and the `keywords` ordered by frequency, both normalised,
+        and the distinct `terms` in order of first use for full-text search
+    """
+    tokens = tokenize(text)
+    skills = set()
+    # Longest alias first at each position, so "google cloud" wins over "google"
+    for start in range(len(tokens)):
+        for length in range(min(MAX_ALIAS_WORDS, len(tokens) - start), 0, -1):
+            skill = ALIASES.get(tuple(tokens[start:start + length]))
+            if skill is not None:
+                skills.add(skill)
+                break
+
+    counts = Counter(
+        token for token in tokens
+        if len(token) > 2 and token not in STOPWORDS and any(char.isalpha() for char in token)
+    )
+    return {
+        "skills": sorted(skills),
+        "keywords": [keyword for keyword, _ in counts.most_common(MAX_KEYWORDS)],
+        "terms": " ".join(dict.fromkeys(token for token in tokens if token)),
+    }
@@ -0,0 +1,165 @@
+# Path: app/utils/streaming.py
+# Description: Incremental parsing of NDJSON and CSV request bodies and uploads, and streamed downloads.
+
+import asyncio
+import csv
+import hashlib
+from typing import Any, AsyncIterator, BinaryIO, Dict, List, Optional, Tuple
+
+# Refuse records larger than this instead of buffering them without bound
+MAX_RECORD_BYTES = 1024 * 1024
+
+async def iter_lines(stream: AsyncIterator[bytes], max_line_bytes: int = MAX_RECORD_BYTES) -> AsyncIterator[bytes]:
+    """
+    Split a byte stream into lines without reading it all into memory
+    Args:
+        stream: Async iterator of body chunks
+        max_line_bytes: Maximum size of a single line
+    Returns:
+        Async iterator of lines, without their trailing newline
+    """
+    buffer = b""
+    async for chunk in stream:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            yield line.rstrip(b"\r")
+        if len(buffer) > max_line_bytes:
+            raise ValueError(f"Line exceeds {max_line_bytes} bytes")
+    if buffer:
+        yield buffer.rstrip(b"\r")
+
+
+class UploadTooLargeError(ValueError):
+    """Raised while reading an upload once it goes over its size limit"""
+
+
+class HashingReader:
+    """
+    Read-only file wrapper that hashes and counts the bytes as they pass
+    through, and fails once more than `max_bytes` have been read
+    """
+
+    def __init__(self, file: BinaryIO, max_bytes: int):
+        self.file = file
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._sha256 = hashlib.sha256()
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self.file.read(size)
+        self.size += len(chunk)
+        if self.size > self.max_bytes:
+            raise UploadTooLargeError(f"The file exceeds {self.max_bytes} bytes")
+        self._sha256.update(chunk)
+        return chunk
+
+    @property
+    def sha256(self) -> str:
+        return self._sha256.hexdigest()
+
+
+async def iter_upload(file, chunk_size: int = 64 * 1024) -> AsyncIterator[bytes]:
+    """Read an uploaded file in chunks, for the parsers below"""
+    while chunk := await file.read(chunk_size):
+        yield chunk
+
+async def iter_ndjson_records(stream: AsyncIterator[bytes]) -> AsyncIterator[Tuple[int, bytes]]:
+    """
+    Iterate over the non-blank lines of an NDJSON body
+    Returns:
+        Async iterator of `(line_number, raw_json)` pairs
+    """
+    line_number = 0
+    async for line in iter_lines(stream):
+        line_number += 1
+        if line.strip():
+            yield line_number, line
+
+async def iter_csv_records(stream: AsyncIterator[bytes]) -> AsyncIterator[Tuple[int, Dict[str, str]]]:
+    """
+    Iterate over the records of a CSV body whose first row is the header
+    Returns:
+        Async iterator of `(line_number, record)` pairs, where line_number is the
+        line the record starts on
+    """
+    header: List[str] = []
+    pending: List[str] = []
+    quotes = 0
+    start_line = line_number = 0
+    async for line in iter_lines(stream):
+        line_number += 1
+        text = line.decode("utf-8")
+        if not pending:
+            start_line = line_number
+        pending.append(text)
+        quotes += text.count('"')
+
+        # An odd number of quotes means a quoted field continues on the next line
+        if quotes % 2:
+            if sum(len(part) for part in pending) > MAX_RECORD_BYTES:
+                raise ValueError(f"Record starting on line {start_line} exceeds {MAX_RECORD_BYTES} bytes")
+            continue
+
+        record = "\n".join(pending)
+        pending, quotes = [], 0
+        if not record.strip():
+            continue
+
+        values = next(csv.reader([record]))
+        if not header:
+            header = [name.strip() for name in values]
+            continue
+        yield start_line, dict(zip(header, values))
+
+    if pending:
+        raise ValueError(f"Unterminated quoted field starting on line {start_line}")
+
+
+def parse_byte_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single-range `Range` header
+    Args:
+        header: The header value, if any
+        size: Size of the resource in bytes
+    Returns:
+        Inclusive `(start, end)` offsets, or None to serve the whole resource
+        (no header, another unit or several ranges)
+    Raises:
+        ValueError: If the range cannot be satisfied
+    """
+    if not header or not header.startswith("bytes=") or "," in header:
+        return None
+    first, _, last = header[len("bytes="):].strip().partition("-")
+    try:
+        if first:
+            start = int(first)
+            end = min(int(last), size - 1) if last else size - 1
+        else:
+            # Suffix range: the last N bytes
+            start = max(size - int(last), 0)
+            end = size - 1
+    except ValueError:
+        return None
+    if start > end or start >= size:
+        raise ValueError(f"Range not satisfiable for {size} bytes")
+    return start, end
+
+async def iter_http_response(response: Any, chunk_size: int = 64 * 1024) -> AsyncIterator[bytes]:
+    """
+    Relay a urllib3 response, such as a MinIO object, chunk by chunk
+    Args:
+        response: Response opened with preload_content=False
+        chunk_size: Bytes read per chunk
+    Returns:
+        Async iterator of chunks; the connection is returned to the pool as
+        soon as the body ends or the client goes away
+    """
+    chunks = response.stream(chunk_size)
+    try:
+        # Reads block, so each one runs in a thread
+        while chunk := await asyncio.to_thread(next, chunks, b""):
+            yield chunk
+    finally:
+        response.close()
+        response.release_conn()
@@ -0,0 +1,88 @@
+# Path: benchmarks/task_ws_fanout.py
+# Description: Fan-out benchmark for the task updates websocket hub with thousands of simulated subscribers.
+#
+# Usage: poetry run python -m benchmarks.task_ws_fanout --subscribers 5000 --messages 500
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from app.utils.fanout import FanoutHub, RESYNC
+
+
+async def run(subscribers: int, messages: int, interval: float, queue_size: int) -> None:
+    hub = FanoutHub(max_queue_size=queue_size)
+    sent_at = [0.0] * messages
+    received = [0] * messages
+    completed_at = [0.0] * messages
+    resyncs = 0
+    done = asyncio.Event()
+
+    async def consumer(queue: asyncio.Queue) -> None:
+        nonlocal resyncs
+        while True:
+            message = await queue.get()
+            if message is RESYNC:
+                resyncs += 1
+                continue
+            # Simulated subscribers only need the message id, mirroring a socket send
+            seq = int(message[message.index(":") + 1:message.index(",")])
+            received[seq] += 1
+            if received[seq] == subscribers:
+                completed_at[seq] = time.perf_counter()
+                if seq == messages - 1:
+                    done.set()
+
+    consumers = [asyncio.create_task(consumer(hub.subscribe())) for _ in range(subscribers)]
+    await asyncio.sleep(0)
+
+    payload = {"op": "update", "id": "00000000-0000-0000-0000-000000000000", "version": 0,
+               "status": "in_progress", "priority": "high",
+               "assignee_id": "00000000-0000-0000-0000-000000000000"}
+    start = time.perf_counter()
+    for seq in range(messages):
+        message = json.dumps({"seq": seq, **payload}, separators=(",", ":"))
+        sent_at[seq] = time.perf_counter()
+        hub.publish(message)
+        await asyncio.sleep(interval)
+
+    try:
+        await asyncio.wait_for(done.wait(), timeout=60)
+    except asyncio.TimeoutError:
+        pass
+    elapsed = time.perf_counter() - start
+
+    for task in consumers:
+        task.cancel()
+
+    latencies = [
+        (completed_at[seq] - sent_at[seq]) * 1000
+        for seq in range(messages) if completed_at[seq]
+    ]
+    deliveries = sum(received)
+    print(f"subscribers:          {subscribers}")
+    print(f"messages:             {messages}")
+    print(f"deliveries:           {deliveries}")
+    print(f"resyncs:              {resyncs}")
+    print(f"elapsed:              {elapsed:.3f}s")
+    print(f"deliveries/sec:       {deliveries / elapsed:,.0f}")
+    if latencies:
+        latencies.sort()
+        print(f"fan-out latency p50:  {statistics.median(latencies):.2f}ms")
+        print(f"fan-out latency p99:  {latencies[int(len(latencies) * 0.99) - 1]:.2f}ms")
+        print(f"fan-out latency max:  {latencies[-1]:.2f}ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Task updates fan-out benchmark")
+    parser.add_argument("--subscribers", type=int, default=5000)
+    parser.add_argument("--messages", type=int, default=500)
+    parser.add_argument("--interval", type=float, default=0.001, help="Seconds between published messages")
+    parser.add_argument("--queue-size", type=int, default=256)
+    args = parser.parse_args()
+    asyncio.run(run(args.subscribers, args.messages, args.interval, args.queue_size))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+# Path: benchmarks/text_compression.py
+# Description: Storage and read-latency benchmark of compressed resume and chat bodies, plain text versus zlib with and without the shared dictionary.
+#
+# Usage: poetry run python -m benchmarks.text_compression --documents 2000
+
+import argparse
+import random
+import time
+import uuid
+import zlib
+import bson
+from app.config import get_settings
+from app.utils.compression import pack_text, unpack_text
+
+settings = get_settings()
+
+SECTIONS = ["Summary", "Experience", "Education", "Projects", "Skills", "Certifications"]
+TITLES = ["Senior Software Engineer", "Backend Developer", "Data Scientist", "Product Manager", "Frontend Engineer"]
+VERBS = ["Designed", "Developed", "Implemented", "Led", "Migrated", "Optimized", "Automated", "Built", "Maintained"]
+THINGS = [
+    "a microservices architecture on Kubernetes",
+    "the data pipeline ingesting events from Kafka into PostgreSQL",
+    "REST APIs in Python with FastAPI and Django",
+    "CI/CD pipelines with GitHub Actions and Terraform",
+    "a React and TypeScript dashboard for internal stakeholders",
+    "machine learning models for churn prediction with scikit-learn",
+    "monitoring and alerting for production services on AWS",
+]
+RESULTS = ["reducing latency by {n}%", "serving {n}k daily users", "cutting cloud costs by {n}%", "improving reliability to 99.{n}%"]
+SKILLS = ["Python", "Java", "Go", "SQL", "Docker", "Kubernetes", "AWS", "GCP", "React", "PostgreSQL", "MongoDB", "Redis", "Kafka", "Spark"]
+CHAT = [
+    "I have created the task \"{title}\" and assigned it to {name} with {priority} priority.",
+    "Here are the tasks currently in review: {title}, {title2} and {title3}.",
+    "Sure, I can help with that. {name} has experience with {skill} and {skill2}, so they would be a good fit for \"{title}\".",
+    "Could you please move the task \"{title}\" to done and assign the follow-up to {name}?",
+]
+NAMES = ["Alice Chen", "Bob Martinez", "Carol Singh", "David Okafor", "Eve Novak", "Frank Müller"]
+
+
+def make_resume(rng: random.Random) -> str:
+    lines = [rng.choice(NAMES), rng.choice(TITLES), f"{uuid.uuid4().hex[:8]}@example.com"]
+    for section in SECTIONS:
+        lines.append(section)
+        for _ in range(rng.randint(3, 9)):
+            result = rng.choice(RESULTS).format(n=rng.randint(10, 90))
+            lines.append(f"- {rng.choice(VERBS)} {rng.choice(THINGS)}, {result}.")
+        if section == "Experience":
+            lines.append(f"{rng.choice(TITLES)} at Company {rng.randint(1, 500)}, {rng.randint(2015, 2020)} - present")
+    lines.append(", ".join(rng.sample(SKILLS, 8)))
+    return "\n".join(lines)
+
+
+def make_message(rng: random.Random) -> str:
+    parts = [
+        rng.choice(CHAT).format(
+            title=f"Task {rng.randint(1, 999)}",
+            title2=f"Task {rng.randint(1, 999)}",
+            title3=f"Task {rng.randint(1, 999)}",
+            name=rng.choice(NAMES),
+            skill=rng.choice(SKILLS),
+            skill2=rng.choice(SKILLS),
+            priority=rng.choice(["high", "medium", "low"]),
+        )
+        for _ in range(rng.randint(1, 12))
+    ]
+    return " ".join(parts)
+
+
+def plain_zlib(text: str) -> dict:
+    # Same threshold as pack_text, without the dictionary
+    raw = text.encode("utf-8")
+    packed = zlib.compress(raw, settings.TEXT_COMPRESSION_LEVEL)
+    if len(raw) < settings.TEXT_COMPRESSION_MIN_BYTES or len(packed) >= len(raw):
+        return {"text": text}
+    return {"text_z": packed}
+
+
+def best_of(repeat: int, fn) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def report(label: str, texts, repeat: int) -> None:
+    plain = [bson.encode({"_id": str(i), "text": text}) for i, text in enumerate(texts)]
+    nodict = [bson.encode({"_id": str(i), **plain_zlib(text)}) for i, text in enumerate(texts)]
+    packed = [bson.encode({"_id": str(i), **pack_text("text", text)}) for i, text in enumerate(texts)]
+    compressed = sum(1 for i in range(len(texts)) if len(packed[i]) < len(plain[i]))
+
+    plain_bytes = sum(map(len, plain))
+    nodict_bytes = sum(map(len, nodict))
+    packed_bytes = sum(map(len, packed))
+    print(f"{label}: {len(texts):,} documents, {compressed:,} above the {settings.TEXT_COMPRESSION_MIN_BYTES} byte threshold")
+    print(f"  {'plain':<22} {plain_bytes:>12,} bytes")
+    print(f"  {'zlib':<22} {nodict_bytes:>12,} bytes  ({1 - nodict_bytes / plain_bytes:.0%} saved)")
+    print(f"  {'zlib + dictionary':<22} {packed_bytes:>12,} bytes  ({1 - packed_bytes / plain_bytes:.0%} saved)")
+
+    # A read is the BSON decode the driver does anyway, plus the body when
+    # the caller needs it; projections that skip the body skip both
+    plain_read = best_of(repeat, lambda: [bson.decode(doc)["text"] for doc in plain])
+    packed_read = best_of(repeat, lambda: [unpack_text(bson.decode(doc), "text") for doc in packed])
+    packed_skip = best_of(repeat, lambda: [bson.decode(doc)["_id"] for doc in packed])
+    count = len(texts)
+    print(f"  {'read plain':<22} {plain_read / count * 1e6:>10.1f} us/doc")
+    print(f"  {'read + decompress':<22} {packed_read / count * 1e6:>10.1f} us/doc  (+{(packed_read - plain_read) / count * 1e6:.1f} us)")
+    print(f"  {'read, body not needed':<22} {packed_skip / count * 1e6:>10.1f} us/doc")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compressed text storage benchmark")
+    parser.add_argument("--documents", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    resumes = [make_resume(rng) for _ in range(args.documents)]
+    messages = [make_message(rng) for _ in range(args.documents)]
+
+    for text in resumes + messages:
+        assert unpack_text(pack_text("text", text), "text") == text
+
+    report("resume text", resumes, args.repeat)
+    report("chat messages", messages, args.repeat)
+
+
+if __name__ == "__main__":
+    main()